@@ -1,63 +1,6415 @@
 # Imports
+import abc
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import inspect
+import itertools
+import json
+import io
+import mimetypes
+import mmap
 import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
 
-from openai import AssistantEventHandler, OpenAI
-from openai.types import beta as Beta_Types
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import httpx
+from openai import (
+    APIConnectionError, APIStatusError, AssistantEventHandler, AsyncAssistantEventHandler, AsyncOpenAI, BadRequestError,
+    DefaultAsyncHttpxClient, DefaultHttpxClient, NotFoundError, OpenAI
+)
+from openai.types import FileObject, beta as Beta_Types
 from openai.types.beta import AssistantStreamEvent
 from openai.types.beta.threads import Message, Text, TextDelta, Run
 from openai.types.beta.threads.runs import ToolCall, ToolCallDelta
 from typing_extensions import override
 
 """
-Vector Storage
+Metrics
+"""
+
+# Metrics Constants
+DEFAULT_METRICS_NAMESPACE = "openai_assistant"
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+API_PATH_ID_PATTERN = re.compile(r"/(?:(?:asst|vs|vsfb|thread|run|msg|step|batch|upload|part|call)_|file-)[A-Za-z0-9]+(?=/|$)")
+API_REQUEST_STARTED_AT = "openai_assistant_started_at" # The httpx request extension holding the start time of a request
+
+# Metrics Recorder Base Class
+class Metrics_Recorder(abc.ABC):
+    """
+    Metrics Recorder Base Class
+
+    Receives the spans, timings, values and counters emitted by this module. The default recorder, Null_Metrics_Recorder, discards everything,
+    so instrumentation costs a single attribute check while metrics are disabled.
+    Subclass this class and implement Record_Timing, Record_Value and Increment to add a new metrics backend, and set enabled to True.
+    Span is built on Record_Timing, override it to also emit traces.
+
+    Attributes are dictionaries of string labels. Every metric is always emitted with the same attribute keys.
+
+    Properties:
+        enabled (bool): Whether the recorder records anything. Hot paths skip their instrumentation when it is False.
+
+    Methods:
+        Span(name:str, attributes:dict|None=None) -> ContextManager
+        Record_Timing(name:str, seconds:float, attributes:dict|None=None) -> None
+        Record_Value(name:str, value:float, attributes:dict|None=None) -> None
+        Increment(name:str, amount:float=1, attributes:dict|None=None) -> None
+    """
+
+    enabled:bool = False
+    """Whether the recorder records anything."""
+
+    def Span(self, name:str, attributes:dict|None=None) -> contextlib.AbstractContextManager:
+        """
+        Returns a context manager that times the enclosed block and records it with Record_Timing.
+
+        Parameters:
+            name (str): The name of the span, for example "vector_store.upload_file".
+            attributes (dict): The labels of the span.
+
+        Returns:
+            span (ContextManager): The span.
+        """
+
+        # Skip the timing while disabled
+        if not self.enabled:
+            return contextlib.nullcontext()
+
+        return self.__Timed_Span(name, attributes)
+    # End of Span
+
+    @contextlib.contextmanager
+    def __Timed_Span(self, name:str, attributes:dict|None):
+        """
+        Internal generator that times a span.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield None
+        finally:
+            self.Record_Timing(name, time.perf_counter() - started_at, attributes)
+    # End of __Timed_Span
+
+    @abc.abstractmethod
+    def Record_Timing(self, name:str, seconds:float, attributes:dict|None=None) -> None:
+        """
+        Records a duration in seconds.
+        """
+    # End of Record_Timing
+
+    @abc.abstractmethod
+    def Record_Value(self, name:str, value:float, attributes:dict|None=None) -> None:
+        """
+        Records a measured value, for example a rate.
+        """
+    # End of Record_Value
+
+    @abc.abstractmethod
+    def Increment(self, name:str, amount:float=1, attributes:dict|None=None) -> None:
+        """
+        Increments a counter.
+        """
+    # End of Increment
+# End of Metrics_Recorder Class
+
+# Null Metrics Recorder Class
+class Null_Metrics_Recorder(Metrics_Recorder):
+    """
+    Null Metrics Recorder Class
+
+    The default recorder. It is disabled and discards everything it receives.
+    """
+
+    def Record_Timing(self, name:str, seconds:float, attributes:dict|None=None) -> None:
+        pass
+    # End of Record_Timing
+
+    def Record_Value(self, name:str, value:float, attributes:dict|None=None) -> None:
+        pass
+    # End of Record_Value
+
+    def Increment(self, name:str, amount:float=1, attributes:dict|None=None) -> None:
+        pass
+    # End of Increment
+# End of Null_Metrics_Recorder Class
+
+# Prometheus Metrics Recorder Class
+class Prometheus_Metrics_Recorder(Metrics_Recorder):
+    """
+    Prometheus Metrics Recorder Class
+
+    Records timings and values as prometheus_client histograms and counters as prometheus_client counters.
+    Metric names are prefixed with the namespace and have their dots replaced by underscores, timings get a "_seconds" suffix.
+    Requires the prometheus_client package.
+
+    Properties:
+        registry (CollectorRegistry): The registry the metrics are registered in.
+        namespace (str): The prefix of every metric name.
+        buckets (tuple[float]): The histogram buckets of timings.
+    """
+
+    enabled:bool = True
+
+    def __init__(self, registry=None, namespace:str|None=None, buckets:tuple[float]|None=None):
+        """
+        Constructor for the Prometheus_Metrics_Recorder class.
+
+        Parameters:
+            registry (CollectorRegistry): The registry to register the metrics in.
+                Defaults to the prometheus_client default registry.
+            namespace (str): The prefix of every metric name.
+                Defaults to "openai_assistant".
+            buckets (tuple[float]): The histogram buckets of timings, in seconds.
+                Defaults to DEFAULT_LATENCY_BUCKETS.
+        """
+
+        # Import the optional dependency
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError("Prometheus_Metrics_Recorder requires the prometheus_client package.") from e
+
+        # Handle Defaults
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        if namespace is None:
+            namespace = DEFAULT_METRICS_NAMESPACE
+        if buckets is None:
+            buckets = DEFAULT_LATENCY_BUCKETS
+
+        # Set properties
+        self.registry = registry
+        self.namespace = namespace
+        self.buckets = buckets
+        self.__prometheus = prometheus_client
+        self.__metrics = {}
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def __Get_Metric(self, metric_type:str, name:str, attributes:dict|None):
+        """
+        Internal method that returns the labelled metric of the given type and name, registering it on first use.
+        """
+
+        # Variable initialization
+        attributes = attributes or {}
+        metric_name = f"{self.namespace}_{name.replace('.', '_')}" + ("_seconds" if metric_type == "timing" else "")
+
+        # Register the metric on first use
+        with self.__lock:
+            metric = self.__metrics.get(metric_name)
+            if metric is None:
+                if metric_type == "counter":
+                    metric = self.__prometheus.Counter(metric_name, name, labelnames=sorted(attributes), registry=self.registry)
+                elif metric_type == "timing":
+                    metric = self.__prometheus.Histogram(metric_name, name, labelnames=sorted(attributes), registry=self.registry, buckets=self.buckets)
+                else:
+                    metric = self.__prometheus.Histogram(metric_name, name, labelnames=sorted(attributes), registry=self.registry)
+                self.__metrics[metric_name] = metric
+
+        # Return the labelled metric
+        if len(attributes) == 0:
+            return metric
+        return metric.labels(**{key: str(value) for key, value in attributes.items()})
+    # End of __Get_Metric
+
+    def Record_Timing(self, name:str, seconds:float, attributes:dict|None=None) -> None:
+        self.__Get_Metric("timing", name, attributes).observe(seconds)
+    # End of Record_Timing
+
+    def Record_Value(self, name:str, value:float, attributes:dict|None=None) -> None:
+        self.__Get_Metric("value", name, attributes).observe(value)
+    # End of Record_Value
+
+    def Increment(self, name:str, amount:float=1, attributes:dict|None=None) -> None:
+        self.__Get_Metric("counter", name, attributes).inc(amount)
+    # End of Increment
+# End of Prometheus_Metrics_Recorder Class
+
+# OpenTelemetry Metrics Recorder Class
+class OpenTelemetry_Metrics_Recorder(Metrics_Recorder):
+    """
+    OpenTelemetry Metrics Recorder Class
+
+    Emits spans as OpenTelemetry spans, records timings and values as histograms and counters as counters.
+    Requires the opentelemetry-api package, exporters are configured through the OpenTelemetry SDK as usual.
+
+    Properties:
+        tracer (Tracer): The tracer spans are started on.
+        meter (Meter): The meter instruments are created on.
+    """
+
+    enabled:bool = True
+
+    def __init__(self, tracer=None, meter=None):
+        """
+        Constructor for the OpenTelemetry_Metrics_Recorder class.
+
+        Parameters:
+            tracer (Tracer): The tracer to start spans on.
+                Defaults to the tracer named "openai_assistant" of the global tracer provider.
+            meter (Meter): The meter to create instruments on.
+                Defaults to the meter named "openai_assistant" of the global meter provider.
+        """
+
+        # Import the optional dependency
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetry_Metrics_Recorder requires the opentelemetry-api package.") from e
+
+        # Handle Defaults
+        if tracer is None:
+            tracer = trace.get_tracer(DEFAULT_METRICS_NAMESPACE)
+        if meter is None:
+            meter = metrics.get_meter(DEFAULT_METRICS_NAMESPACE)
+
+        # Set properties
+        self.tracer = tracer
+        self.meter = meter
+        self.__instruments = {}
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def __Get_Instrument(self, metric_type:str, name:str):
+        """
+        Internal method that returns the instrument of the given type and name, creating it on first use.
+        """
+        with self.__lock:
+            instrument = self.__instruments.get((metric_type, name))
+            if instrument is None:
+                if metric_type == "counter":
+                    instrument = self.meter.create_counter(name)
+                elif metric_type == "timing":
+                    instrument = self.meter.create_histogram(name, unit="s")
+                else:
+                    instrument = self.meter.create_histogram(name)
+                self.__instruments[(metric_type, name)] = instrument
+            return instrument
+    # End of __Get_Instrument
+
+    @contextlib.contextmanager
+    def Span(self, name:str, attributes:dict|None=None):
+        started_at = time.perf_counter()
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            try:
+                yield span
+            finally:
+                self.Record_Timing(name, time.perf_counter() - started_at, attributes)
+    # End of Span
+
+    def Record_Timing(self, name:str, seconds:float, attributes:dict|None=None) -> None:
+        self.__Get_Instrument("timing", name).record(seconds, attributes=attributes)
+    # End of Record_Timing
+
+    def Record_Value(self, name:str, value:float, attributes:dict|None=None) -> None:
+        self.__Get_Instrument("value", name).record(value, attributes=attributes)
+    # End of Record_Value
+
+    def Increment(self, name:str, amount:float=1, attributes:dict|None=None) -> None:
+        self.__Get_Instrument("counter", name).add(amount, attributes=attributes)
+    # End of Increment
+# End of OpenTelemetry_Metrics_Recorder Class
+
+# The recorder every instrumented call reports to
+metrics_recorder:Metrics_Recorder = Null_Metrics_Recorder()
+
+def Set_Metrics_Recorder(recorder:Metrics_Recorder|None) -> None:
+    """
+    Sets the metrics recorder every instrumented call of this module reports to. Pass None to disable metrics again.
+
+    Parameters:
+        recorder (Metrics_Recorder): The metrics recorder.
+
+    Returns:
+        None
+    """
+    global metrics_recorder
+    metrics_recorder = recorder if recorder is not None else Null_Metrics_Recorder()
+# Function End
+
+def Get_Metrics_Recorder() -> Metrics_Recorder:
+    """
+    Returns the metrics recorder every instrumented call of this module reports to.
+    """
+    return metrics_recorder
+# Function End
+
+def Get_Instrumentation_Hooks(asynchronous:bool|None=None) -> dict[str, list[Callable]]:
+    """
+    Returns httpx event hooks that time every API request of the HTTP client they are passed to. Each request is recorded as an "api.request"
+    timing, measured up to the response headers, and an "api.requests" count, labelled with the HTTP method, the endpoint
+    (with IDs replaced by "{id}") and the status code. The hooks look the recorder up on every request, so they can be installed
+    before Set_Metrics_Recorder is called. Create_Client installs them when instrument is True.
+
+    Parameters:
+        asynchronous (bool): Returns coroutine hooks for an httpx.AsyncClient.
+            Defaults to False.
+
+    Returns:
+        event_hooks (dict[str, list[Callable]]): The "request" and "response" event hooks.
+    """
+
+    # Handle Defaults
+    if asynchronous is None:
+        asynchronous = False
+
+    # Stamp the start time of the request
+    def Start_Request(request) -> None:
+        request.extensions[API_REQUEST_STARTED_AT] = time.perf_counter()
+    # Function End
+
+    # Record the request once its response headers arrive
+    def End_Request(response) -> None:
+        recorder = Get_Metrics_Recorder()
+        started_at = response.request.extensions.get(API_REQUEST_STARTED_AT)
+        if (not recorder.enabled) or (started_at is None):
+            return None
+        attributes = {
+            "method": response.request.method,
+            "endpoint": API_PATH_ID_PATTERN.sub("/{id}", response.request.url.path),
+            "status": str(response.status_code)
+        }
+        recorder.Record_Timing("api.request", time.perf_counter() - started_at, attributes)
+        recorder.Increment("api.requests", 1, attributes)
+    # Function End
+
+    # Asynchronous clients require coroutine hooks
+    if asynchronous:
+        async def Start_Request_Async(request) -> None:
+            Start_Request(request)
+        async def End_Request_Async(response) -> None:
+            End_Request(response)
+        return {"request": [Start_Request_Async], "response": [End_Request_Async]}
+    return {"request": [Start_Request], "response": [End_Request]}
+# Function End
+
+def Instrument_Client(client:OpenAI|AsyncOpenAI) -> OpenAI|AsyncOpenAI:
+    """
+    Returns a copy of the client whose API requests are timed by the hooks of Get_Instrumentation_Hooks, sent over a default HTTP transport.
+    To keep the connection pools and scheduler of Create_Client, pass instrument=True to Create_Client or Get_Shared_Client instead.
+
+    Parameters:
+        client (OpenAI|AsyncOpenAI): The client to instrument.
+
+    Returns:
+        client (OpenAI|AsyncOpenAI): The instrumented copy of the client.
+    """
+    if isinstance(client, AsyncOpenAI):
+        http_client = DefaultAsyncHttpxClient(event_hooks=Get_Instrumentation_Hooks(asynchronous=True))
+    else:
+        http_client = DefaultHttpxClient(event_hooks=Get_Instrumentation_Hooks(asynchronous=False))
+    return client.copy(http_client=http_client)
+# Function End
+
+# Stream Timer Class
+class Stream_Timer:
+    """
+    Stream Timer Class
+
+    Records the timings of a run stream from the events it receives: "stream.time_to_first_token", "stream.duration",
+    "stream.tokens_per_second" and the "tokens.prompt" and "tokens.completion" counters, all labelled with the stream phase.
+    Streams continuing a run after tool outputs were submitted also record "tool.turnaround", the time from the requires_action
+    event to their first event, with the same phase label.
+
+    Properties:
+        phase (str): The phase of the run the stream belongs to, "run" or "tool outputs".
+        started_at (float): The time.perf_counter() time the stream was requested at.
+        required_action_at (float|None): The time the last requires_action event was received at.
+    """
+
+    def __init__(self, phase:str|None=None, started_at:float|None=None):
+        """
+        Constructor for the Stream_Timer class.
+
+        Parameters:
+            phase (str): The phase of the run the stream belongs to.
+                Defaults to "run".
+            started_at (float): The time.perf_counter() time the stream was requested at.
+                Defaults to now.
+        """
+
+        # Handle Defaults
+        if phase is None:
+            phase = "run"
+        if started_at is None:
+            started_at = time.perf_counter()
+
+        # Set properties
+        self.phase = phase
+        self.started_at = started_at
+        self.required_action_at = None
+        self.__first_event_at = None
+        self.__first_token_at = None
+    # End of Constructor
+
+    def Record(self, event:AssistantStreamEvent) -> None:
+        """
+        Records the timings of a stream event. Does nothing while metrics are disabled.
+
+        Parameters:
+            event (AssistantStreamEvent): The stream event.
+
+        Returns:
+            None
+        """
+
+        # Skip while disabled
+        recorder = Get_Metrics_Recorder()
+        if not recorder.enabled:
+            return None
+
+        # Variable initialization
+        now = time.perf_counter()
+        attributes = {"phase": self.phase}
+
+        # Tool call turnaround
+        if self.__first_event_at is None:
+            self.__first_event_at = now
+            if self.phase == "tool outputs":
+                recorder.Record_Timing("tool.turnaround", now - self.started_at, attributes)
+
+        # Time to first token
+        if (event.event == "thread.message.delta") and (self.__first_token_at is None):
+            self.__first_token_at = now
+            recorder.Record_Timing("stream.time_to_first_token", now - self.started_at, attributes)
+
+        # Start of tool calls
+        elif event.event == "thread.run.requires_action":
+            self.required_action_at = now
+
+        # Stream duration, token usage and throughput
+        elif event.event in TERMINAL_RUN_EVENTS:
+            recorder.Record_Timing("stream.duration", now - self.started_at, attributes)
+            usage = event.data.usage
+            if usage is not None:
+                recorder.Increment("tokens.prompt", usage.prompt_tokens, attributes)
+                recorder.Increment("tokens.completion", usage.completion_tokens, attributes)
+                if (self.__first_token_at is not None) and (now > self.__first_token_at):
+                    recorder.Record_Value("stream.tokens_per_second", usage.completion_tokens / (now - self.__first_token_at), attributes)
+    # End of Record
+# End of Stream_Timer Class
+
+"""
+Request Scheduler
+"""
+
+# Request Scheduler Constants
+REQUEST_PRIORITY_ENUM = ["interactive", "bulk"]
+DEFAULT_REQUEST_PRIORITY = "interactive"
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_BACKOFF = 0.5 # Seconds
+DEFAULT_MAX_BACKOFF = 30 # Seconds
+DEFAULT_BULK_RESERVE = 0.2 # Fraction of every limit kept for interactive requests
+RETRY_STATUS_CODES = [408, 409, 429, 500, 502, 503, 504]
+UNPROCESSED_STATUS_CODES = [408, 429] # Retried for every request, the server did not act on them
+IDEMPOTENT_METHODS = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+RATE_LIMIT_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+RATE_LIMIT_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+# The priority of the requests made in the current context
+request_priority:contextvars.ContextVar = contextvars.ContextVar("request_priority", default=DEFAULT_REQUEST_PRIORITY)
+
+@contextlib.contextmanager
+def Request_Priority(priority:str):
+    """
+    Sets the priority of the requests made inside the block, for example "bulk" around ingestion work.
+    Work submitted to a thread pool inside the block keeps the priority if it is submitted with contextvars.copy_context().run.
+
+    Parameters:
+        priority (str): The priority of the requests. Can be "interactive" or "bulk".
+    """
+    token = request_priority.set(priority if priority in REQUEST_PRIORITY_ENUM else DEFAULT_REQUEST_PRIORITY)
+    try:
+        yield None
+    finally:
+        request_priority.reset(token)
+# Function End
+
+# Token Bucket Class
+class Token_Bucket:
+    """
+    Token Bucket Class
+
+    A thread safe token bucket. An unconfigured bucket (capacity None) never limits until it learns a limit from the rate limit headers.
+
+    Properties:
+        capacity (float|None): The maximum number of tokens in the bucket.
+        refill_rate (float|None): The tokens added to the bucket every second.
+        level (float): The tokens currently in the bucket.
+
+    Methods:
+        Try_Acquire(amount:float, reserve:float=0) -> float
+        Release(amount:float) -> None
+        Update(limit:float, remaining:float, reset:float|None=None) -> None
+    """
+
+    def __init__(self, capacity:float|None=None, refill_rate:float|None=None):
+        """
+        Constructor for the Token_Bucket class.
+
+        Parameters:
+            capacity (float): The maximum number of tokens in the bucket.
+                Defaults to None, no limit.
+            refill_rate (float): The tokens added to the bucket every second.
+                Defaults to a full refill every minute.
+        """
+
+        # Handle Defaults
+        if (capacity is not None) and (refill_rate is None):
+            refill_rate = capacity / 60
+
+        # Set properties
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.level = capacity if capacity is not None else 0
+        self.__updated_at = time.monotonic()
+        self.__blocked_until = 0
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def __Refill(self) -> None:
+        """
+        Internal method that adds the tokens accumulated since the last refill. Must be called with the lock held.
+        """
+        now = time.monotonic()
+        if self.capacity is not None:
+            self.level = min(self.capacity, self.level + (now - self.__updated_at) * self.refill_rate)
+        self.__updated_at = now
+    # End of __Refill
+
+    def Try_Acquire(self, amount:float, reserve:float=0) -> float:
+        """
+        Takes the given amount of tokens if the bucket holds them on top of the reserve.
+
+        Parameters:
+            amount (float): The tokens to take.
+            reserve (float): The fraction of the capacity that must stay in the bucket.
+
+        Returns:
+            wait (float): 0 if the tokens were taken, otherwise the estimated seconds until they are available.
+        """
+        with self.__lock:
+            # Unlimited buckets
+            if self.capacity is None:
+                return 0
+
+            # Wait out an exhausted limit
+            self.__Refill()
+            if self.__updated_at < self.__blocked_until:
+                return self.__blocked_until - self.__updated_at
+
+            # Take the tokens if available
+            amount = min(amount, self.capacity * (1 - reserve))
+            missing = amount + self.capacity * reserve - self.level
+            if missing <= 0:
+                self.level -= amount
+                return 0
+
+            # Estimate the wait
+            return missing / self.refill_rate if self.refill_rate > 0 else 1
+    # End of Try_Acquire
+
+    def Release(self, amount:float) -> None:
+        """
+        Returns tokens taken by Try_Acquire that were not used.
+        """
+        with self.__lock:
+            if self.capacity is not None:
+                self.level = min(self.capacity, self.level + amount)
+    # End of Release
+
+    def Update(self, limit:float, remaining:float, reset:float|None=None) -> None:
+        """
+        Updates the bucket from the limit, remaining count and reset time reported by the API.
+
+        Parameters:
+            limit (float): The limit reported by the API.
+            remaining (float): The remaining count reported by the API.
+            reset (float): The seconds until the limit is fully reset.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            # Learn or tighten the limit
+            self.__Refill()
+            if self.capacity is None:
+                self.capacity = limit
+                self.refill_rate = limit / 60
+                self.level = remaining
+            elif limit < self.capacity:
+                self.capacity = limit
+                self.refill_rate = limit / 60
+            self.level = min(self.level, remaining)
+
+            # Block until an exhausted limit resets
+            if (remaining < 1) and (reset is not None):
+                self.__blocked_until = self.__updated_at + reset
+    # End of Update
+# End of Token_Bucket Class
+
+# Request Scheduler Class
+class Request_Scheduler:
+    """
+    Request Scheduler Class
+
+    Schedules the requests of one or more OpenAI clients sharing an API key. Requests wait for client side token buckets
+    of requests and tokens, which are tightened by the x-ratelimit response headers. Rate limited (429, 408) failures are retried
+    with jittered exponential backoff, honoring retry-after headers. Transient (409, 5xx and connection) failures are only retried
+    for idempotent requests, since the server may already have acted on the others.
+    Bulk requests (see Request_Priority) leave a reserve of every limit to interactive requests and wait while interactive requests are waiting.
+
+    Properties:
+        request_bucket (Token_Bucket): The bucket of requests.
+        token_bucket (Token_Bucket): The bucket of tokens, a run takes its max_prompt_tokens plus max_completion_tokens.
+        max_retries (int): The maximum number of retries of a request.
+        base_backoff (float): The backoff of the first retry, in seconds.
+        max_backoff (float): The maximum backoff, in seconds.
+        bulk_reserve (float): The fraction of every limit bulk requests leave to interactive requests.
+
+    Methods:
+        Attach(client:OpenAI|AsyncOpenAI) -> OpenAI|AsyncOpenAI
+        Try_Acquire(priority:str, tokens:float) -> float
+        Add_Waiter(priority:str) -> None
+        Release_Waiter(priority:str) -> None
+        Update_From_Headers(headers:httpx.Headers) -> None
+        Should_Retry(attempt:int, response:httpx.Response|None, request:httpx.Request|None=None) -> bool
+        Is_Idempotent(request:httpx.Request) -> bool [static]
+        Get_Retry_Delay(attempt:int, response:httpx.Response|None) -> float
+        Parse_Duration(duration:str|None) -> float|None [static]
+        Estimate_Tokens(request:httpx.Request) -> float [static]
+        Get_Statistics() -> dict
+    """
+
+    def __init__(
+            self, requests_per_minute:float|None=None, tokens_per_minute:float|None=None, max_retries:int|None=None,
+            base_backoff:float|None=None, max_backoff:float|None=None, bulk_reserve:float|None=None
+        ):
+        """
+        Constructor for the Request_Scheduler class.
+
+        Parameters:
+            requests_per_minute (float): The client side limit of requests per minute.
+                Defaults to None, learned from the rate limit headers.
+            tokens_per_minute (float): The client side limit of tokens per minute.
+                Defaults to None, learned from the rate limit headers.
+            max_retries (int): The maximum number of retries of a request.
+                Defaults to 5.
+            base_backoff (float): The backoff of the first retry, in seconds.
+                Defaults to 0.5.
+            max_backoff (float): The maximum backoff, in seconds.
+                Defaults to 30.
+            bulk_reserve (float): The fraction of every limit bulk requests leave to interactive requests.
+                Defaults to 0.2.
+        """
+
+        # Handle Defaults
+        if max_retries is None:
+            max_retries = DEFAULT_MAX_RETRIES
+        if base_backoff is None:
+            base_backoff = DEFAULT_BASE_BACKOFF
+        if max_backoff is None:
+            max_backoff = DEFAULT_MAX_BACKOFF
+        if bulk_reserve is None:
+            bulk_reserve = DEFAULT_BULK_RESERVE
+
+        # Set properties
+        self.request_bucket = Token_Bucket(requests_per_minute)
+        self.token_bucket = Token_Bucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.bulk_reserve = bulk_reserve
+        self.__waiting_interactive = 0
+        self.__statistics = {"requests": 0, "retries": 0, "throttled": 0}
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Attach(self, client:OpenAI|AsyncOpenAI) -> OpenAI|AsyncOpenAI:
+        """
+        Returns a copy of the client that routes every request through the scheduler over a default HTTP transport.
+        The copy's own retries are disabled, the scheduler retries instead. To keep the connection pools of Create_Client,
+        pass the scheduler to Create_Client or Get_Shared_Client instead.
+
+        Parameters:
+            client (OpenAI|AsyncOpenAI): The client to schedule.
+
+        Returns:
+            client (OpenAI|AsyncOpenAI): The scheduled copy of the client.
+        """
+        if isinstance(client, AsyncOpenAI):
+            http_client = DefaultAsyncHttpxClient(transport=AsyncScheduled_Transport(httpx.AsyncHTTPTransport(), self))
+        else:
+            http_client = DefaultHttpxClient(transport=Scheduled_Transport(httpx.HTTPTransport(), self))
+        return client.copy(http_client=http_client, max_retries=0)
+    # End of Attach
+
+    def Try_Acquire(self, priority:str, tokens:float) -> float:
+        """
+        Takes a request and the given tokens from the buckets if they are available to the given priority.
+        A request that has to wait must call Try_Acquire again after the returned delay until it returns 0.
+
+        Parameters:
+            priority (str): The priority of the request.
+            tokens (float): The tokens the request uses.
+
+        Returns:
+            wait (float): 0 if the request may be sent, otherwise the seconds to wait before trying again.
+        """
+
+        # Bulk requests wait for interactive requests
+        reserve = 0
+        if priority == "bulk":
+            reserve = self.bulk_reserve
+            with self.__lock:
+                if self.__waiting_interactive > 0:
+                    return 0.05
+
+        # Take a request, then the tokens
+        wait = self.request_bucket.Try_Acquire(1, reserve)
+        if wait == 0:
+            wait = self.token_bucket.Try_Acquire(tokens, reserve)
+            if wait > 0:
+                self.request_bucket.Release(1)
+
+        # Count the outcome
+        with self.__lock:
+            if wait == 0:
+                self.__statistics["requests"] += 1
+            else:
+                self.__statistics["throttled"] += 1
+        return wait
+    # End of Try_Acquire
+
+    def Add_Waiter(self, priority:str) -> None:
+        """
+        Registers a request waiting for the buckets, so bulk requests yield to it.
+        """
+        if priority != "bulk":
+            with self.__lock:
+                self.__waiting_interactive += 1
+    # End of Add_Waiter
+
+    def Release_Waiter(self, priority:str) -> None:
+        """
+        Unregisters a request registered with Add_Waiter.
+        """
+        if priority != "bulk":
+            with self.__lock:
+                self.__waiting_interactive -= 1
+    # End of Release_Waiter
+
+    @staticmethod
+    def Parse_Duration(duration:str|None) -> float|None:
+        """
+        Parses a rate limit reset duration such as "1s", "6m0s" or "20ms" into seconds.
+        """
+        if not duration:
+            return None
+        matches = RATE_LIMIT_DURATION_PATTERN.findall(duration)
+        if len(matches) == 0:
+            return None
+        return sum(float(value) * RATE_LIMIT_DURATION_UNITS[unit] for value, unit in matches)
+    # End of Parse_Duration
+
+    def Update_From_Headers(self, headers:httpx.Headers) -> None:
+        """
+        Tightens the buckets with the x-ratelimit headers of a response.
+
+        Parameters:
+            headers (httpx.Headers): The headers of a response.
+
+        Returns:
+            None
+        """
+        for bucket, kind in [(self.request_bucket, "requests"), (self.token_bucket, "tokens")]:
+            try:
+                limit = float(headers[f"x-ratelimit-limit-{kind}"])
+                remaining = float(headers[f"x-ratelimit-remaining-{kind}"])
+            except (KeyError, ValueError):
+                continue
+            bucket.Update(limit, remaining, self.Parse_Duration(headers.get(f"x-ratelimit-reset-{kind}")))
+        # Loop End
+    # End of Update_From_Headers
+
+    def Should_Retry(self, attempt:int, response:httpx.Response|None, request:httpx.Request|None=None) -> bool:
+        """
+        Returns whether a request should be retried after its given attempt (counting from 0).
+        A response of None stands for a connection failure. Failures the server may have acted on are only retried
+        when the request is idempotent, a request of None stands for a request that is safe to send again.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if (response is not None) and (response.headers.get("x-should-retry") == "false"):
+            return False
+        if (response is not None) and (response.status_code in UNPROCESSED_STATUS_CODES):
+            return True
+        if (request is not None) and not self.Is_Idempotent(request):
+            return False
+        return (response is None) or (response.status_code in RETRY_STATUS_CODES)
+    # End of Should_Retry
+
+    @staticmethod
+    def Is_Idempotent(request:httpx.Request) -> bool:
+        """
+        Returns whether a request can be sent again without repeating its effect: requests with an idempotent method,
+        or with an Idempotency-Key header, for example passed through extra_headers.
+        """
+        return (request.method in IDEMPOTENT_METHODS) or (IDEMPOTENCY_KEY_HEADER in request.headers)
+    # End of Is_Idempotent
+
+    def Get_Retry_Delay(self, attempt:int, response:httpx.Response|None) -> float:
+        """
+        Returns the jittered exponential backoff of the given attempt (counting from 0), at least the retry-after delay of the response.
+        """
+
+        # Jittered exponential backoff
+        delay = random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+
+        # Honor the retry-after headers
+        if response is not None:
+            retry_after = None
+            try:
+                if "retry-after-ms" in response.headers:
+                    retry_after = float(response.headers["retry-after-ms"]) / 1000
+                elif "retry-after" in response.headers:
+                    retry_after = float(response.headers["retry-after"])
+            except ValueError:
+                retry_after = None
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_backoff))
+
+        with self.__lock:
+            self.__statistics["retries"] += 1
+        return delay
+    # End of Get_Retry_Delay
+
+    @staticmethod
+    def Estimate_Tokens(request:httpx.Request) -> float:
+        """
+        Returns the tokens a request counts against the token limit: the token budgets of runs, and 0 for every other request.
+        """
+        if not request.headers.get("content-type", "").startswith("application/json"):
+            return 0
+        try:
+            body = json.loads(request.content or b"{}")
+        except (httpx.RequestNotRead, ValueError):
+            return 0
+        if not isinstance(body, dict):
+            return 0
+        return (body.get("max_prompt_tokens") or 0) + (body.get("max_completion_tokens") or 0)
+    # End of Estimate_Tokens
+
+    def Get_Statistics(self) -> dict:
+        """
+        Returns the number of requests sent, retried and throttled, and the current levels of the buckets.
+        """
+        with self.__lock:
+            return self.__statistics | {
+                "request level": self.request_bucket.level if self.request_bucket.capacity is not None else None,
+                "token level": self.token_bucket.level if self.token_bucket.capacity is not None else None
+            }
+    # End of Get_Statistics
+# End of Request_Scheduler Class
+
+# Scheduled Transport Class
+class Scheduled_Transport(httpx.BaseTransport):
+    """
+    An httpx transport that sends requests through a Request_Scheduler. Created by Create_Client and Request_Scheduler.Attach.
+    """
+
+    def __init__(self, transport:httpx.BaseTransport, scheduler:Request_Scheduler):
+        self.transport = transport
+        self.scheduler = scheduler
+    # End of Constructor
+
+    def handle_request(self, request:httpx.Request) -> httpx.Response:
+        # Variable initialization
+        priority = request_priority.get()
+        tokens = self.scheduler.Estimate_Tokens(request)
+        attempt = 0
+
+        while True:
+            # Wait for the rate limits
+            wait = self.scheduler.Try_Acquire(priority, tokens)
+            if wait > 0:
+                self.scheduler.Add_Waiter(priority)
+                try:
+                    while wait > 0:
+                        time.sleep(wait)
+                        wait = self.scheduler.Try_Acquire(priority, tokens)
+                finally:
+                    self.scheduler.Release_Waiter(priority)
+
+            # Send the request
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                # A request that could not connect was never sent, so it is safe to send again
+                sent_request = None if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) else request
+                if not self.scheduler.Should_Retry(attempt, None, sent_request):
+                    raise
+                time.sleep(self.scheduler.Get_Retry_Delay(attempt, None))
+                attempt += 1
+                continue
+            self.scheduler.Update_From_Headers(response.headers)
+
+            # Retry rate limited and transient failures
+            if not self.scheduler.Should_Retry(attempt, response, request):
+                return response
+            response.close()
+            time.sleep(self.scheduler.Get_Retry_Delay(attempt, response))
+            attempt += 1
+        # Loop End
+    # End of handle_request
+
+    def close(self) -> None:
+        self.transport.close()
+    # End of close
+# End of Scheduled_Transport Class
+
+# Async Scheduled Transport Class
+class AsyncScheduled_Transport(httpx.AsyncBaseTransport):
+    """
+    The asyncio counterpart of the Scheduled_Transport class.
+    """
+
+    def __init__(self, transport:httpx.AsyncBaseTransport, scheduler:Request_Scheduler):
+        self.transport = transport
+        self.scheduler = scheduler
+    # End of Constructor
+
+    async def handle_async_request(self, request:httpx.Request) -> httpx.Response:
+        # Variable initialization
+        priority = request_priority.get()
+        tokens = self.scheduler.Estimate_Tokens(request)
+        attempt = 0
+
+        while True:
+            # Wait for the rate limits
+            wait = self.scheduler.Try_Acquire(priority, tokens)
+            if wait > 0:
+                self.scheduler.Add_Waiter(priority)
+                try:
+                    while wait > 0:
+                        await asyncio.sleep(wait)
+                        wait = self.scheduler.Try_Acquire(priority, tokens)
+                finally:
+                    self.scheduler.Release_Waiter(priority)
+
+            # Send the request
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                # A request that could not connect was never sent, so it is safe to send again
+                sent_request = None if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) else request
+                if not self.scheduler.Should_Retry(attempt, None, sent_request):
+                    raise
+                await asyncio.sleep(self.scheduler.Get_Retry_Delay(attempt, None))
+                attempt += 1
+                continue
+            self.scheduler.Update_From_Headers(response.headers)
+
+            # Retry rate limited and transient failures
+            if not self.scheduler.Should_Retry(attempt, response, request):
+                return response
+            await response.aclose()
+            await asyncio.sleep(self.scheduler.Get_Retry_Delay(attempt, response))
+            attempt += 1
+        # Loop End
+    # End of handle_async_request
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+    # End of aclose
+# End of AsyncScheduled_Transport Class
+
+"""
+Client Registry
+"""
+
+# Client Registry Constants
+TRAFFIC_CLASS_ENUM = ["control", "stream", "upload"]
+DEFAULT_MAX_CONNECTIONS = {
+    "control": 20,
+    "stream": 50,
+    "upload": 8
+}
+DEFAULT_CLIENT_TIMEOUTS = { # Seconds
+    "control": httpx.Timeout(30.0, connect=5.0, pool=10.0),
+    "stream": httpx.Timeout(120.0, connect=5.0, pool=10.0),
+    "upload": httpx.Timeout(600.0, connect=5.0, pool=60.0)
+}
+DEFAULT_KEEP_ALIVE_EXPIRY = 30 # Seconds
+DEFAULT_CLIENT_NAME = "default"
+DOWNLOAD_PATH_PATTERN = re.compile(r"/files/[^/]+/content$")
+
+def Get_Traffic_Class(request:httpx.Request) -> str:
+    """
+    Returns the traffic class of an API request: "stream" for the requests whose JSON body asks for a streamed response or that accept
+    server-sent events, "upload" for multipart uploads and file content downloads, and "control" for every other request.
+
+    Parameters:
+        request (httpx.Request): The request.
+
+    Returns:
+        traffic_class (str): The traffic class of the request.
+    """
+
+    # Variable initialization
+    content_type = request.headers.get("content-type", "")
+
+    # Streamed responses
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return "stream"
+    if (request.method == "POST") and content_type.startswith("application/json"):
+        try:
+            body = json.loads(request.content or b"{}")
+        except (httpx.RequestNotRead, ValueError):
+            body = None
+        if isinstance(body, dict) and (body.get("stream") is True):
+            return "stream"
+
+    # File transfers
+    if (request.method == "POST") and content_type.startswith("multipart/form-data"):
+        return "upload"
+    if (request.method == "GET") and DOWNLOAD_PATH_PATTERN.search(request.url.path):
+        return "upload"
+    return "control"
+# Function End
+
+# Pooled Transport Class
+class Pooled_Transport(httpx.BaseTransport):
+    """
+    An httpx transport that sends every traffic class through its own connection pool with its own timeouts,
+    so long streams and large uploads cannot take the connections of control plane calls. Created by Create_Client.
+    """
+
+    def __init__(self, transports:dict[str, httpx.BaseTransport], timeouts:dict[str, httpx.Timeout]):
+        self.transports = transports
+        self.timeouts = timeouts
+    # End of Constructor
+
+    def handle_request(self, request:httpx.Request) -> httpx.Response:
+        traffic_class = Get_Traffic_Class(request)
+
+        # Keep the timeout given to a single call, replace the client default
+        if request.extensions.get("timeout") == self.timeouts["control"].as_dict():
+            request.extensions["timeout"] = self.timeouts[traffic_class].as_dict()
+        return self.transports[traffic_class].handle_request(request)
+    # End of handle_request
+
+    def close(self) -> None:
+        for transport in self.transports.values():
+            transport.close()
+        # Loop End
+    # End of close
+# End of Pooled_Transport Class
+
+# Async Pooled Transport Class
+class AsyncPooled_Transport(httpx.AsyncBaseTransport):
+    """
+    The asyncio counterpart of the Pooled_Transport class.
+    """
+
+    def __init__(self, transports:dict[str, httpx.AsyncBaseTransport], timeouts:dict[str, httpx.Timeout]):
+        self.transports = transports
+        self.timeouts = timeouts
+    # End of Constructor
+
+    async def handle_async_request(self, request:httpx.Request) -> httpx.Response:
+        traffic_class = Get_Traffic_Class(request)
+
+        # Keep the timeout given to a single call, replace the client default
+        if request.extensions.get("timeout") == self.timeouts["control"].as_dict():
+            request.extensions["timeout"] = self.timeouts[traffic_class].as_dict()
+        return await self.transports[traffic_class].handle_async_request(request)
+    # End of handle_async_request
+
+    async def aclose(self) -> None:
+        for transport in self.transports.values():
+            await transport.aclose()
+        # Loop End
+    # End of aclose
+# End of AsyncPooled_Transport Class
+
+def Create_Client(
+        max_connections:dict[str, int]|None=None, timeouts:dict[str, float|httpx.Timeout]|None=None,
+        keep_alive_expiry:float|None=None, http2:bool|None=None, asynchronous:bool|None=None,
+        scheduler:Request_Scheduler|None=None, instrument:bool|None=None, **client_options
+    ) -> OpenAI|AsyncOpenAI:
+    """
+    Creates an OpenAI client whose control plane calls, run streams and file transfers each use a separate, tuned connection pool.
+
+    Parameters:
+        max_connections (dict[str, int]): The maximum number of connections of the "control", "stream" and "upload" pools.
+            Missing traffic classes keep their defaults of 20, 50 and 8 connections.
+        timeouts (dict[str, float|httpx.Timeout]): The timeouts of the "control", "stream" and "upload" traffic classes, in seconds.
+            Missing traffic classes keep their defaults of 30, 120 and 600 seconds, with a 5 second connect timeout.
+        keep_alive_expiry (float): The number of seconds an idle connection is kept open.
+            Defaults to 30.
+        http2 (bool): Enables HTTP/2, which requires the h2 package.
+            Defaults to False.
+        asynchronous (bool): Creates an AsyncOpenAI client instead of an OpenAI client.
+            Defaults to False.
+        scheduler (Request_Scheduler): A scheduler every request is sent through before reaching the connection pools.
+            The client's own retries are then disabled, the scheduler retries instead.
+            Defaults to None (no scheduling).
+        instrument (bool): Times every API request with the hooks of Get_Instrumentation_Hooks, including the time spent in the scheduler.
+            Defaults to False.
+        client_options: Passed on to the OpenAI or AsyncOpenAI constructor, for example api_key or max_retries.
+
+    Returns:
+        client (OpenAI|AsyncOpenAI): The new client.
+    """
+
+    # Handle Defaults
+    max_connections = {**DEFAULT_MAX_CONNECTIONS, **(max_connections or {})}
+    timeouts = {
+        **DEFAULT_CLIENT_TIMEOUTS,
+        **{traffic_class: httpx.Timeout(timeout) for traffic_class, timeout in (timeouts or {}).items()}
+    }
+    if keep_alive_expiry is None:
+        keep_alive_expiry = DEFAULT_KEEP_ALIVE_EXPIRY
+    if http2 is None:
+        http2 = False
+    if asynchronous is None:
+        asynchronous = False
+    if instrument is None:
+        instrument = False
+
+    # Import the optional dependency
+    if http2:
+        try:
+            import h2
+        except ImportError as e:
+            raise ImportError("HTTP/2 requires the h2 package, install httpx[http2].") from e
+
+    # Create a connection pool per traffic class
+    transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+    transports = {
+        traffic_class: transport_class(
+            limits=httpx.Limits(
+                max_connections=max_connections[traffic_class],
+                max_keepalive_connections=max_connections[traffic_class],
+                keepalive_expiry=keep_alive_expiry
+            ),
+            http2=http2
+        )
+        for traffic_class in TRAFFIC_CLASS_ENUM
+    }
+
+    # Route the requests through the scheduler, which retries instead of the client
+    if scheduler is not None:
+        client_options["max_retries"] = 0
+    event_hooks = Get_Instrumentation_Hooks(asynchronous) if instrument else None
+
+    # Create the client
+    if asynchronous:
+        transport = AsyncPooled_Transport(transports, timeouts)
+        if scheduler is not None:
+            transport = AsyncScheduled_Transport(transport, scheduler)
+        http_client = DefaultAsyncHttpxClient(transport=transport, timeout=timeouts["control"], event_hooks=event_hooks)
+        return AsyncOpenAI(http_client=http_client, timeout=timeouts["control"], **client_options)
+    transport = Pooled_Transport(transports, timeouts)
+    if scheduler is not None:
+        transport = Scheduled_Transport(transport, scheduler)
+    http_client = DefaultHttpxClient(transport=transport, timeout=timeouts["control"], event_hooks=event_hooks)
+    return OpenAI(http_client=http_client, timeout=timeouts["control"], **client_options)
+# Function End
+
+# The shared clients, by name and kind
+shared_clients:dict = {}
+shared_clients_lock:threading.Lock = threading.Lock()
+
+def Get_Shared_Client(name:str|None=None, asynchronous:bool|None=None, **options) -> OpenAI|AsyncOpenAI:
+    """
+    Returns the shared client registered under the given name, creating it with Create_Client on first use.
+    Pass the same client to every Assistant, Vector_Storage and Session_Manager so they share its connection pools.
+    The options are only used when the client is created.
+
+    Parameters:
+        name (str): The name of the client, for example one per API key or project.
+            Defaults to "default".
+        asynchronous (bool): Returns the AsyncOpenAI client registered under the name instead of the OpenAI client.
+            Defaults to False.
+        options: Passed on to Create_Client, for example a scheduler shared by every user of the client.
+
+    Returns:
+        client (OpenAI|AsyncOpenAI): The shared client.
+    """
+
+    # Handle Defaults
+    if name is None:
+        name = DEFAULT_CLIENT_NAME
+    if asynchronous is None:
+        asynchronous = False
+
+    # Create the client on first use
+    with shared_clients_lock:
+        key = (name, asynchronous)
+        if key not in shared_clients:
+            shared_clients[key] = Create_Client(asynchronous=asynchronous, **options)
+        return shared_clients[key]
+# Function End
+
+def Close_Shared_Clients() -> None:
+    """
+    Closes the connection pools of every shared OpenAI client and forgets them. Shared AsyncOpenAI clients are left registered,
+    close them with Close_Shared_Async_Clients.
+    """
+    with shared_clients_lock:
+        for key in [key for key in shared_clients if not key[1]]:
+            shared_clients.pop(key).close()
+        # Loop End
+# Function End
+
+async def Close_Shared_Async_Clients() -> None:
+    """
+    Closes the connection pools of every shared AsyncOpenAI client and forgets them. Call it from the event loop the clients were used on.
+    """
+    with shared_clients_lock:
+        clients = [shared_clients.pop(key) for key in [key for key in shared_clients if key[1]]]
+    for client in clients:
+        await client.close()
+    # Loop End
+# Function End
+
+"""
+Upload Cache
+"""
+
+# Upload Cache Constants
+DEFAULT_UPLOAD_CACHE_SIZE = 1024
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# Upload Cache Base Class
+class Upload_Cache(abc.ABC):
+    """
+    Upload Cache Base Class
+
+    A content addressed cache mapping a file digest to an uploaded OpenAI file ID and the vector stores it is attached to.
+    Subclass this class and implement Get, Set, Delete and Items to add a new storage backend.
+    Entries are dictionaries of the form {"file id": str, "vector store ids": list[str]}.
+
+    Methods:
+        Get_File_Digest(file_path:str) -> str [static]
+        Get(digest:str) -> dict|None
+        Set(digest:str, entry:dict) -> None
+        Delete(digest:str) -> None
+        Items() -> list[tuple[str, dict]]
+        Remove_File_ID(file_id:str) -> None
+        Remove_Vector_Store_ID(vector_store_id:str) -> None
+        Release_File_ID(file_id:str, vector_store_id:str) -> bool
+    """
+
+    @staticmethod
+    def Get_File_Digest(file_path:str) -> str:
+        """
+        Returns the SHA-256 hex digest of the file at the given path. The file is read in 1 MB chunks.
+
+        Parameters:
+            file_path (str): The path of the file to digest.
+
+        Returns:
+            digest (str): The hex digest of the file's contents.
+        """
+
+        # Hash the file in chunks
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+            # Loop End
+
+        # Return the digest
+        return file_hash.hexdigest()
+    # End of Get_File_Digest
+
+    @abc.abstractmethod
+    def Get(self, digest:str) -> dict|None:
+        """
+        Returns the entry stored under the given digest, or None if there is no entry.
+        """
+    # End of Get
+
+    @abc.abstractmethod
+    def Set(self, digest:str, entry:dict) -> None:
+        """
+        Stores the entry under the given digest, replacing any previous entry.
+        """
+    # End of Set
+
+    @abc.abstractmethod
+    def Delete(self, digest:str) -> None:
+        """
+        Removes the entry stored under the given digest if there is one.
+        """
+    # End of Delete
+
+    @abc.abstractmethod
+    def Items(self) -> list[tuple[str, dict]]:
+        """
+        Returns a list of every (digest, entry) pair in the cache.
+        """
+    # End of Items
+
+    def Remove_File_ID(self, file_id:str) -> None:
+        """
+        Evicts every entry pointing to the given file ID. Call this once the remote file has been deleted.
+
+        Parameters:
+            file_id (str): The ID of the deleted file.
+
+        Returns:
+            None
+        """
+
+        # Delete the entries of the file
+        for digest, entry in self.Items():
+            if entry["file id"] == file_id:
+                self.Delete(digest)
+        # Loop End
+    # End of Remove_File_ID
+
+    def Remove_Vector_Store_ID(self, vector_store_id:str) -> None:
+        """
+        Forgets every attachment to the given vector store. Call this once the remote vector store has been deleted or has expired.
+
+        Parameters:
+            vector_store_id (str): The ID of the deleted vector store.
+
+        Returns:
+            None
+        """
+
+        # Update the entries attached to the vector store
+        for digest, entry in self.Items():
+            if vector_store_id in entry["vector store ids"]:
+                entry["vector store ids"].remove(vector_store_id)
+                self.Set(digest, entry)
+        # Loop End
+    # End of Remove_Vector_Store_ID
+
+    def Release_File_ID(self, file_id:str, vector_store_id:str) -> bool:
+        """
+        Forgets the attachment of a file to a vector store it was detached from, and evicts the file's entries once no vector store uses them.
+        Returns whether another vector store still uses the file, in which case the remote file must not be deleted.
+
+        Parameters:
+            file_id (str): The ID of the detached file.
+            vector_store_id (str): The ID of the vector store the file was detached from.
+
+        Returns:
+            in_use (bool): True if the file is still attached to another vector store.
+        """
+
+        # Variable initialization
+        in_use = False
+
+        # Update the entries of the file
+        for digest, entry in self.Items():
+            if entry["file id"] != file_id:
+                continue
+            if vector_store_id in entry["vector store ids"]:
+                entry["vector store ids"].remove(vector_store_id)
+            if len(entry["vector store ids"]) > 0:
+                self.Set(digest, entry)
+                in_use = True
+            else:
+                self.Delete(digest)
+        # Loop End
+
+        # Return whether the file is still used
+        return in_use
+    # End of Release_File_ID
+# End of Upload_Cache Class
+
+# Memory Upload Cache Class
+class Memory_Upload_Cache(Upload_Cache):
+    """
+    Memory Upload Cache Class
+
+    An in memory upload cache that evicts the least recently used entry once it holds more than max_entries entries.
+
+    Properties:
+        max_entries (int): The maximum number of entries kept in the cache.
+    """
+
+    # Constructor
+    def __init__(self, max_entries:int|None=None):
+        """
+        Constructor for the Memory_Upload_Cache class.
+
+        Parameters:
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to 1024.
+        """
+
+        # Handle Defaults
+        if max_entries is None:
+            max_entries = DEFAULT_UPLOAD_CACHE_SIZE
+
+        # Set properties
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Get(self, digest:str) -> dict|None:
+        with self.__lock:
+            entry = self.__entries.get(digest)
+            if entry is None:
+                return None
+
+            # Mark the entry as recently used
+            self.__entries.move_to_end(digest)
+            return {"file id": entry["file id"], "vector store ids": list(entry["vector store ids"])}
+    # End of Get
+
+    def Set(self, digest:str, entry:dict) -> None:
+        with self.__lock:
+            self.__entries[digest] = {"file id": entry["file id"], "vector store ids": list(entry["vector store ids"])}
+            self.__entries.move_to_end(digest)
+
+            # Evict the least recently used entries
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+    # End of Set
+
+    def Delete(self, digest:str) -> None:
+        with self.__lock:
+            self.__entries.pop(digest, None)
+    # End of Delete
+
+    def Items(self) -> list[tuple[str, dict]]:
+        with self.__lock:
+            return [
+                (digest, {"file id": entry["file id"], "vector store ids": list(entry["vector store ids"])})
+                for digest, entry in self.__entries.items()
+            ]
+    # End of Items
+# End of Memory_Upload_Cache Class
+
+# SQLite Upload Cache Class
+class SQLite_Upload_Cache(Upload_Cache):
+    """
+    SQLite Upload Cache Class
+
+    An on disk upload cache backed by a SQLite database, so uploads are remembered across process restarts.
+    When max_entries is given, the least recently used entries are evicted once the cache grows past it.
+
+    Properties:
+        database_path (str): The path of the SQLite database file.
+        max_entries (int|None): The maximum number of entries kept in the cache, or None for no limit.
+    """
+
+    # Constructor
+    def __init__(self, database_path:str, max_entries:int|None=None):
+        """
+        Constructor for the SQLite_Upload_Cache class. Creates the database file and table if they do not exist.
+
+        Parameters:
+            database_path (str): The path of the SQLite database file.
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to None (no limit).
+        """
+
+        # Set properties
+        self.database_path = database_path
+        self.max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(database_path, check_same_thread=False)
+
+        # Create the table
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS upload_cache ("
+                "digest TEXT PRIMARY KEY, file_id TEXT NOT NULL, vector_store_ids TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+    # End of Constructor
+
+    def Get(self, digest:str) -> dict|None:
+        with self.__lock, self.__connection:
+            row = self.__connection.execute(
+                "SELECT file_id, vector_store_ids FROM upload_cache WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # Mark the entry as recently used
+            self.__connection.execute(
+                "UPDATE upload_cache SET last_used = ? WHERE digest = ?", (time.time(), digest)
+            )
+            return {"file id": row[0], "vector store ids": json.loads(row[1])}
+    # End of Get
+
+    def Set(self, digest:str, entry:dict) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO upload_cache (digest, file_id, vector_store_ids, last_used) VALUES (?, ?, ?, ?)",
+                (digest, entry["file id"], json.dumps(entry["vector store ids"]), time.time())
+            )
+
+            # Evict the least recently used entries
+            if self.max_entries is not None:
+                self.__connection.execute(
+                    "DELETE FROM upload_cache WHERE digest NOT IN "
+                    "(SELECT digest FROM upload_cache ORDER BY last_used DESC LIMIT ?)", (self.max_entries,)
+                )
+    # End of Set
+
+    def Delete(self, digest:str) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM upload_cache WHERE digest = ?", (digest,))
+    # End of Delete
+
+    def Items(self) -> list[tuple[str, dict]]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT digest, file_id, vector_store_ids FROM upload_cache"
+            ).fetchall()
+        return [(row[0], {"file id": row[1], "vector store ids": json.loads(row[2])}) for row in rows]
+    # End of Items
+# End of SQLite_Upload_Cache Class
+
+"""
+Vector Storage
+"""
+
+# Vestor Storage Constants
+DEFAULT_LIFE_TIME = 1
+DEFAULT_VECTOR_STORE_NAME = "Vector_Storage"
+DEFAULT_FILE_PURPOSE = "assistants"
+FILE_PURPOSE_ENUM = ["assistants", "fine-tune", "vision", "batch"]
+DEFAULT_UPLOAD_WORKERS = 8
+DEFAULT_DELETE_WORKERS = 8
+LIST_PAGE_SIZE = 100 # The maximum page size accepted by the list endpoints
+MAX_FILE_BATCH_SIZE = 500 # The maximum number of file IDs accepted by a single vector store file batch
+MULTIPART_UPLOAD_THRESHOLD = 64 * 1024 * 1024 # Bytes, files at least this large are uploaded in parts
+DEFAULT_UPLOAD_PART_SIZE = 16 * 1024 * 1024 # Bytes
+MAX_UPLOAD_PART_SIZE = 64 * 1024 * 1024 # The maximum size of a single upload part
+DEFAULT_PART_WORKERS = 4
+DEFAULT_PART_RETRIES = 3
+DEFAULT_PART_BACKOFF = 1 # Seconds
+DEFAULT_MIME_TYPE = "text/plain"
+SYNC_MANIFEST_FILENAME = ".vector_store_manifest.json"
+DEFAULT_CONTENTS_VERSION_TTL = 5 # Seconds a retrieved contents version is reused
+
+# Vector Storage Class
+class Vector_Storage:
+    """
+    Vector Storage Class
+
+    This class is used to create, modify, and delete vector stores. It also provides methods to attach files to the vector store.
+
+    Properties:
+        client (OpenAI): The OpenAI client used to access the OpenAI API.
+        name (str): The name of the vector store.
+        days_until_expiration (int): The time in terms of 24 hour days that the vector store will be kept alive.
+        intance (dict): The vector store instance.
+        upload_cache (Upload_Cache|None): The cache used to skip re-uploading identical files.
+        deletion_report (dict|None): The report of the last Delete_Vector_Store call.
+        contents_version_ttl (float): The seconds Get_Contents_Version reuses a retrieved version.
+
+    Methods:
+        Connect(openai_client:OpenAI, vector_store_id:str, name:str|None=None, life_time:int|None=None, upload_cache:Upload_Cache|None=None, verify:bool|None=None) -> Vector_Storage|None [class]
+        Retrieve_Vector_Store(vector_store_id:str) -> dict
+        Delete_Vector_Store(delete_attached:bool|None=None, max_workers:int|None=None) -> bool
+        Delete_Attached_Files(max_workers:int|None=None) -> dict
+        Modify_Vector_Store(new_name:str=None, new_life_time:int=None) -> dict
+        Get_Attributes() -> dict
+        Get_Contents_Version(max_age:float|None=None) -> str
+        Attach_Existing_File(file_id:str) -> str
+        Attach_New_File(file_path:str) -> str
+        Attach_New_Files(file_paths:list[str], purpose:str|None=None, max_workers:int|None=None) -> list[dict]
+        Attach_Existing_Files(file_ids:list[str], wait:bool|None=None) -> list[dict]
+        Get_File_Batch_Statuses(batch_ids:list[str], wait:bool|None=None) -> dict[str, dict]
+        Sync_Directory(directory:str, manifest_path:str|None=None, purpose:str|None=None, max_workers:int|None=None) -> dict
+        Upload_File(file_path:str, purpose:str|None=None) -> str
+        Upload_Large_File(file_path:str, purpose:str|None=None, part_size:int|None=None, max_workers:int|None=None, max_retries:int|None=None) -> str
+    """
+
+    # Properties
+    client = None
+    """The OpenAI client used to access the OpenAI API."""
+    name = ""
+    """The name of the vector store."""
+    days_until_expiration = 0
+    """The time in terms of 24 hour days that the vector store will be kept alive."""
+    intance = None
+    """The vector store instance."""
+    upload_cache = None
+    """The cache used to skip re-uploading identical files."""
+    deletion_report = None
+    """The report of the last Delete_Vector_Store call."""
+    contents_version_ttl = DEFAULT_CONTENTS_VERSION_TTL
+    """The seconds Get_Contents_Version reuses a retrieved version."""
+    __contents_version = None
+    __contents_changes = 0
+
+    # Constructor
+    def __init__(self, openai_client:OpenAI, name:str|None=None, life_time:int|None=None, upload_cache:Upload_Cache|None=None):
+        """
+        Constructor for the Vector_Storage class.
+
+        Parameters:
+            openai_client (OpenAI): The OpenAI client object.
+            name (str): The name of the vector store. 
+                Defaults to "Vector_Storage".
+            life_time (int): The time in terms of 24 hour days that the vector store will be kept alive.
+                Defaults to 1.
+            upload_cache (Upload_Cache): A cache mapping file digests to uploaded files. When given, files with the same contents are uploaded only once.
+                Defaults to None (no caching).
+        """
+
+        # Handle Defaults
+        if name is None:
+            name = DEFAULT_VECTOR_STORE_NAME
+        if life_time is None:
+            life_time = DEFAULT_LIFE_TIME
+
+        # Set properties
+        self.client = openai_client
+        self.name = name
+        self.days_until_expiration = life_time
+        self.upload_cache = upload_cache
+
+        # Create the vector store
+        self.intance = self.client.beta.vector_stores.create(
+            name=self.name,
+            expires_after={
+                "anchor": "last_active_at",
+                "days": self.days_until_expiration
+            }
+        )
+    # End of Constructor
+
+    @classmethod
+    def Connect(
+            cls, openai_client:OpenAI, vector_store_id:str, name:str|None=None, life_time:int|None=None,
+            upload_cache:Upload_Cache|None=None, verify:bool|None=None
+        ) -> "Vector_Storage|None":
+        """
+        Wraps an existing vector store without creating a new one, unlike the constructor.
+
+        Parameters:
+            openai_client (OpenAI): The OpenAI client object.
+            vector_store_id (str): The id of the vector store.
+            name (str): The name of the vector store, used when not verifying.
+                Defaults to "Vector_Storage".
+            life_time (int): The life time of the vector store in days, used when not verifying.
+                Defaults to 1.
+            upload_cache (Upload_Cache): A cache mapping file digests to uploaded files.
+                Defaults to None (no caching).
+            verify (bool): Retrieves the vector store (one request) to check that it still exists. Otherwise no request is made,
+                and the instance reports no files, no memory usage and a creation time of 0 until it is retrieved again.
+                Defaults to True.
+
+        Returns:
+            vector_storage (Vector_Storage|None): The vector storage object, or None if the vector store no longer exists or has expired.
+        """
+
+        # Handle Defaults
+        if name is None:
+            name = DEFAULT_VECTOR_STORE_NAME
+        if life_time is None:
+            life_time = DEFAULT_LIFE_TIME
+        if verify is None:
+            verify = True
+
+        # Set properties
+        vector_storage = cls.__new__(cls)
+        vector_storage.client = openai_client
+        vector_storage.name = name
+        vector_storage.days_until_expiration = life_time
+        vector_storage.upload_cache = upload_cache
+
+        # Verify the vector store
+        if verify:
+            try:
+                vector_storage.intance = openai_client.beta.vector_stores.retrieve(vector_store_id)
+            except NotFoundError:
+                return None
+            if vector_storage.intance.status == "expired":
+                return None
+            vector_storage.name = vector_storage.intance.name
+            if vector_storage.intance.expires_after is not None:
+                vector_storage.days_until_expiration = vector_storage.intance.expires_after.days
+
+        # Trust the given ID, with empty counts until the vector store is retrieved
+        else:
+            vector_storage.intance = Beta_Types.VectorStore(
+                id=vector_store_id,
+                created_at=0,
+                name=name,
+                object="vector_store",
+                status="completed",
+                usage_bytes=0,
+                file_counts={"in_progress": 0, "completed": 0, "failed": 0, "cancelled": 0, "total": 0},
+                expires_after={"anchor": "last_active_at", "days": life_time}
+            )
+
+        # Return the vector storage
+        return vector_storage
+    # End of Connect
+
+    def Retrieve_Vector_Store(self, vector_store_id:str) -> dict:
+        """
+        Retrieves the vector store with the given id and replaces the instance with the retrieved vector store. Returns None if the vector store was not found.
+        The previous vector store is not deleted, call Delete_Vector_Store first to remove it.
+
+        Parameters:
+            vector_store_id (str): The id of the vector store to retrieve.
+
+        Returns:
+            self.intance (dict): The retrieved vector store.
+        """
+
+        # Try to retrieve the vector store
+        try:
+            # Retrieve the vector store
+            retrieved_vector_store = self.client.beta.vector_stores.retrieve(vector_store_id)
+
+            # Replace the instance with the retrieved vector store
+            self.intance = retrieved_vector_store
+            self.__Forget_Contents_Version()
+            self.name = self.intance.name
+            self.days_until_expiration = self.intance.expires_after.days
+
+            # Return the retrieved vector store
+            return self.intance
+
+        except NotFoundError:
+            # Return none if the vector store was not found
+            return None
+    # End of Retrieve_Vector_Store
+
+    def Delete_Vector_Store(self, delete_attached:bool|None=None, max_workers:int|None=None) -> bool:
+        """
+        Deletes the vector store and sets the instance to None.
+        A report of what was deleted, or failed to delete, is stored in the deletion_report property.
+
+        Parameters:
+            delete_attached (bool): A flag to delete every file attached to the vector store.
+                Defaults to False.
+            max_workers (int): The maximum number of concurrent file deletions.
+                Defaults to 8.
+
+        Returns:
+            deletion_status.deleted (bool): A boolean value indicating if the vector store was deleted successfully.
+        """
+
+        # Handle Defaults
+        if delete_attached == None:
+            delete_attached = False
+
+        # Variable initialization
+        self.deletion_report = {
+            "vector store id": self.intance.id,
+            "vector store deleted": False,
+            "files deleted": [],
+            "files kept": [],
+            "files failed": {}
+        }
+
+        # Delete files attached to the vector store if specified
+        if delete_attached:
+            file_report = self.Delete_Attached_Files(max_workers=max_workers)
+            self.deletion_report["files deleted"] = file_report["files deleted"]
+            self.deletion_report["files kept"] = file_report["files kept"]
+            self.deletion_report["files failed"] = file_report["files failed"]
+
+        # Delete the vector store
+        deletion_status = self.client.beta.vector_stores.delete(self.intance.id)
+        self.deletion_report["vector store deleted"] = deletion_status.deleted
+
+        # Forget the attachments to the deleted vector store
+        if self.upload_cache is not None:
+            self.upload_cache.Remove_Vector_Store_ID(self.intance.id)
+
+        # Set the instance to None
+        self.intance = None
+        self.__Forget_Contents_Version()
+
+        # Return the deletion status
+        return deletion_status.deleted
+    # End of Delete_Vector_Store
+
+    def __Release_File(self, file_id:str) -> bool:
+        """
+        Internal method that detaches a file from the vector store, then deletes the file unless the upload cache
+        shows that another vector store still uses it. Files that were already detached or deleted are ignored.
+
+        Parameters:
+            file_id (str): The ID of the file.
+
+        Returns:
+            deleted (bool): True if the file was deleted, False if it was only detached.
+        """
+
+        with Request_Priority("bulk"):
+            # Detach the file from this vector store
+            with contextlib.suppress(NotFoundError):
+                self.client.beta.vector_stores.files.delete(file_id, vector_store_id=self.intance.id)
+
+            self.__Forget_Contents_Version()
+
+            # Keep files deduplicated into other vector stores
+            if (self.upload_cache is not None) and self.upload_cache.Release_File_ID(file_id, self.intance.id):
+                return False
+
+            # Delete the file
+            with contextlib.suppress(NotFoundError):
+                self.client.files.delete(file_id)
+        return True
+    # End of __Release_File
+
+    def Delete_Attached_Files(self, max_workers:int|None=None) -> dict:
+        """
+        Deletes every file attached to the vector store. All pages of attached files are listed first,
+        then the files are deleted concurrently by a bounded worker pool.
+        With an upload cache, files that another vector store still uses are only detached from this one.
+
+        Parameters:
+            max_workers (int): The maximum number of concurrent file deletions.
+                Defaults to 8.
+
+        Returns:
+            report (dict): A dictionary with the list of "files deleted", the list of "files kept" because another vector store uses them,
+                and a dictionary of "files failed" mapping file IDs to error messages. Files that were already deleted are reported as deleted.
+        """
+
+        # Handle Defaults
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_DELETE_WORKERS
+
+        # Variable initialization
+        report = {
+            "files deleted": [],
+            "files kept": [],
+            "files failed": {}
+        }
+
+        # List every page of attached files before deleting any of them
+        with Request_Priority("bulk"):
+            file_ids = [
+                attached_file.id
+                for attached_file in self.client.beta.vector_stores.files.list(vector_store_id=self.intance.id, limit=LIST_PAGE_SIZE)
+            ]
+
+        # Delete a single file
+        def Delete(file_id:str) -> tuple[bool, str|None]:
+            try:
+                return self.__Release_File(file_id), None
+            except Exception as e:
+                return False, str(e)
+        # Function End
+
+        # Delete the files concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_id, (deleted, error) in zip(file_ids, executor.map(Delete, file_ids)):
+                if error is not None:
+                    report["files failed"][file_id] = error
+                elif deleted:
+                    report["files deleted"].append(file_id)
+                else:
+                    report["files kept"].append(file_id)
+            # Loop End
+
+        # Return the report
+        return report
+    # End of Delete_Attached_Files
+
+    def Modify_Vector_Store(self, new_name:str=None, new_life_time:int=None) -> dict:
+        """
+        Modifies the vector store with the given new name and life time. Returns the modified vector store.
+
+        Parameters:
+            new_name (str): The new name of the vector store.
+            new_life_time (int): The new life time of the vector store in terms of 24 hour days.
+
+        Returns:
+            self.intance (dict): The modified vector store.
+        """
+
+        # Set the new name and life time
+        if new_name is not None:
+            self.name = new_name
+        if new_life_time is not None:
+            self.days_until_expiration = new_life_time
+
+        # Modify the vector store
+        modified_vector_store = self.client.beta.vector_stores.update(
+            vector_store_id=self.intance.id,
+            name=self.name,
+            expires_after={
+                "anchor": "last_active_at",
+                "days": self.days_until_expiration
+            }
+        )
+
+        # Replace the instance with the modified vector store
+        self.intance = modified_vector_store
+
+        # Return the modified vector store
+        return self.intance
+    # End of Modify_Vector_Store
+
+    def Get_Attributes(self) -> dict:
+        """
+        Returns a dictionary of the vector store's attributes.
+
+        Parameters:
+            None
+
+        Returns:
+            attributes (dict): A dictionary of the vector store's attributes.
+        """
+
+        # Create an attributes dictionary
+        attributes = {
+            "id": self.intance.id,
+            "name": self.name,
+            "status": self.intance.status,
+            "created at": self.intance.created_at,
+            "days until expiration": self.days_until_expiration,
+            "file count": self.intance.file_counts.total,
+            "memory usage": self.intance.usage_bytes,
+        }
+
+        # Return the status
+        return attributes
+    # End of Get_Attributes
+
+    def Get_Contents_Version(self, max_age:float|None=None) -> str:
+        """
+        Returns a version of the vector store's contents built from its file counts and memory usage.
+        The version changes whenever files are attached, indexed, or removed, by this or any other process.
+        A version retrieved less than max_age seconds ago is reused, unless files were attached or removed through this object since.
+        Otherwise the vector store is retrieved, without replacing the instance.
+
+        Parameters:
+            max_age (float): The seconds a retrieved version is reused, 0 always retrieves the vector store.
+                Defaults to contents_version_ttl (5 seconds).
+
+        Returns:
+            version (str): The version of the vector store's contents.
+        """
+
+        # Handle Defaults
+        if max_age is None:
+            max_age = self.contents_version_ttl
+
+        # Reuse a recent version
+        cached_version = self.__contents_version
+        if (cached_version is not None) and (time.monotonic() - cached_version[1] < max_age):
+            return cached_version[0]
+
+        # Retrieve the vector store
+        changes = self.__contents_changes
+        vector_store = self.client.beta.vector_stores.retrieve(self.intance.id)
+
+        # Build the version, only keeping it if the contents did not change meanwhile
+        file_counts = vector_store.file_counts
+        version = f"{file_counts.total}:{file_counts.completed}:{file_counts.failed}:{vector_store.usage_bytes}"
+        if changes == self.__contents_changes:
+            self.__contents_version = (version, time.monotonic())
+        return version
+    # End of Get_Contents_Version
+
+    def __Forget_Contents_Version(self) -> None:
+        """
+        Internal method that makes the next Get_Contents_Version call retrieve the vector store, after its contents changed.
+        """
+        self.__contents_changes += 1
+        self.__contents_version = None
+    # End of __Forget_Contents_Version
+
+    def Attach_Existing_File(self, file_id:str) -> str:
+        """
+        Attaches a file with the given id to the vector store. Returns the file's ID.
+
+        Parameters:
+            file_id (str): The id of the file to attach to the vector store.
+
+        Returns:
+            vector_store_file.id (str): The ID of the file attachment.
+        """
+
+        # Attach the file
+        with Get_Metrics_Recorder().Span("vector_store.attach_file"):
+            vector_store_file = self.client.beta.vector_stores.files.create_and_poll(
+                vector_store_id=self.intance.id,
+                file_id=file_id
+            )
+        self.__Forget_Contents_Version()
+
+        # Return the file's ID
+        return vector_store_file.id
+    # End of Attach_Existing_File
+
+    def Attach_New_File(self, file_path:str, purpose:str|None=None) -> str:
+        """
+        Attaches a file with the given path to the vector store. Returns the file's ID.
+
+        Parameters:
+            file_path (str): The path of the file to attach to the vector store.
+            purpose (str): The purpose of the file. Can be "assistants", "fine-tune", "vision", or "batch".
+                Defaults to "assistant".
+
+        Returns:
+            file_ID (str): The ID of the file attachment.
+        """
+
+        # Handle Defaults
+        if (purpose is None) or (purpose not in FILE_PURPOSE_ENUM):
+            purpose = DEFAULT_FILE_PURPOSE
+
+        # Look for an identical upload
+        cache_key, file_ID, attached = self.__Lookup_Upload_Cache(file_path, purpose)
+        if attached:
+            return file_ID
+
+        # Upload the file
+        if file_ID is None:
+            file_ID = self.Upload_File(file_path, purpose)
+
+        # Attach the file
+        file_ID = self.Attach_Existing_File(file_ID)
+        self.__Record_Upload(cache_key, file_ID)
+
+        # Return the attachment status
+        return file_ID
+    # End of Attach_New_File
+
+    def Upload_File(self, file_path:str, purpose:str|None=None) -> str:
+        """
+        Uploads the file at the given path without attaching it. Files of at least 64 MB go through Upload_Large_File,
+        smaller files are uploaded in a single request. Returns the uploaded file's ID.
+        The requests keep the caller's priority, Attach_New_Files and Sync_Directory upload as bulk work.
+
+        Parameters:
+            file_path (str): The path of the file to upload.
+            purpose (str): The purpose of the file. Can be "assistants", "fine-tune", "vision", or "batch".
+                Defaults to "assistant".
+
+        Returns:
+            file_id (str): The ID of the uploaded file.
+        """
+
+        # Handle Defaults
+        if (purpose is None) or (purpose not in FILE_PURPOSE_ENUM):
+            purpose = DEFAULT_FILE_PURPOSE
+
+        # Upload large files in parts
+        if os.path.getsize(file_path) >= MULTIPART_UPLOAD_THRESHOLD:
+            return self.Upload_Large_File(file_path, purpose)
+
+        # Upload the file
+        with open(file_path, "rb") as file, Get_Metrics_Recorder().Span("vector_store.upload_file"):
+            uploaded_file = self.client.files.create(file=file, purpose=purpose)
+
+        # Return the file's ID
+        return uploaded_file.id
+    # End of Upload_File
+
+    def Upload_Large_File(
+            self, file_path:str, purpose:str|None=None, part_size:int|None=None,
+            max_workers:int|None=None, max_retries:int|None=None
+        ) -> str:
+        """
+        Uploads the file at the given path through the Uploads API, sending fixed size parts concurrently.
+        The file is memory mapped, so at most one part per worker is held in memory at a time.
+        A failed part is retried on its own with exponential backoff. If a part still fails, the upload is cancelled and the error is raised.
+        Returns the ID of the file the upload is completed into. Every part is sent with the caller's priority.
+
+        Parameters:
+            file_path (str): The path of the file to upload.
+            purpose (str): The purpose of the file. Can be "assistants", "fine-tune", "vision", or "batch".
+                Defaults to "assistant".
+            part_size (int): The size of every part in bytes, at most 64 MB.
+                Defaults to 16 MB.
+            max_workers (int): The maximum number of parts uploaded concurrently.
+                Defaults to 4.
+            max_retries (int): The number of times a failed part is retried.
+                Defaults to 3.
+
+        Returns:
+            file_id (str): The ID of the uploaded file.
+        """
+
+        # Handle Defaults
+        if (purpose is None) or (purpose not in FILE_PURPOSE_ENUM):
+            purpose = DEFAULT_FILE_PURPOSE
+        if (part_size is None) or (part_size < 1):
+            part_size = DEFAULT_UPLOAD_PART_SIZE
+        part_size = min(part_size, MAX_UPLOAD_PART_SIZE)
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_PART_WORKERS
+        if (max_retries is None) or (max_retries < 0):
+            max_retries = DEFAULT_PART_RETRIES
+
+        # Variable initialization
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            raise ValueError(f"Cannot upload the empty file {file_path} in parts.")
+        mime_type = mimetypes.guess_type(file_path)[0] or DEFAULT_MIME_TYPE
+        offsets = range(0, file_size, part_size)
+        priority = request_priority.get()
+
+        with Get_Metrics_Recorder().Span("vector_store.upload_file"):
+            # Start the upload
+            upload = self.client.uploads.create(
+                bytes=file_size,
+                filename=os.path.basename(file_path),
+                mime_type=mime_type,
+                purpose=purpose
+            )
+
+            # Upload a single part, retrying it on transient errors
+            def Upload_Part(contents:mmap.mmap, offset:int) -> str:
+                for attempt in range(max_retries + 1):
+                    try:
+                        with Request_Priority(priority):
+                            return self.client.uploads.parts.create(upload.id, data=contents[offset:offset + part_size]).id
+                    except (APIConnectionError, APIStatusError) as e:
+                        retryable = isinstance(e, APIConnectionError) or (e.status_code == 429) or (e.status_code >= 500)
+                        if (not retryable) or (attempt == max_retries):
+                            raise
+                        time.sleep(DEFAULT_PART_BACKOFF * (2 ** attempt))
+            # Function End
+
+            # Upload the parts concurrently
+            try:
+                with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        part_ids = list(executor.map(lambda offset: Upload_Part(contents, offset), offsets))
+            except BaseException:
+                with contextlib.suppress(Exception):
+                    self.client.uploads.cancel(upload.id)
+                raise
+
+            # Complete the upload into a file
+            upload = self.client.uploads.complete(upload.id, part_ids=part_ids)
+
+        # Return the file's ID
+        return upload.file.id
+    # End of Upload_Large_File
+
+    def __Lookup_Upload_Cache(self, file_path:str, purpose:str) -> tuple[str|None, str|None, bool]:
+        """
+        Internal method that looks up an identical, still existing upload of the given file in the upload cache.
+        Entries whose remote file or attachment no longer exists are evicted.
+
+        Parameters:
+            file_path (str): The path of the file.
+            purpose (str): The purpose of the file.
+
+        Returns:
+            cache_key (str|None): The cache key of the file, or None if there is no upload cache.
+            file_id (str|None): The ID of the cached upload, or None if the file has to be uploaded.
+            attached (bool): True if the cached upload is already attached to this vector store.
+        """
+
+        # Skip the lookup if caching is disabled
+        if self.upload_cache is None:
+            return None, None, False
+
+        # Find the cached entry
+        cache_key = f"{purpose}:{Upload_Cache.Get_File_Digest(file_path)}"
+        entry = self.upload_cache.Get(cache_key)
+        if entry is None:
+            return cache_key, None, False
+
+        # Verify the cached attachment still exists
+        if self.intance.id in entry["vector store ids"]:
+            try:
+                self.client.beta.vector_stores.files.retrieve(entry["file id"], vector_store_id=self.intance.id)
+                return cache_key, entry["file id"], True
+            except NotFoundError:
+                entry["vector store ids"].remove(self.intance.id)
+                self.upload_cache.Set(cache_key, entry)
+
+        # Verify the cached file still exists
+        try:
+            self.client.files.retrieve(entry["file id"])
+            return cache_key, entry["file id"], False
+        except NotFoundError:
+            self.upload_cache.Delete(cache_key)
+            return cache_key, None, False
+    # End of __Lookup_Upload_Cache
+
+    def __Record_Upload(self, cache_key:str|None, file_id:str) -> None:
+        """
+        Internal method that records an upload and its attachment to this vector store in the upload cache.
+
+        Parameters:
+            cache_key (str|None): The cache key returned by __Lookup_Upload_Cache.
+            file_id (str): The ID of the uploaded file.
+
+        Returns:
+            None
+        """
+
+        # Skip if caching is disabled
+        if (self.upload_cache is None) or (cache_key is None):
+            return None
+
+        # Update the entry
+        entry = self.upload_cache.Get(cache_key)
+        if (entry is None) or (entry["file id"] != file_id):
+            entry = {"file id": file_id, "vector store ids": []}
+        if self.intance.id not in entry["vector store ids"]:
+            entry["vector store ids"].append(self.intance.id)
+        self.upload_cache.Set(cache_key, entry)
+    # End of __Record_Upload
+
+    def Attach_New_Files(self, file_paths:list[str], purpose:str|None=None, max_workers:int|None=None) -> list[dict]:
+        """
+        Uploads the files at the given paths concurrently and attaches them to the vector store through vector store file batches.
+        All batches are created before any of them are polled, so indexing of every file happens in parallel.
+        Returns one result dictionary per file path, in the same order as the file paths.
+
+        Parameters:
+            file_paths (list[str]): The paths of the files to attach to the vector store.
+            purpose (str): The purpose of the files. Can be "assistants", "fine-tune", "vision", or "batch".
+                Defaults to "assistant".
+            max_workers (int): The maximum number of concurrent uploads.
+                Defaults to 8.
+
+        Returns:
+            results (list[dict]): A list of dictionaries with the keys "file path", "file id", "status" and "error".
+                The status is "missing" if the path does not exist, "upload failed" if the upload raised an error,
+                otherwise it is the status of the vector store file ("completed", "failed", "in_progress" or "cancelled").
+        """
+
+        # Handle Defaults
+        if (purpose is None) or (purpose not in FILE_PURPOSE_ENUM):
+            purpose = DEFAULT_FILE_PURPOSE
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_UPLOAD_WORKERS
+
+        # Variable initialization
+        results = [
+            {"file path": file_path, "file id": None, "status": None if os.path.exists(file_path) else "missing", "error": None}
+            for file_path in file_paths
+        ]
+        pending = [result for result in results if result["status"] is None]
+        cache_keys = {}
+
+        # Upload a single file, unless an identical upload is cached
+        def Upload(result:dict) -> None:
+            try:
+                with Request_Priority("bulk"):
+                    cache_key, file_id, attached = self.__Lookup_Upload_Cache(result["file path"], purpose)
+                    cache_keys[result["file path"]] = cache_key
+                    if attached:
+                        result["status"] = "completed"
+                    elif file_id is None:
+                        file_id = self.Upload_File(result["file path"], purpose)
+                result["file id"] = file_id
+            except Exception as e:
+                result["status"] = "upload failed"
+                result["error"] = str(e)
+        # Function End
+
+        # Upload the files concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(Upload, pending))
+
+        # Collect the uploaded file IDs that still need attaching
+        uploaded = [result for result in pending if (result["file id"] is not None) and (result["status"] is None)]
+        file_ids = list(dict.fromkeys(result["file id"] for result in uploaded))
+        if len(file_ids) == 0:
+            return results
+
+        # Index the files
+        attachments = {attachment["file id"]: attachment for attachment in self.Attach_Existing_Files(file_ids)}
+
+        # Update the results
+        for result in uploaded:
+            result["status"] = attachments[result["file id"]]["status"]
+            result["error"] = attachments[result["file id"]]["error"]
+            if result["status"] == "completed":
+                self.__Record_Upload(cache_keys.get(result["file path"]), result["file id"])
+        # Loop End
+
+        # Return the results
+        return results
+    # End of Attach_New_Files
+
+    def Attach_Existing_Files(self, file_ids:list[str], wait:bool|None=None) -> list[dict]:
+        """
+        Attaches already uploaded files to the vector store through vector store file batches of up to 500 files.
+        Every batch is created before any of them are polled, and each batch is polled as a whole rather than file by file.
+        Without waiting, the method returns as soon as the batches are created, and Get_File_Batch_Statuses reports their progress later.
+
+        Parameters:
+            file_ids (list[str]): The IDs of the files to attach to the vector store.
+            wait (bool): Waits until every file is indexed.
+                Defaults to True.
+
+        Returns:
+            results (list[dict]): A list of dictionaries with the keys "file id", "batch id", "status" and "error", in the same order as the file IDs.
+                The status is the status of the vector store file ("completed", "failed", "in_progress" or "cancelled").
+        """
+
+        # Handle Defaults
+        if wait is None:
+            wait = True
+
+        # Variable initialization
+        unique_file_ids = list(dict.fromkeys(file_ids))
+        if len(unique_file_ids) == 0:
+            return []
+
+        # Create every file batch before polling any of them
+        with Request_Priority("bulk"):
+            file_batches = [
+                self.client.beta.vector_stores.file_batches.create(
+                    vector_store_id=self.intance.id,
+                    file_ids=unique_file_ids[index:index + MAX_FILE_BATCH_SIZE]
+                )
+                for index in range(0, len(unique_file_ids), MAX_FILE_BATCH_SIZE)
+            ]
+        batch_ids = {
+            file_id: file_batch.id
+            for index, file_batch in zip(range(0, len(unique_file_ids), MAX_FILE_BATCH_SIZE), file_batches)
+            for file_id in unique_file_ids[index:index + MAX_FILE_BATCH_SIZE]
+        }
+
+        # Gather the per file statuses, or report every file as in progress
+        if wait:
+            statuses = self.Get_File_Batch_Statuses([file_batch.id for file_batch in file_batches], wait=True)
+            missing_status = {"status": "failed", "error": "The file was not found in the vector store file batch."}
+        else:
+            statuses = {}
+            missing_status = {"status": "in_progress", "error": None}
+        self.__Forget_Contents_Version()
+
+        # Return the results
+        return [
+            {"file id": file_id, "batch id": batch_ids[file_id], **statuses.get(file_id, missing_status)}
+            for file_id in file_ids
+        ]
+    # End of Attach_Existing_Files
+
+    def Get_File_Batch_Statuses(self, batch_ids:list[str], wait:bool|None=None) -> dict[str, dict]:
+        """
+        Returns the status of every file of the given vector store file batches, for example those returned by Attach_Existing_Files.
+
+        Parameters:
+            batch_ids (list[str]): The IDs of the vector store file batches.
+            wait (bool): Polls every batch until it is no longer in progress first.
+                Defaults to False.
+
+        Returns:
+            statuses (dict[str, dict]): A dictionary mapping every file ID to a dictionary with the keys "status" and "error".
+        """
+
+        # Handle Defaults
+        if wait is None:
+            wait = False
+
+        # Variable initialization
+        statuses = {}
+
+        with Request_Priority("bulk"):
+            for batch_id in batch_ids:
+                # Wait for the batch
+                if wait:
+                    with Get_Metrics_Recorder().Span("vector_store.index_batch"):
+                        self.client.beta.vector_stores.file_batches.poll(
+                            batch_id,
+                            vector_store_id=self.intance.id
+                        )
+
+                # List the files of the batch
+                for vector_store_file in self.client.beta.vector_stores.file_batches.list_files(
+                    batch_id,
+                    vector_store_id=self.intance.id,
+                    limit=LIST_PAGE_SIZE
+                ):
+                    statuses[vector_store_file.id] = {
+                        "status": vector_store_file.status,
+                        "error": vector_store_file.last_error.message if vector_store_file.last_error is not None else None
+                    }
+                # Loop End
+            # Loop End
+
+        # Return the statuses
+        return statuses
+    # End of Get_File_Batch_Statuses
+
+    def Sync_Directory(self, directory:str, manifest_path:str|None=None, purpose:str|None=None, max_workers:int|None=None) -> dict:
+        """
+        Makes the vector store mirror the files under the given directory, using a manifest of the last sync.
+        Files whose size and modification time match the manifest are skipped without being read, the rest are digested concurrently.
+        New and changed files are uploaded and attached through Attach_New_Files, then the previous versions of changed files
+        and the files removed from the directory are detached and deleted concurrently. The manifest is rewritten after every sync.
+        Files that cannot be read are reported as failed and keep their previous version, without stopping the sync.
+        Previous versions that cannot be deleted are reported as failed under their path, and the manifest is still saved.
+
+        Parameters:
+            directory (str): The directory to sync, including its subdirectories.
+            manifest_path (str): The path of the manifest file, which maps relative paths to their size, modification time, digest and file ID.
+                Defaults to ".vector_store_manifest.json" inside the directory.
+            purpose (str): The purpose of the files. Can be "assistants", "fine-tune", "vision", or "batch".
+                Defaults to "assistant".
+            max_workers (int): The maximum number of concurrent digests, uploads and deletions.
+                Defaults to 8.
+
+        Returns:
+            report (dict): A dictionary with the lists of "added", "updated", "removed" and "unchanged" relative paths,
+                and a "failed" dictionary mapping relative paths to error messages.
+        """
+
+        # Handle Defaults
+        if manifest_path is None:
+            manifest_path = os.path.join(directory, SYNC_MANIFEST_FILENAME)
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_UPLOAD_WORKERS
+
+        # Variable initialization
+        report = {
+            "added": [],
+            "updated": [],
+            "removed": [],
+            "unchanged": [],
+            "failed": {}
+        }
+
+        # Load the manifest of the last sync into this vector store
+        manifest = {"vector store id": self.intance.id, "files": {}}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as file:
+                previous_manifest = json.load(file)
+            if previous_manifest["vector store id"] == self.intance.id:
+                manifest = previous_manifest
+        entries = manifest["files"]
+
+        # List the files in the directory
+        file_stats = {}
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                file_path = os.path.join(root, filename)
+                if os.path.abspath(file_path) == os.path.abspath(manifest_path):
+                    continue
+                relative_path = os.path.relpath(file_path, directory)
+                try:
+                    file_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    # Removed since it was listed
+                    continue
+                except OSError as e:
+                    report["failed"][relative_path] = str(e)
+                    continue
+                file_stats[relative_path] = {"size": file_stat.st_size, "mtime": file_stat.st_mtime_ns}
+            # Loop End
+        # Loop End
+
+        # Digest a single file, recording the files that cannot be read
+        def Digest(relative_path:str) -> str|None:
+            try:
+                return Upload_Cache.Get_File_Digest(os.path.join(directory, relative_path))
+            except OSError as e:
+                report["failed"][relative_path] = str(e)
+                return None
+        # Function End
+
+        # Digest the files whose size or modification time changed
+        candidates = [
+            relative_path for relative_path, file_stat in file_stats.items()
+            if (relative_path not in entries)
+            or (entries[relative_path]["size"] != file_stat["size"])
+            or (entries[relative_path]["mtime"] != file_stat["mtime"])
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = dict(zip(candidates, executor.map(Digest, candidates)))
+
+        # Sort the files into unchanged, added and updated files
+        changed = []
+        for relative_path, file_stat in file_stats.items():
+            if relative_path in report["failed"]:
+                continue
+            entry = entries.get(relative_path)
+            if (entry is not None) and ((relative_path not in digests) or (entry["digest"] == digests[relative_path])):
+                entry.update(file_stat)
+                report["unchanged"].append(relative_path)
+            else:
+                changed.append(relative_path)
+        # Loop End
+
+        # Upload and attach the new versions
+        stale_files = {}
+        results = self.Attach_New_Files([os.path.join(directory, relative_path) for relative_path in changed], purpose, max_workers)
+        for relative_path, result in zip(changed, results):
+            if result["status"] != "completed":
+                report["failed"][relative_path] = result["error"] or f"The file status is {result['status']}."
+                continue
+            if relative_path in entries:
+                stale_files[entries[relative_path]["file id"]] = relative_path
+                report["updated"].append(relative_path)
+            else:
+                report["added"].append(relative_path)
+            entries[relative_path] = {**file_stats[relative_path], "digest": digests[relative_path], "file id": result["file id"]}
+        # Loop End
+
+        # Forget the files removed from the directory, keeping those that could not be read
+        for relative_path in [relative_path for relative_path in entries if (relative_path not in file_stats) and (relative_path not in report["failed"])]:
+            stale_files[entries.pop(relative_path)["file id"]] = relative_path
+            report["removed"].append(relative_path)
+        # Loop End
+
+        # Keep files that another path still uses
+        live_file_ids = {entry["file id"] for entry in entries.values()}
+        stale_file_ids = [file_id for file_id in stale_files if file_id not in live_file_ids]
+
+        # Detach and delete a single stale file, returning the error instead of raising it
+        def Delete(file_id:str) -> str|None:
+            try:
+                self.__Release_File(file_id)
+            except Exception as e:
+                return f"The previous version {file_id} could not be deleted: {e}"
+            return None
+        # Function End
+
+        # Delete the stale files concurrently, so the manifest is saved even if some deletions fail
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_id, error in zip(stale_file_ids, executor.map(Delete, stale_file_ids)):
+                if error is not None:
+                    report["failed"][stale_files[file_id]] = error
+            # Loop End
+
+        # Save the manifest
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(manifest, file)
+        os.replace(temporary_path, manifest_path)
+
+        # Return the report
+        return report
+    # End of Sync_Directory
+# End of Vector_Storage Class
+
+"""
+Resource Pool
+"""
+
+# Resource Pool Constants
+DEFAULT_POOL_SIZE = 2
+DEFAULT_POOL_REFRESH_INTERVAL = 60 # Seconds
+POOL_EXPIRY_MARGIN = 3600 # Seconds before expiry at which pooled resources are reaped
+SECONDS_PER_DAY = 86400
+
+# Resource Pool Class
+class Resource_Pool:
+    """
+    Resource Pool Class
+
+    Keeps a number of pre-created threads and empty vector stores ready so new assistants can take them instantly instead of creating them on the critical path.
+    A background worker replenishes the pool and reaps idle resources before their life time runs out, so stale resources are never handed out.
+
+    Properties:
+        client (OpenAI): The OpenAI client used to access the OpenAI API.
+        thread_count (int): The number of threads kept ready.
+        vector_store_count (int): The number of empty vector stores kept ready.
+        vector_store_name (str): The name given to pooled vector stores.
+        life_time (int): The time in terms of 24 hour days that idle pooled resources are kept alive.
+        refresh_interval (float): The number of seconds between background refreshes.
+        last_error (Exception|None): The last error raised while replenishing or reaping the pool.
+
+    Methods:
+        Start() -> None
+        Stop(delete_idle:bool|None=None) -> None
+        Acquire_Thread() -> Thread
+        Acquire_Vector_Store() -> Vector_Storage
+        Replenish() -> None
+        Reap() -> int
+        Get_Attributes() -> dict
+    """
+
+    # Constructor
+    def __init__(
+            self, openai_client:OpenAI, thread_count:int|None=None, vector_store_count:int|None=None,
+            vector_store_name:str|None=None, life_time:int|None=None, refresh_interval:float|None=None
+        ):
+        """
+        Constructor for the Resource_Pool class. Call Start to begin filling the pool in the background.
+
+        Parameters:
+            openai_client (OpenAI): The OpenAI client object.
+            thread_count (int): The number of threads kept ready.
+                Defaults to 2.
+            vector_store_count (int): The number of empty vector stores kept ready.
+                Defaults to 2.
+            vector_store_name (str): The name given to pooled vector stores.
+                Defaults to "Vector_Storage".
+            life_time (int): The time in terms of 24 hour days that idle pooled resources are kept alive.
+                Defaults to 1.
+            refresh_interval (float): The number of seconds between background refreshes.
+                Defaults to 60.
+        """
+
+        # Handle Defaults
+        if thread_count is None:
+            thread_count = DEFAULT_POOL_SIZE
+        if vector_store_count is None:
+            vector_store_count = DEFAULT_POOL_SIZE
+        if vector_store_name is None:
+            vector_store_name = DEFAULT_VECTOR_STORE_NAME
+        if life_time is None:
+            life_time = DEFAULT_LIFE_TIME
+        if refresh_interval is None:
+            refresh_interval = DEFAULT_POOL_REFRESH_INTERVAL
+
+        # Set properties
+        self.client = openai_client
+        self.thread_count = thread_count
+        self.vector_store_count = vector_store_count
+        self.vector_store_name = vector_store_name
+        self.life_time = life_time
+        self.refresh_interval = refresh_interval
+        self.last_error = None
+        self.__threads = []
+        self.__vector_stores = []
+        self.__lock = threading.Lock()
+        self.__wake_event = threading.Event()
+        self.__stop_event = threading.Event()
+        self.__worker = None
+    # End of Constructor
+
+    def Start(self) -> None:
+        """
+        Starts the background worker that fills, replenishes and reaps the pool.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        # Skip if already running
+        if (self.__worker is not None) and self.__worker.is_alive():
+            return None
+
+        # Start the worker
+        self.__stop_event.clear()
+        self.__worker = threading.Thread(target=self.__Run, name="Resource_Pool", daemon=True)
+        self.__worker.start()
+    # End of Start
+
+    def Stop(self, delete_idle:bool|None=None) -> None:
+        """
+        Stops the background worker.
+
+        Parameters:
+            delete_idle (bool): A flag to delete the resources still idle in the pool.
+                Defaults to True.
+
+        Returns:
+            None
+        """
+
+        # Handle Defaults
+        if delete_idle is None:
+            delete_idle = True
+
+        # Stop the worker
+        self.__stop_event.set()
+        self.__wake_event.set()
+        if self.__worker is not None:
+            self.__worker.join()
+            self.__worker = None
+
+        # Delete the idle resources
+        if delete_idle:
+            with self.__lock:
+                threads, self.__threads = self.__threads, []
+                vector_stores, self.__vector_stores = self.__vector_stores, []
+            for __, thread in threads:
+                self.__Delete_Thread(thread)
+            for __, vector_store in vector_stores:
+                self.__Delete_Vector_Store(vector_store)
+    # End of Stop
+
+    def __Run(self) -> None:
+        """
+        Internal method run by the background worker.
+        """
+
+        while not self.__stop_event.is_set():
+            try:
+                with Request_Priority("bulk"):
+                    self.Reap()
+                    self.Replenish()
+            except Exception as e:
+                self.last_error = e
+
+            # Wait for the next refresh or an acquisition
+            self.__wake_event.wait(self.refresh_interval)
+            self.__wake_event.clear()
+        # Loop End
+    # End of __Run
+
+    def __Is_Stale(self, created_at:float) -> bool:
+        """
+        Internal method that checks if a resource created at the given monotonic time is too close to its expiry to be handed out.
+        """
+        return time.monotonic() - created_at >= (self.life_time * SECONDS_PER_DAY) - POOL_EXPIRY_MARGIN
+    # End of __Is_Stale
+
+    def __Delete_Thread(self, thread:Beta_Types.Thread) -> None:
+        """
+        Internal method that deletes a pooled thread, ignoring errors.
+        """
+        try:
+            self.client.beta.threads.delete(thread.id)
+        except Exception as e:
+            self.last_error = e
+    # End of __Delete_Thread
+
+    def __Delete_Vector_Store(self, vector_store:Vector_Storage) -> None:
+        """
+        Internal method that deletes a pooled vector store, ignoring errors.
+        """
+        try:
+            vector_store.Delete_Vector_Store()
+        except Exception as e:
+            self.last_error = e
+    # End of __Delete_Vector_Store
+
+    def Replenish(self) -> None:
+        """
+        Creates threads and vector stores until the pool holds its configured number of each.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        # Replenish the threads
+        while (len(self.__threads) < self.thread_count) and not self.__stop_event.is_set():
+            thread = self.client.beta.threads.create()
+            with self.__lock:
+                self.__threads.append((time.monotonic(), thread))
+        # Loop End
+
+        # Replenish the vector stores
+        while (len(self.__vector_stores) < self.vector_store_count) and not self.__stop_event.is_set():
+            vector_store = Vector_Storage(
+                openai_client=self.client,
+                name=self.vector_store_name,
+                life_time=self.life_time
+            )
+            with self.__lock:
+                self.__vector_stores.append((time.monotonic(), vector_store))
+        # Loop End
+    # End of Replenish
+
+    def Reap(self) -> int:
+        """
+        Deletes the pooled resources that are about to expire.
+
+        Parameters:
+            None
+
+        Returns:
+            reaped (int): The number of resources deleted.
+        """
+
+        # Remove the stale resources from the pool
+        with self.__lock:
+            stale_threads = [thread for created_at, thread in self.__threads if self.__Is_Stale(created_at)]
+            stale_vector_stores = [vector_store for created_at, vector_store in self.__vector_stores if self.__Is_Stale(created_at)]
+            self.__threads = [pair for pair in self.__threads if not self.__Is_Stale(pair[0])]
+            self.__vector_stores = [pair for pair in self.__vector_stores if not self.__Is_Stale(pair[0])]
+
+        # Delete the stale resources
+        for thread in stale_threads:
+            self.__Delete_Thread(thread)
+        for vector_store in stale_vector_stores:
+            self.__Delete_Vector_Store(vector_store)
+
+        # Return the number of reaped resources
+        return len(stale_threads) + len(stale_vector_stores)
+    # End of Reap
+
+    def Acquire_Thread(self) -> Beta_Types.Thread:
+        """
+        Hands out a pooled thread, or creates one if the pool is empty. The pool is replenished in the background.
+
+        Parameters:
+            None
+
+        Returns:
+            thread (Thread): A thread owned by the caller.
+        """
+
+        # Take the oldest fresh thread
+        thread = None
+        stale_threads = []
+        with self.__lock:
+            while (thread is None) and (len(self.__threads) > 0):
+                created_at, thread = self.__threads.pop(0)
+                if self.__Is_Stale(created_at):
+                    stale_threads.append(thread)
+                    thread = None
+            # Loop End
+
+        # Wake the worker to replenish the pool
+        self.__wake_event.set()
+
+        # Delete the stale threads that were skipped
+        for stale_thread in stale_threads:
+            self.__Delete_Thread(stale_thread)
+
+        # Create a thread if the pool was empty
+        if thread is None:
+            thread = self.client.beta.threads.create()
+
+        # Return the thread
+        return thread
+    # End of Acquire_Thread
+
+    def Acquire_Vector_Store(self) -> Vector_Storage:
+        """
+        Hands out a pooled empty vector store, or creates one if the pool is empty. The pool is replenished in the background.
+
+        Parameters:
+            None
+
+        Returns:
+            vector_store (Vector_Storage): A vector store owned by the caller.
+        """
+
+        # Take the oldest fresh vector store
+        vector_store = None
+        stale_vector_stores = []
+        with self.__lock:
+            while (vector_store is None) and (len(self.__vector_stores) > 0):
+                created_at, vector_store = self.__vector_stores.pop(0)
+                if self.__Is_Stale(created_at):
+                    stale_vector_stores.append(vector_store)
+                    vector_store = None
+            # Loop End
+
+        # Wake the worker to replenish the pool
+        self.__wake_event.set()
+
+        # Delete the stale vector stores that were skipped
+        for stale_vector_store in stale_vector_stores:
+            self.__Delete_Vector_Store(stale_vector_store)
+
+        # Create a vector store if the pool was empty
+        if vector_store is None:
+            vector_store = Vector_Storage(
+                openai_client=self.client,
+                name=self.vector_store_name,
+                life_time=self.life_time
+            )
+
+        # Return the vector store
+        return vector_store
+    # End of Acquire_Vector_Store
+
+    def Get_Attributes(self) -> dict:
+        """
+        Returns a dictionary of the pool's attributes.
+
+        Parameters:
+            None
+
+        Returns:
+            attributes (dict): A dictionary of the pool's attributes.
+        """
+
+        # Create an attributes dictionary
+        with self.__lock:
+            attributes = {
+                "idle threads": len(self.__threads),
+                "idle vector stores": len(self.__vector_stores),
+                "thread count": self.thread_count,
+                "vector store count": self.vector_store_count,
+                "days until expiration": self.life_time,
+                "running": (self.__worker is not None) and self.__worker.is_alive(),
+                "last error": self.last_error,
+            }
+
+        # Return the attributes
+        return attributes
+    # End of Get_Attributes
+# End of Resource_Pool Class
+
+"""
+Output Sinks
+"""
+
+# Output Sink Constants
+DEFAULT_SINK_FLUSH_BYTES = 256
+DEFAULT_SINK_FLUSH_INTERVAL = 0.05 # Seconds
+
+# Output Sink Base Class
+class Output_Sink(abc.ABC):
+    """
+    Output Sink Base Class
+
+    A destination for the text streamed by an event handler. Writes are buffered and handed to Emit in coalesced chunks,
+    once flush_bytes bytes are pending or flush_interval seconds have passed since the last flush. Event handlers also flush at the end of every text block and stream.
+    Every written piece of text is collected as well, so the full response can be read with Get_Text once the stream ends.
+    Subclass this class and implement Emit to add a new destination.
+
+    Properties:
+        flush_bytes (int): The number of pending bytes that triggers a flush.
+        flush_interval (float): The number of seconds after which pending text is flushed on the next write.
+
+    Methods:
+        Write(text:str) -> None
+        Flush() -> None
+        Close() -> None
+        Emit(text:str) -> None
+        Get_Text() -> str
+        Clear() -> None
+    """
+
+    # Constructor
+    def __init__(self, flush_bytes:int|None=None, flush_interval:float|None=None):
+        """
+        Constructor for the Output_Sink class.
+
+        Parameters:
+            flush_bytes (int): The number of pending bytes that triggers a flush.
+                Defaults to 256.
+            flush_interval (float): The number of seconds after which pending text is flushed on the next write.
+                Defaults to 0.05.
+        """
+
+        # Handle Defaults
+        if flush_bytes is None:
+            flush_bytes = DEFAULT_SINK_FLUSH_BYTES
+        if flush_interval is None:
+            flush_interval = DEFAULT_SINK_FLUSH_INTERVAL
+
+        # Set properties
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.__pending = []
+        self.__pending_bytes = 0
+        self.__collected = []
+        self.__last_flush = time.monotonic()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Write(self, text:str) -> None:
+        """
+        Buffers the given text, flushing if enough text is pending or enough time has passed.
+
+        Parameters:
+            text (str): The text to write.
+
+        Returns:
+            None
+        """
+
+        # Skip empty writes
+        if not text:
+            return None
+
+        with self.__lock:
+            self.__pending.append(text)
+            self.__collected.append(text)
+            self.__pending_bytes += len(text.encode("utf-8"))
+            should_flush = (self.__pending_bytes >= self.flush_bytes) or (time.monotonic() - self.__last_flush >= self.flush_interval)
+
+        # Flush the pending text
+        if should_flush:
+            self.Flush()
+    # End of Write
+
+    def Flush(self) -> None:
+        """
+        Hands the pending text to Emit as a single chunk.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            chunk = "".join(self.__pending)
+            self.__pending = []
+            self.__pending_bytes = 0
+            self.__last_flush = time.monotonic()
+
+            # Emit the chunk
+            if chunk:
+                self.Emit(chunk)
+    # End of Flush
+
+    def Close(self) -> None:
+        """
+        Flushes the pending text and releases the sink's resources.
+        """
+        self.Flush()
+    # End of Close
+
+    @abc.abstractmethod
+    def Emit(self, text:str) -> None:
+        """
+        Sends a coalesced chunk of text to the sink's destination.
+        """
+    # End of Emit
+
+    def Get_Text(self) -> str:
+        """
+        Returns all the text written to the sink since it was created or last cleared.
+
+        Parameters:
+            None
+
+        Returns:
+            text (str): The collected text.
+        """
+
+        with self.__lock:
+            text = "".join(self.__collected)
+            self.__collected = [text]
+
+        # Return the text
+        return text
+    # End of Get_Text
+
+    def Clear(self) -> None:
+        """
+        Forgets the collected text, so the sink can be reused for the next response.
+        """
+
+        with self.__lock:
+            self.__collected = []
+    # End of Clear
+# End of Output_Sink Class
+
+# Stdout Sink Class
+class Stdout_Sink(Output_Sink):
+    """
+    Stdout Sink Class
+
+    Writes coalesced chunks of text to standard output.
+    """
+
+    def Emit(self, text:str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    # End of Emit
+# End of Stdout_Sink Class
+
+# File Sink Class
+class File_Sink(Output_Sink):
+    """
+    File Sink Class
+
+    Appends coalesced chunks of text to a file.
+
+    Properties:
+        file (TextIO): The file text is written to.
+    """
+
+    # Constructor
+    def __init__(self, file:str|io.TextIOBase, flush_bytes:int|None=None, flush_interval:float|None=None):
+        """
+        Constructor for the File_Sink class.
+
+        Parameters:
+            file (str|TextIO): The path of the file to append to, or an open text file.
+            flush_bytes (int): See Output_Sink.
+            flush_interval (float): See Output_Sink.
+        """
+
+        super().__init__(flush_bytes=flush_bytes, flush_interval=flush_interval)
+
+        # Open the file if a path was given
+        self.__owns_file = isinstance(file, str)
+        self.file = open(file, "a", encoding="utf-8") if self.__owns_file else file
+    # End of Constructor
+
+    def Emit(self, text:str) -> None:
+        self.file.write(text)
+        self.file.flush()
+    # End of Emit
+
+    def Close(self) -> None:
+        self.Flush()
+        if self.__owns_file:
+            self.file.close()
+    # End of Close
+# End of File_Sink Class
+
+# Buffer Sink Class
+class Buffer_Sink(Output_Sink):
+    """
+    Buffer Sink Class
+
+    Keeps the streamed text in memory only. Read it with Get_Text once the stream ends.
+    """
+
+    def Emit(self, text:str) -> None:
+        return None
+    # End of Emit
+# End of Buffer_Sink Class
+
+# Callback Sink Class
+class Callback_Sink(Output_Sink):
+    """
+    Callback Sink Class
+
+    Passes coalesced chunks of text to a callback, for example to forward them to a socket or a web response.
+
+    Properties:
+        callback (Callable[[str], None]): The function called with every chunk.
+    """
+
+    # Constructor
+    def __init__(self, callback:Callable[[str], None], flush_bytes:int|None=None, flush_interval:float|None=None):
+        """
+        Constructor for the Callback_Sink class.
+
+        Parameters:
+            callback (Callable[[str], None]): The function called with every chunk.
+            flush_bytes (int): See Output_Sink.
+            flush_interval (float): See Output_Sink.
+        """
+
+        super().__init__(flush_bytes=flush_bytes, flush_interval=flush_interval)
+        self.callback = callback
+    # End of Constructor
+
+    def Emit(self, text:str) -> None:
+        self.callback(text)
+    # End of Emit
+# End of Callback_Sink Class
+
+"""
+Response Events
+"""
+
+# Response Event Constants
+RESPONSE_EVENT_ENUM = ["text delta", "tool calls", "citation", "message completed", "run completed", "usage"]
+TERMINAL_RUN_EVENTS = ["thread.run.completed", "thread.run.failed", "thread.run.cancelled", "thread.run.expired", "thread.run.incomplete"]
+
+# Response Event Class
+class Response_Event:
+    """
+    Response Event Class
+
+    A typed event yielded by Assistant.Stream_Response.
+
+    Properties:
+        type (str): The type of the event. One of "text delta", "tool calls", "citation", "message completed", "run completed" or "usage".
+        value: The payload of the event:
+            "text delta" -> str, the text fragment
+            "tool calls" -> list[RequiredActionFunctionToolCall], the function calls requested by the run
+            "citation" -> dict, with the "index", "text", "file id" and "filename" of a file citation
+            "message completed" -> Message, the completed message
+            "run completed" -> Run, the run in its final state (check its status)
+            "usage" -> RunUsage, the token usage of the run
+    """
+
+    # Constructor
+    def __init__(self, type:str, value:object):
+        """
+        Constructor for the Response_Event class.
+
+        Parameters:
+            type (str): The type of the event.
+            value: The payload of the event.
+        """
+
+        # Set properties
+        self.type = type
+        self.value = value
+    # End of Constructor
+
+    def __repr__(self) -> str:
+        return f"Response_Event(type={self.type!r}, value={self.value!r})"
+    # End of __repr__
+
+    @staticmethod
+    def From_Stream_Event(event:AssistantStreamEvent) -> list["Response_Event"]:
+        """
+        Converts the stream events that need no API call into response events. Tool calls and citations are handled by the caller.
+
+        Parameters:
+            event (AssistantStreamEvent): A server sent event of a run stream.
+
+        Returns:
+            response_events (list[Response_Event]): The matching response events, possibly empty.
+        """
+
+        # Variable initialization
+        response_events = []
+
+        # Text deltas
+        if event.event == "thread.message.delta":
+            for content in event.data.delta.content or []:
+                if (content.type == "text") and (content.text is not None) and content.text.value:
+                    response_events.append(Response_Event("text delta", content.text.value))
+            # Loop End
+
+        # Completed messages
+        elif event.event == "thread.message.completed":
+            response_events.append(Response_Event("message completed", event.data))
+
+        # Run completion and usage
+        elif event.event in TERMINAL_RUN_EVENTS:
+            response_events.append(Response_Event("run completed", event.data))
+            if event.data.usage is not None:
+                response_events.append(Response_Event("usage", event.data.usage))
+
+        # Return the response events
+        return response_events
+    # End of From_Stream_Event
+
+    @staticmethod
+    def From_Citations(message:Message, filenames:dict[str, str]) -> list["Response_Event"]:
+        """
+        Builds a citation event for every file citation of a completed message.
+
+        Parameters:
+            message (Message): The completed message.
+            filenames (dict[str, str]): A dictionary mapping file IDs to file names.
+
+        Returns:
+            response_events (list[Response_Event]): The citation events, in annotation order.
+        """
+
+        # Variable initialization
+        response_events = []
+
+        # Build the citation events
+        for content in message.content:
+            if content.type != "text":
+                continue
+            for index, annotation in enumerate(content.text.annotations):
+                if file_citation := getattr(annotation, "file_citation", None):
+                    response_events.append(Response_Event("citation", {
+                        "index": index,
+                        "text": annotation.text,
+                        "file id": file_citation.file_id,
+                        "filename": filenames.get(file_citation.file_id, file_citation.file_id)
+                    }))
+            # Loop End
+        # Loop End
+
+        # Return the citation events
+        return response_events
+    # End of From_Citations
+
+    @staticmethod
+    def Get_Cited_File_IDs(message:Message) -> list[str]:
+        """
+        Returns the IDs of the files cited by a message.
+        """
+        return [
+            annotation.file_citation.file_id
+            for content in message.content if content.type == "text"
+            for annotation in content.text.annotations if getattr(annotation, "file_citation", None)
+        ]
+    # End of Get_Cited_File_IDs
+# End of Response_Event Class
+
+"""
+Response Cache
+"""
+
+# Response Cache Constants
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_RESPONSE_CACHE_TTL = 86400 # Seconds
+
+# Response Cache Base Class
+class Response_Cache(abc.ABC):
+    """
+    Response Cache Base Class
+
+    A cache of assistant responses for deterministic deployments, keyed by a namespace and a normalized prompt.
+    The namespace is a digest of everything that changes the answer to a prompt: the assistant's configuration and the contents of its vector store.
+    Subclass this class and implement Get, Set, Invalidate and Clear to add a new storage backend.
+    Entries are dictionaries of the form {"messages": list[dict]}, holding the JSON form of the response messages.
+
+    Properties:
+        time_to_live (float): The number of seconds an entry is kept before it expires.
+
+    Methods:
+        Get_Namespace(configuration:dict) -> str [static]
+        Normalize_Prompt(prompt:str) -> str [static]
+        Get_Key(namespace:str, prompt:str) -> str [static]
+        Get(key:str) -> dict|None
+        Set(key:str, entry:dict, time_to_live:float|None=None) -> None
+        Invalidate(namespace:str) -> None
+        Clear() -> None
+    """
+
+    time_to_live:float = DEFAULT_RESPONSE_CACHE_TTL
+    """The number of seconds an entry is kept before it expires."""
+
+    @staticmethod
+    def Get_Namespace(configuration:dict) -> str:
+        """
+        Returns the SHA-256 hex digest of a configuration dictionary. Key order does not matter.
+
+        Parameters:
+            configuration (dict): A JSON serializable dictionary of everything the response depends on.
+
+        Returns:
+            namespace (str): The namespace of the configuration.
+        """
+        return hashlib.sha256(json.dumps(configuration, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    # End of Get_Namespace
+
+    @staticmethod
+    def Normalize_Prompt(prompt:str) -> str:
+        """
+        Returns the prompt with its case folded and its whitespace collapsed, so trivially different prompts share an entry.
+
+        Parameters:
+            prompt (str): The user prompt.
+
+        Returns:
+            prompt (str): The normalized prompt.
+        """
+        return " ".join(prompt.casefold().split())
+    # End of Normalize_Prompt
+
+    @staticmethod
+    def Get_Key(namespace:str, prompt:str) -> str:
+        """
+        Returns the cache key of a prompt within a namespace.
+
+        Parameters:
+            namespace (str): The namespace returned by Get_Namespace.
+            prompt (str): The user prompt.
+
+        Returns:
+            key (str): The cache key.
+        """
+        return f"{namespace}:{hashlib.sha256(Response_Cache.Normalize_Prompt(prompt).encode()).hexdigest()}"
+    # End of Get_Key
+
+    @abc.abstractmethod
+    def Get(self, key:str) -> dict|None:
+        """
+        Returns the entry stored under the given key, or None if there is no entry or it has expired.
+        """
+    # End of Get
+
+    @abc.abstractmethod
+    def Set(self, key:str, entry:dict, time_to_live:float|None=None) -> None:
+        """
+        Stores the entry under the given key for time_to_live seconds, or for the cache's time to live, replacing any previous entry.
+        """
+    # End of Set
+
+    @abc.abstractmethod
+    def Invalidate(self, namespace:str) -> None:
+        """
+        Removes every entry of the given namespace.
+        """
+    # End of Invalidate
+
+    @abc.abstractmethod
+    def Clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+    # End of Clear
+# End of Response_Cache Class
+
+# Memory Response Cache Class
+class Memory_Response_Cache(Response_Cache):
+    """
+    Memory Response Cache Class
+
+    An in memory response cache that evicts the least recently used entry once it holds more than max_entries entries.
+
+    Properties:
+        max_entries (int): The maximum number of entries kept in the cache.
+        time_to_live (float): The number of seconds an entry is kept before it expires.
+    """
+
+    # Constructor
+    def __init__(self, max_entries:int|None=None, time_to_live:float|None=None):
+        """
+        Constructor for the Memory_Response_Cache class.
+
+        Parameters:
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to 1024.
+            time_to_live (float): The number of seconds an entry is kept before it expires.
+                Defaults to 86400 (one day).
+        """
+
+        # Handle Defaults
+        if max_entries is None:
+            max_entries = DEFAULT_RESPONSE_CACHE_SIZE
+        if time_to_live is None:
+            time_to_live = DEFAULT_RESPONSE_CACHE_TTL
+
+        # Set properties
+        self.max_entries = max_entries
+        self.time_to_live = time_to_live
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Get(self, key:str) -> dict|None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            # Evict expired entries
+            if (entry is None) or (entry[1] <= time.time()):
+                self.__entries.pop(key, None)
+                return None
+
+            # Mark the entry as recently used
+            self.__entries.move_to_end(key)
+            return json.loads(entry[0])
+    # End of Get
+
+    def Set(self, key:str, entry:dict, time_to_live:float|None=None) -> None:
+        # Handle Defaults
+        if time_to_live is None:
+            time_to_live = self.time_to_live
+
+        with self.__lock:
+            self.__entries[key] = (json.dumps(entry), time.time() + time_to_live)
+            self.__entries.move_to_end(key)
+
+            # Evict the least recently used entries
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+    # End of Set
+
+    def Invalidate(self, namespace:str) -> None:
+        with self.__lock:
+            for key in [key for key in self.__entries if key.startswith(f"{namespace}:")]:
+                del self.__entries[key]
+            # Loop End
+    # End of Invalidate
+
+    def Clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+    # End of Clear
+# End of Memory_Response_Cache Class
+
+# SQLite Response Cache Class
+class SQLite_Response_Cache(Response_Cache):
+    """
+    SQLite Response Cache Class
+
+    An on disk response cache backed by a SQLite database, so responses are remembered across process restarts and shared between processes.
+    When max_entries is given, the least recently used entries are evicted once the cache grows past it.
+
+    Properties:
+        database_path (str): The path of the SQLite database file.
+        max_entries (int|None): The maximum number of entries kept in the cache, or None for no limit.
+        time_to_live (float): The number of seconds an entry is kept before it expires.
+    """
+
+    # Constructor
+    def __init__(self, database_path:str, max_entries:int|None=None, time_to_live:float|None=None):
+        """
+        Constructor for the SQLite_Response_Cache class. Creates the database file and table if they do not exist.
+
+        Parameters:
+            database_path (str): The path of the SQLite database file.
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to None (no limit).
+            time_to_live (float): The number of seconds an entry is kept before it expires.
+                Defaults to 86400 (one day).
+        """
+
+        # Handle Defaults
+        if time_to_live is None:
+            time_to_live = DEFAULT_RESPONSE_CACHE_TTL
+
+        # Set properties
+        self.database_path = database_path
+        self.max_entries = max_entries
+        self.time_to_live = time_to_live
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(database_path, check_same_thread=False)
+
+        # Create the table
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, entry TEXT NOT NULL, expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+    # End of Constructor
+
+    def Get(self, key:str) -> dict|None:
+        with self.__lock, self.__connection:
+            row = self.__connection.execute(
+                "SELECT entry, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # Evict expired entries
+            if row[1] <= time.time():
+                self.__connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+
+            # Mark the entry as recently used
+            self.__connection.execute(
+                "UPDATE response_cache SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            return json.loads(row[0])
+    # End of Get
+
+    def Set(self, key:str, entry:dict, time_to_live:float|None=None) -> None:
+        # Handle Defaults
+        if time_to_live is None:
+            time_to_live = self.time_to_live
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO response_cache (key, entry, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry), time.time() + time_to_live, time.time())
+            )
+
+            # Evict the expired, then the least recently used entries
+            self.__connection.execute("DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),))
+            if self.max_entries is not None:
+                self.__connection.execute(
+                    "DELETE FROM response_cache WHERE key NOT IN "
+                    "(SELECT key FROM response_cache ORDER BY last_used DESC LIMIT ?)", (self.max_entries,)
+                )
+    # End of Set
+
+    def Invalidate(self, namespace:str) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM response_cache WHERE key LIKE ?", (f"{namespace}:%",))
+    # End of Invalidate
+
+    def Clear(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM response_cache")
+    # End of Clear
+# End of SQLite_Response_Cache Class
+
+# Tiered Response Cache Class
+class Tiered_Response_Cache(Response_Cache):
+    """
+    Tiered Response Cache Class
+
+    Combines a fast response cache, usually in memory, in front of a larger one, usually on disk.
+    Lookups try the fast tier first, and entries found in the slow tier are copied into the fast tier.
+
+    Properties:
+        fast_cache (Response_Cache): The tier looked up first.
+        slow_cache (Response_Cache): The tier looked up when the fast tier misses.
+    """
+
+    # Constructor
+    def __init__(self, fast_cache:Response_Cache, slow_cache:Response_Cache):
+        """
+        Constructor for the Tiered_Response_Cache class.
+
+        Parameters:
+            fast_cache (Response_Cache): The tier looked up first, for example a Memory_Response_Cache.
+            slow_cache (Response_Cache): The tier looked up when the fast tier misses, for example a SQLite_Response_Cache.
+        """
+
+        # Set properties
+        self.fast_cache = fast_cache
+        self.slow_cache = slow_cache
+    # End of Constructor
+
+    def Get(self, key:str) -> dict|None:
+        # Look up the fast tier
+        entry = self.fast_cache.Get(key)
+        if entry is not None:
+            return entry
+
+        # Promote entries of the slow tier
+        entry = self.slow_cache.Get(key)
+        if entry is not None:
+            self.fast_cache.Set(key, entry)
+        return entry
+    # End of Get
+
+    def Set(self, key:str, entry:dict, time_to_live:float|None=None) -> None:
+        self.fast_cache.Set(key, entry, time_to_live)
+        self.slow_cache.Set(key, entry, time_to_live)
+    # End of Set
+
+    def Invalidate(self, namespace:str) -> None:
+        self.slow_cache.Invalidate(namespace)
+        self.fast_cache.Invalidate(namespace)
+    # End of Invalidate
+
+    def Clear(self) -> None:
+        self.slow_cache.Clear()
+        self.fast_cache.Clear()
+    # End of Clear
+# End of Tiered_Response_Cache Class
+
+"""
+Assistant
+"""
+
+# Assistant Constants
+DEFAULT_MODEL = "gpt-3.5-turbo-0125"
+DEFAULT_MESSAGE_HISTORY_LENGTH = 25
+DEFAULT_MESSAGE_CACHE_SIZE = 1000 # Messages cached per thread
+MAX_CACHED_THREADS = 16
+MESSAGE_ORDER_ENUM = ["asc", "desc"]
+DEFAULT_POLL_INTERVAL = 0.5 # Seconds
+DEFAULT_MAX_POLL_INTERVAL = 8 # Seconds
+POLL_BACKOFF_FACTOR = 1.5
+DEFAULT_POLL_WORKERS = 8
+TERMINAL_RUN_STATUSES = ["completed", "failed", "cancelled", "expired", "incomplete"]
+SNAPSHOT_VERSION = 1
+DEFAULT_MAX_PROMPT_TOKENS = 10000 # OpenAI recommends at least 20,000 prompt tokens for best results
+DEFAULT_MAX_COMPLETION_TOKENS = 10000
+DEFAULT_MODEL_PARAMETERS = {
+    "temperature": 1.0,
+    "top_p": 1.0
+}
+
+def Get_Run_Parameters(message_history_length:int, max_prompt_tokens:int, max_completion_tokens:int) -> dict:
+    """
+    Returns the token budgets and truncation strategy of a run, shared by the Assistant and AsyncAssistant classes.
+
+    Parameters:
+        message_history_length (int): The number of previous messages sent with every run, or 0 to let the API truncate the thread.
+        max_prompt_tokens (int): The maximum number of prompt tokens of a run.
+        max_completion_tokens (int): The maximum number of completion tokens of a run.
+
+    Returns:
+        run_parameters (dict): The max_prompt_tokens, max_completion_tokens and truncation_strategy run parameters.
+    """
+    if message_history_length > 0:
+        truncation_strategy = {"type": "last_messages", "last_messages": message_history_length}
+    else:
+        truncation_strategy = {"type": "auto"}
+
+    return {
+        "max_prompt_tokens": max_prompt_tokens,
+        "max_completion_tokens": max_completion_tokens,
+        "truncation_strategy": truncation_strategy
+    }
+# Function End
+
+# Assistant Class
+class Assistant:
+    """
+    This class is designed to abstract interactions with the OpenAI Assistant
+
+    Properties
+        client (OpenAI): The OpenAI client instance
+        id (str): The ID of the assistant
+        name (str): The name of the assistant
+        instructions (str): The assistant's context prompt
+        tool_set (list): A list of tool dictionaries
+        model (str): The model to use for the assistant
+        model_parameters (dict): The parameters for the model
+        max_prompt_tokens (int): The maximum number of prompt tokens
+        max_completion_tokens (int): The maximum number of completion tokens
+        message_history_length (int): The number of most recent thread messages sent with each run, 0 lets the API truncate automatically
+        last_run_usage (dict|None): The token usage of the last run
+        token_usage (dict): The token usage of every run of this instance
+        vector_store (Vector_Storage): The internal vector store, created on first use in lazy mode
+        intance (openai.types.beta.Assistant): The OpenAI Assistant instance
+        thread (openai.types.beta.Thread): The Assistant Thread instance, created on first use in lazy mode
+        created_resources (dict): Flags indicating which of the assistant, vector store and thread were created (or taken from the resource pool) by this instance
+        resource_pool (Resource_Pool): The pool threads and vector stores are taken from, if any
+        response_cache (Response_Cache|None): The cache Ask answers repeated prompts from, if any
+        message_cache_size (int): The number of newest messages of each thread kept by Iterate_Messages
+        deletion_report (dict|None): The report of the last Delete_Assistant call
+
+    Methods
+        Delete_Assistant(clear_vector_store:bool|None=None, max_workers:int|None=None) -> bool
+        Attach_Files(file_paths:list[str], max_workers:int|None=None) -> list[str]
+        Update_Tool_Set(tool_set:list) -> bool
+        Send_Message(message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None, thread_id:str|None=None) -> Message
+        Iterate_Messages(thread_id:str|None=None, order:str|None=None, after:str|None=None, before:str|None=None) -> Iterator[Message]
+        Clear_Message_Cache(thread_id:str|None=None) -> None
+        Get_Response(event_handler:AssistantEventHandler, thread_id:str|None=None, sink:Output_Sink|None=None) -> None
+        Stream_Response(event_handler:type|None=None, thread_id:str|None=None) -> Iterator[Response_Event]
+        Ask(message_content:str, event_handler:type|None=None, sink:Output_Sink|None=None) -> bool
+        Start_Run(thread_id:str|None=None) -> Run
+        Poll_Runs(runs:list[Run], event_handler:type|None=None, poll_interval:float|None=None, max_poll_interval:float|None=None, timeout:float|None=None) -> list[dict]
+        Run_To_Completion(thread_id:str|None=None, event_handler:type|None=None, poll_interval:float|None=None, max_poll_interval:float|None=None, timeout:float|None=None) -> dict
+        Get_Response_Cache_Namespace() -> str
+        Invalidate_Response_Cache() -> None
+        Get_Run_Parameters() -> dict
+        Get_Snapshot() -> dict
+        Save_Snapshot(file_path:str) -> None
+        From_Snapshot(client:OpenAI, snapshot:dict|str, verify:bool|None=None, upload_cache:Upload_Cache|None=None, resource_pool:Resource_Pool|None=None, response_cache:Response_Cache|None=None) -> Assistant [class]
+        Get_Attributes() -> dict
+        Get_Vector_Store() -> Vector_Storage
+    """
+
+    # Properties
+    client:OpenAI
+    """The OpenAI client used to communicate with the OpenAI API."""
+    id:str|None = None
+    """The ID of the assistant."""
+    name:str|None = None
+    """The name of the assistant."""
+    instructions:str|None = None
+    """The assistant's context prompt."""
+    tool_set:list|None = None
+    """A list of tool dictionaries."""
+    model:str|None = None
+    """The model to use for the assistant."""
+    model_parameters:dict|None = None
+    """The parameters for the model."""
+    max_prompt_tokens:int|None = None
+    """The maximum number of prompt tokens."""
+    max_completion_tokens:int|None = None
+    """The maximum number of completion tokens."""
+    message_history_length:int|None = None
+    """The number of most recent thread messages sent with each run."""
+    last_run_usage:dict|None = None
+    """The token usage of the last run."""
+    token_usage:dict
+    """The token usage of every run of this instance."""
+    intance:Beta_Types.Assistant
+    """The OpenAI Assistant instance."""
+    created_resources:dict
+    """Flags indicating which of the assistant, vector store and thread were created by this instance."""
+    response_cache:Response_Cache|None = None
+    """The cache Ask answers repeated prompts from."""
+    message_cache_size:int = DEFAULT_MESSAGE_CACHE_SIZE
+    """The number of newest messages of each thread kept by Iterate_Messages."""
+    deletion_report:dict|None = None
+    """The report of the last Delete_Assistant call."""
+
+    # Constructor
+    def __init__(
+            self, client:OpenAI, assistant_id:str|None=None, assistant_name:str|None=None, instruction_prompt:str|None=None, tool_set:list|None=None,
+            model:str|None=None, model_parameters:dict|None=None,
+            max_prompt_tokens:int|None=None, max_completion_tokens:int|None=None,
+            upload_cache:Upload_Cache|None=None, lazy:bool|None=None, resource_pool:Resource_Pool|None=None,
+            message_history_length:int|None=None, response_cache:Response_Cache|None=None
+        ):
+        """
+        This class is designed to abstract interactions with the OpenAI Assistant.
+        
+        Parameters
+        ----------
+            client (OpenAI): The OpenAI client used to communicate with the OpenAI API. | REQUIRED
+            assistant_id (str): The id of the assistant you would like to connect to. If None or left blank, a new assistant will be created. When connecting to a preexisting assistant, all other parameters will be used to modify the assistant. | OPTIONAL | DEFAULT: None
+            assistant_name (str): The name of the assistant. | OPTIONAL | DEFAULT: "Assistant"
+            instruction_prompt (str): The assistant's context prompt | OPTIONAL | DEFAULT: "You are a simple chat bot."
+            tool_set (list): A list of tool dictionaries. | OPTIONAL | DEFAULT: [ {"type": "file_search"} ]
+            model (str): The model to use for the assistant. | OPTIONAL | DEFAULT: "gpt-3.5-turbo-0125"
+            model_parameters (dict): The parameters for the model. | OPTIONAL | DEFAULT: {temperature: 1.0, top_p: 1.0}
+            max_prompt_tokens (int): The maximum number of prompt tokens. | OPTIONAL | DEFAULT: 10000
+            max_completion_tokens (int): The maximum number of completion tokens. | OPTIONAL | DEFAULT: 10000
+            upload_cache (Upload_Cache): A cache used by the internal vector store to skip re-uploading identical files. | OPTIONAL | DEFAULT: None
+            lazy (bool): Defers creating the vector store and thread until they are first used. Connecting to an existing assistant then costs a single request. | OPTIONAL | DEFAULT: False
+            resource_pool (Resource_Pool): A pool of pre-created threads and vector stores to take from instead of creating new ones. | OPTIONAL | DEFAULT: None
+            message_history_length (int): The number of most recent thread messages sent with each run. 0 lets the API truncate the thread automatically. | OPTIONAL | DEFAULT: 25
+            response_cache (Response_Cache): A cache of responses used by Ask to answer repeated prompts without a run. | OPTIONAL | DEFAULT: None
+        """
+        # Variable initialization
+        started_at = time.perf_counter()
+
+        # Handle Defaults
+        if assistant_name is None:
+            assistant_name = "Assistant"
+        if instruction_prompt is None:
+            instruction_prompt = "You are a simple chat bot."
+        if (model_parameters is None) or (len(model_parameters.keys()) == 0):
+            model_parameters = DEFAULT_MODEL_PARAMETERS
+        if model is None:
+            model = DEFAULT_MODEL
+        if (tool_set is None) or (len(tool_set) == 0):
+            tool_set = [
+                {
+                    "type": "file_search"
+                }
+            ]
+        if max_prompt_tokens is None:
+            max_prompt_tokens = DEFAULT_MAX_PROMPT_TOKENS
+        if max_completion_tokens is None:
+            max_completion_tokens = DEFAULT_MAX_COMPLETION_TOKENS
+        if lazy is None:
+            lazy = False
+        if message_history_length is None:
+            message_history_length = DEFAULT_MESSAGE_HISTORY_LENGTH
+
+        # Verify file_search tool is present
+        tool_set = self.__Verify_File_Search_Tool(tool_set)
+        
+        # Set properties
+        self.client = client
+        self.name = assistant_name
+        self.instructions = instruction_prompt
+        self.tool_set = tool_set
+        self.model = model
+        self.model_parameters = model_parameters
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_completion_tokens = max_completion_tokens
+        self.message_history_length = message_history_length
+        self.last_run_usage = None
+        self.token_usage = {"runs": 0, "prompt tokens": 0, "completion tokens": 0, "total tokens": 0}
+        self.__usage_lock = threading.Lock()
+        self.upload_cache = upload_cache
+        self.resource_pool = resource_pool
+        self.response_cache = response_cache
+        self.created_resources = {
+            "assistant": False,
+            "vector store": False,
+            "thread": False
+        }
+        self.__vector_store = None
+        self.__vector_store_lock = threading.Lock()
+        self.__thread = None
+        self.__thread_lock = threading.Lock()
+        self.__message_cache = OrderedDict()
+        self.__message_cache_lock = threading.Lock()
+
+        # Lazy mode, only connect to the assistant
+        if lazy:
+            self.__Connect_Assistant(assistant_id)
+
+        # Create the thread while the vector store and assistant are set up
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                thread_future = executor.submit(self.__Create_Thread)
+                self.__Create_Vector_Store()
+                self.__Connect_Assistant(assistant_id)
+                thread_future.result()
+
+        # Record the construction time
+        Get_Metrics_Recorder().Record_Timing("assistant.init", time.perf_counter() - started_at, {"lazy": str(lazy)})
+    # End of Constructor
+
+    def __Connect_Assistant(self, assistant_id:str|None) -> None:
+        """
+        Internal method that updates the assistant with the given ID, or creates a new assistant if there is none.
+        The vector store is only attached to the assistant if it has already been created.
+
+        Parameters
+            assistant_id (str): The ID of the assistant to connect to | OPTIONAL
+
+        Returns
+            None
+        """
+
+        # Assistant payload
+        assistant_payload = {
+            "model": self.model,
+            "name": self.name,
+            "instructions": self.instructions,
+            "tools": self.tool_set,
+            "temperature": self.model_parameters["temperature"],
+            "top_p": self.model_parameters["top_p"],
+        }
+        if self.__vector_store is not None:
+            assistant_payload["tool_resources"] = {
+                "file_search": {
+                    "vector_store_ids": [
+                        self.__vector_store.intance.id
+                    ]
+                }
+            }
+
+        # Connect to a preexisting assistant
+        if assistant_id is not None:
+            try:
+                # Modify properties
+                self.intance = self.client.beta.assistants.update(
+                    assistant_id=assistant_id,
+                    **assistant_payload
+                )
+                self.id = assistant_id # Set id if successfully updated
+                return None
+            except (BadRequestError, NotFoundError):
+                # A malformed or unknown ID creates a new assistant
+                pass
+
+        # Create assistant
+        self.intance = self.client.beta.assistants.create(**assistant_payload)
+        self.id = self.intance.id
+        self.created_resources["assistant"] = True
+    # Function End
+
+    def __Create_Vector_Store(self) -> Vector_Storage:
+        """
+        Internal method that creates the internal vector store.
+
+        Parameters
+            None
+
+        Returns
+            vector_store (Vector_Storage): The new vector store
+        """
+
+        # Take the internal vector store from the pool
+        if self.resource_pool is not None:
+            self.__vector_store = self.resource_pool.Acquire_Vector_Store()
+            self.__vector_store.upload_cache = self.upload_cache
+
+        # Create internal vector store
+        else:
+            self.__vector_store = Vector_Storage(
+                openai_client=self.client,
+                name=f"{self.name}_Vector_Store",
+                life_time=1,
+                upload_cache=self.upload_cache
+            )
+        self.created_resources["vector store"] = True
+
+        # Return the vector store
+        return self.__vector_store
+    # Function End
+
+    def __Create_Thread(self) -> Beta_Types.Thread:
+        """
+        Internal method that creates the assistant's thread.
+
+        Parameters
+            None
+
+        Returns
+            thread (Thread): The new thread
+        """
+
+        # Take the thread from the pool
+        if self.resource_pool is not None:
+            self.__thread = self.resource_pool.Acquire_Thread()
+
+        # Initialize thread
+        else:
+            self.__thread = self.client.beta.threads.create()
+        self.created_resources["thread"] = True
+
+        # Return the thread
+        return self.__thread
+    # Function End
+
+    @property
+    def vector_store(self) -> Vector_Storage:
+        """
+        The internal vector store. In lazy mode it is created, and attached to the assistant, on first use.
+        An assistant holds a single vector store, so attaching it replaces any vector store the connected assistant already used,
+        as the constructor does outside of lazy mode. The replaced vector store is not deleted.
+        Concurrent first uses wait for a single vector store to be created and attached.
+        """
+
+        # Create the vector store on first use, replacing the assistant's previous vector store
+        with self.__vector_store_lock:
+            if self.__vector_store is None:
+                self.__Create_Vector_Store()
+                self.intance = self.client.beta.assistants.update(
+                    assistant_id=self.id,
+                    tool_resources={
+                        "file_search": {
+                            "vector_store_ids": [
+                                self.__vector_store.intance.id
+                            ]
+                        }
+                    }
+                )
+
+            # Return the vector store
+            return self.__vector_store
+    # Function End
+
+    @vector_store.setter
+    def vector_store(self, vector_store:Vector_Storage) -> None:
+        with self.__vector_store_lock:
+            self.__vector_store = vector_store
+    # Function End
+
+    @property
+    def thread(self) -> Beta_Types.Thread:
+        """The Assistant Thread instance. In lazy mode it is created on first use, once even when first used concurrently."""
+
+        # Create the thread on first use
+        with self.__thread_lock:
+            if self.__thread is None:
+                self.__Create_Thread()
+
+            # Return the thread
+            return self.__thread
+    # Function End
+
+    @thread.setter
+    def thread(self, thread:Beta_Types.Thread) -> None:
+        with self.__thread_lock:
+            self.__thread = thread
+    # Function End
+
+    def __Verify_File_Search_Tool(self, tool_set:list) -> list:
+        """
+        Verifies that the file_search tool is present in the tool set. If not, adds it.
+
+        Parameters
+            tool_set (list): A list of tool dictionaries
+        
+        Returns
+            tool_set (list): The updated tool set
+        """
+        
+        # Variable initialization
+        tools_present = {
+            'function': 0,
+            'file_search': 0,
+            'code_interpreter': 0
+        }
+
+        # Check for file_search tool
+        for tool in tool_set:
+            tools_present[tool["type"]] += 1
+
+        # Add file_search tool if not present
+        if tools_present["file_search"] == 0:
+            tool_set.append({
+                "type": "file_search"
+            })
+
+        # Return tool set
+        return tool_set
+    # Function End
+
+    def Delete_Assistant(self, clear_vector_store:bool|None=None, max_workers:int|None=None) -> bool:
+        """
+        Deletes the assistant. Call this method once you are done using the assistant.
+        A report of what was deleted, or failed to delete, is stored in the deletion_report property.
+
+        Parameters
+            Clear_Vector_Store (bool): A flag to delete the files attached to the internal vector store. | OPTIONAL
+            max_workers (int): The maximum number of concurrent file deletions | OPTIONAL | DEFAULT: 8
+
+        Returns
+            deletion_object.status (bool): The status of the operation
+        """
+
+        # Handle defaults
+        if clear_vector_store is None:
+            clear_vector_store = False
+
+        # get assistant id
+        assistant_id = self.intance.id
+
+        # Variable initialization
+        self.deletion_report = {
+            "assistant id": assistant_id,
+            "assistant deleted": False,
+            "vector store": None
+        }
+
+        # Delete vector store object, unless it was never created
+        if self.__vector_store is not None:
+            self.__vector_store.Delete_Vector_Store(
+                delete_attached=clear_vector_store,
+                max_workers=max_workers
+            )
+            self.deletion_report["vector store"] = self.__vector_store.deletion_report
+
+        # Delete assistant
+        deletion_object = self.client.beta.assistants.delete(
+            assistant_id=assistant_id
+        )
+        self.deletion_report["assistant deleted"] = deletion_object.deleted
+
+        # update instance
+        self.intance = None
+
+        # return status
+        return deletion_object.deleted
+    # Function End
+
+    def Attach_Files(self, file_paths:list[str]|None, max_workers:int|None=None) -> list[str]:
+        """
+        Takes in a list of file path strings and adds the repective files to the assistant's internal vector store.
+        The files are uploaded concurrently and indexed through vector store file batches.
+        Returns a list of file IDs in the same order as the file paths. Files that do not exist or failed to attach are returned as None.
+        Use Vector_Storage.Attach_New_Files for the per file failure details.
+
+        Parameters
+            file_paths (list): A list of file paths strings
+            max_workers (int): The maximum number of concurrent uploads | OPTIONAL | DEFAULT: 8
+
+        Returns
+            id_list (list): A list of file IDs
+        """
+
+        # Check if file paths are provided
+        if (file_paths is None) or (len(file_paths) == 0):
+            return []
+
+        # Forget the responses given without these files
+        self.Invalidate_Response_Cache()
+
+        # Send to vector store
+        results = self.vector_store.Attach_New_Files(file_paths=file_paths, max_workers=max_workers)
+
+        # return file IDs
+        return [
+            result["file id"] if result["status"] == "completed" else None
+            for result in results
+        ]
+    # Function End
+
+    def Update_Tool_Set(self, tool_set:list[dict]) -> bool:
+        """
+        Updates the assistant's tools.
+
+        Parameters
+            tool_Set (list): A list of tool dictionaries
+
+        Returns
+            (bool): The completions status of the operation
+        """
+
+        # Namespace of the responses given with the previous tools
+        previous_namespace = self.Get_Response_Cache_Namespace() if self.response_cache is not None else None
+
+        try:
+            # Update tool set
+            updated_assistant = self.client.beta.assistants.update(
+                assistant_id=self.intance.id,
+                tools=tool_set,
+            )
+
+            # update intance
+            self.intance = updated_assistant
+            self.tool_set = tool_set
+        except (BadRequestError, NotFoundError):
+            # return status
+            return False
+
+        # Forget the responses given with the previous tools, once they are replaced
+        if previous_namespace is not None:
+            self.response_cache.Invalidate(previous_namespace)
+
+        # return status
+        return True
+    # Function End
+    
+    def __Create_Message(self, role:str, content:str, attachment_id:str|None=None, thread_id:str|None=None) -> Message:
+        """
+        Internal Method to create a new message in the assistant's thread.
+
+        Parameters
+            role (str): The role of the originator of the message
+            content (str): The content of the message
+            attachment_id (str): The file ID of the attachment | OPTIONAL
+            thread_id (str): The ID of the thread to add the message to | OPTIONAL | DEFAULT: The assistant's thread
+
+        Returns
+            message (Message): The new message object
+        """
+        return self.client.beta.threads.messages.create(
+            thread_id=thread_id if thread_id is not None else self.thread.id,
+            role=role,
+            content=content,
+            attachments=[{
+                "file_id": attachment_id,
+                "tools": [{"type": "file_search"}]
+            }] if attachment_id is not None else None
+        )
+
+    def Send_Message(self, message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None, thread_id:str|None=None) -> Message:
+        """
+        Adds a new message to the assistant's thread
+        and returns the new message object.
+
+        Parameters
+            message_content (str): The text content of the message
+            attachment_path (str): The path to the attachment | OPTIONAL
+            attachment_file_id (str): The file ID of the attachment | OPTIONAL
+            thread_id (str): The ID of the thread to add the message to | OPTIONAL | DEFAULT: The assistant's thread
+        Returns
+            message (Message): The new message object
+        """        
+        # Variable initialization
+        message = None
+
+        # Attachment ID
+        if attachment_file_id is not None:
+            # Send message
+            message = self.__Create_Message(
+                role="user",
+                content=message_content,
+                attachment_id=attachment_file_id,
+                thread_id=thread_id
+            )
+
+        # Attachment Path
+        elif attachment_path is not None:
+            # Forget the responses given without this file
+            self.Invalidate_Response_Cache()
+
+            # Attach file to vector store
+            file_ID = self.vector_store.Attach_New_File(file_path=attachment_path)
+
+            # Send message
+            message = self.__Create_Message(
+                role="user",
+                content=message_content,
+                attachment_id=file_ID,
+                thread_id=thread_id
+            )
+
+        # No attachment
+        else:
+            # Send message
+            message = self.__Create_Message(
+                role="user",
+                content=message_content,
+                thread_id=thread_id
+            )
+        
+        # Return message
+        return message
+    # Function End
+
+    def Iterate_Messages(self, thread_id:str|None=None, order:str|None=None, after:str|None=None, before:str|None=None) -> Iterator[Message]:
+        """
+        Returns a generator of a thread's messages that fetches pages only as they are consumed.
+        The newest messages of every thread are kept in a local cache, bounded by message_cache_size, so newest first iteration
+        only requests the messages added since the last call and the pages older than the cache.
+
+        Parameters
+            thread_id (str): The ID of the thread | OPTIONAL | DEFAULT: The assistant's thread
+            order (str): "desc" for newest first or "asc" for oldest first | OPTIONAL | DEFAULT: "desc"
+            after (str): Start after the message with this ID, in the given order | OPTIONAL
+            before (str): Stop at the message with this ID, in the given order | OPTIONAL
+
+        Returns
+            messages (Iterator[Message]): The thread's messages in the given order
+        """
+        # Handle defaults
+        if thread_id is None:
+            thread_id = self.thread.id
+        if (order is None) or (order not in MESSAGE_ORDER_ENUM):
+            order = "desc"
+
+        # Variable initialization
+        messages_api = self.client.beta.threads.messages
+
+        # Oldest first, page straight through the API since the cache only holds the newest messages
+        if order == "asc":
+            for message in messages_api.list(thread_id=thread_id, order="asc", after=after, limit=LIST_PAGE_SIZE):
+                if message.id == before:
+                    return
+                yield message
+            # Loop End
+            return
+
+        with self.__message_cache_lock:
+            cache = self.__message_cache.pop(thread_id, None)
+            if cache is None:
+                cache = {"messages": [], "complete": False}
+
+            # Keep the most recently used threads
+            self.__message_cache[thread_id] = cache
+            while len(self.__message_cache) > MAX_CACHED_THREADS:
+                self.__message_cache.popitem(last=False)
+
+        # Start after a message outside the cache, page straight through the API
+        if (after is not None) and (after not in {message.id for message in cache["messages"]}):
+            for message in messages_api.list(thread_id=thread_id, order="desc", after=after, limit=LIST_PAGE_SIZE):
+                if message.id == before:
+                    return
+                yield message
+            # Loop End
+            return
+
+        # Fetch the messages added since the newest cached message, without caching unfinished ones
+        fresh = []
+        if len(cache["messages"]) > 0:
+            for message in messages_api.list(thread_id=thread_id, order="asc", after=cache["messages"][0].id, limit=LIST_PAGE_SIZE):
+                fresh.append(message)
+            # Loop End
+        with self.__message_cache_lock:
+            finished = list(itertools.takewhile(lambda message: message.status != "in_progress", fresh))
+            cache["messages"][:0] = reversed(finished)
+            if len(cache["messages"]) > self.message_cache_size:
+                del cache["messages"][self.message_cache_size:]
+                cache["complete"] = False
+            cached = list(cache["messages"])
+        fresh.reverse()
+
+        # Yield the fresh messages, then the cached ones
+        skipping = after is not None
+        for message in itertools.chain(fresh[:len(fresh) - len(finished)], cached):
+            if skipping:
+                skipping = message.id != after
+                continue
+            if message.id == before:
+                return
+            yield message
+        # Loop End
+        if cache["complete"]:
+            return
+
+        # Page through the older messages, extending the cache while it has room
+        caching = True
+        oldest_id = cached[-1].id if len(cached) > 0 else None
+        for message in messages_api.list(thread_id=thread_id, order="desc", after=oldest_id, limit=LIST_PAGE_SIZE):
+            with self.__message_cache_lock:
+                if caching:
+                    contiguous = (len(cache["messages"]) == 0) or (cache["messages"][-1].id == oldest_id)
+                    if (not contiguous) or (len(cache["messages"]) >= self.message_cache_size):
+                        caching = False
+                    elif message.status == "in_progress":
+                        # An unfinished message can only be left out while nothing is cached yet
+                        caching = len(cache["messages"]) == 0
+                    else:
+                        cache["messages"].append(message)
+                        oldest_id = message.id
+            if message.id == before:
+                return
+            yield message
+        # Loop End
+
+        # The whole thread is cached once every page was read
+        with self.__message_cache_lock:
+            if caching:
+                cache["complete"] = True
+    # Function End
+
+    def Clear_Message_Cache(self, thread_id:str|None=None) -> None:
+        """
+        Forgets the cached messages of a thread, or of every thread. Call it after modifying or deleting messages.
+
+        Parameters
+            thread_id (str): The ID of the thread | OPTIONAL | DEFAULT: Every thread
+
+        Returns
+            None
+        """
+        with self.__message_cache_lock:
+            if thread_id is None:
+                self.__message_cache.clear()
+            else:
+                self.__message_cache.pop(thread_id, None)
+    # Function End
+
+    def __Print_Loading_Message(self) -> None:
+        """
+        Prints a loading message to the console.
+
+        Parameters
+            None
+
+        Returns
+            None
+        """
+
+        # Variable initialization
+        outString = f"{self.name} Generating Response"
+    
+        # Print loading message
+        print(outString, end="")
+        for __ in range(3):
+            for _ in range(3):
+                print(".", end="")
+                time.sleep(0.1)
+            # Loop End
+
+            print("\b"*3 + " "*3 + "\b"*3, end="")
+        # Loop End
+
+        # Clear line
+        print("\b"*len(outString) + " "*len(outString) + "\b"*len(outString), end="")
+    # Function End
+
+    def Get_Response(self, event_handler:AssistantEventHandler|None=None, thread_id:str|None=None, sink:Output_Sink|None=None) -> None:
+        """ 
+        Streams the assistant's response to the console (or to wherever the event_handler class defines).
+
+        Parameters
+            event_handler (AssistantEventHandler): The event handler class to use. | OPTIONAL
+            thread_id (str): The ID of the thread to run | OPTIONAL | DEFAULT: The assistant's thread
+            sink (Output_Sink): The destination of the streamed text, passed to the event handler | OPTIONAL | DEFAULT: Stdout_Sink()
+
+        Returns
+            None
+        """
+        self.__Run_Stream(event_handler, thread_id, sink)
+    # Function End
+
+    def __Run_Stream(self, event_handler:type|None, thread_id:str|None, sink:Output_Sink|None) -> AssistantEventHandler:
+        """
+        Internal method that runs the assistant through an event handler and records the run's usage.
+
+        Parameters
+            event_handler (type): The event handler class to use | OPTIONAL | DEFAULT: Assistant_Event_Handler
+            thread_id (str): The ID of the thread to run | OPTIONAL | DEFAULT: The assistant's thread
+            sink (Output_Sink): The destination of the streamed text, passed to the event handler | OPTIONAL
+
+        Returns
+            event_handler (AssistantEventHandler): The event handler once the stream has ended
+        """
+        # Handle defaults
+        if event_handler is None:
+            event_handler = Assistant_Event_Handler
+        if thread_id is None:
+            thread_id = self.thread.id
+
+        # Run stream
+        handler = event_handler(client=self.client, sink=sink) if sink is not None else event_handler(client=self.client)
+        for _ in self.__Iterate_Run_Events(handler, thread_id):
+            pass
+        # Loop End
+
+        # Return the event handler
+        return handler
+    # Function End
+
+    def __Iterate_Run_Events(self, handler:AssistantEventHandler, thread_id:str) -> Iterator[AssistantStreamEvent]:
+        """
+        Internal generator that streams a run through an event handler and yields the events of the run, shared by every streamed response.
+        The handler's callbacks run and its stream timer records each event as usual. The stream is timed by the "assistant.get_response" span
+        and the run's usage is recorded once the stream ends. If the handler does not handle required actions itself, the functions registered
+        on it are called here once the requires_action event has been yielded, and the events of the continued run are yielded too.
+
+        Parameters
+            handler (AssistantEventHandler): The event handler of the run
+            thread_id (str): The ID of the thread to run
+
+        Returns
+            events (Iterator[AssistantStreamEvent]): The events of the run, including after tool outputs were submitted
+        """
+        # Variable initialization
+        stream_handler = handler
+        stream_manager = self.client.beta.threads.runs.stream(
+            thread_id=thread_id,
+            assistant_id=self.intance.id,
+            event_handler=handler,
+            **self.Get_Run_Parameters()
+        )
+
+        # Stream the run, then every tool output submission
+        try:
+            with Get_Metrics_Recorder().Span("assistant.get_response"):
+                while stream_manager is not None:
+                    with stream_manager as stream:
+                        stream_manager = None
+                        for event in stream:
+                            yield event
+                            if (event.event == "thread.run.requires_action") and (not getattr(handler, "handle_required_actions", True)) and (len(handler.tool_registry) > 0):
+                                tool_outputs = stream_handler.Dispatch_Tool_Calls(event.data.required_action.submit_tool_outputs.tool_calls)
+                                stream_manager, next_handler = stream_handler.Open_Tool_Outputs_Stream(tool_outputs, event.data.id)
+                        # Loop End
+
+                    # The run ends in the handler of the last tool output submission
+                    if stream_handler is not handler:
+                        handler.completed_run = stream_handler.completed_run
+                        handler.completed_messages.extend(stream_handler.completed_messages)
+                    if stream_manager is not None:
+                        stream_handler = next_handler
+                # Loop End
+        finally:
+            # Report the run's usage
+            self.__Record_Usage(getattr(handler, "completed_run", None))
+    # Function End
+
+    def Ask(self, message_content:str, event_handler:type|None=None, sink:Output_Sink|None=None) -> bool:
+        """
+        Sends a message and streams the response, like Send_Message followed by Get_Response.
+        When the assistant has a response cache, a prompt already answered under the same configuration is replayed
+        through the event handler without sending anything, and the messages of completed runs are cached.
+        Cached answers ignore the rest of the thread, so use a response cache for single turn, deterministic deployments.
+
+        Parameters
+            message_content (str): The text content of the message
+            event_handler (type): The event handler class to use. Must provide Replay_Messages and completed_messages, like Assistant_Event_Handler | OPTIONAL
+            sink (Output_Sink): The destination of the streamed text, passed to the event handler | OPTIONAL | DEFAULT: Stdout_Sink()
+
+        Returns
+            (bool): True if the response was replayed from the cache
+        """
+        # Handle defaults
+        if event_handler is None:
+            event_handler = Assistant_Event_Handler
+
+        # Run without a cache
+        if self.response_cache is None:
+            self.Send_Message(message_content)
+            self.__Run_Stream(event_handler, None, sink)
+            return False
+
+        # Replay a cached response
+        key = Response_Cache.Get_Key(self.Get_Response_Cache_Namespace(), message_content)
+        entry = self.response_cache.Get(key)
+        Get_Metrics_Recorder().Increment("response_cache.lookups", 1, {"result": "hit" if entry is not None else "miss"})
+        if entry is not None:
+            handler = event_handler(client=self.client, sink=sink) if sink is not None else event_handler(client=self.client)
+            handler.Replay_Messages([Message.model_validate(message) for message in entry["messages"]])
+            return True
+
+        # Run and cache the response of a completed run
+        self.Send_Message(message_content)
+        handler = self.__Run_Stream(event_handler, None, sink)
+        if (handler.completed_run is not None) and (handler.completed_run.status == "completed") and (len(handler.completed_messages) > 0):
+            self.response_cache.Set(key, {"messages": [message.model_dump(mode="json") for message in handler.completed_messages]})
+        return False
+    # Function End
+
+    def Get_Response_Cache_Namespace(self) -> str:
+        """
+        Returns the response cache namespace of the assistant's current configuration and vector store contents.
+        The contents version of the vector store is refreshed after files are attached or removed through it, and otherwise retrieved
+        at most once every contents_version_ttl seconds, so responses cached before files were attached or removed by another process
+        sharing the cache stop being replayed within that delay.
+
+        Parameters
+            None
+
+        Returns
+            namespace (str): The response cache namespace
+        """
+        return Response_Cache.Get_Namespace({
+            "assistant id": self.intance.id,
+            "model": self.model,
+            "instructions": self.instructions,
+            "tool set": self.tool_set,
+            "model parameters": self.model_parameters,
+            "vector store id": self.__vector_store.intance.id if self.__vector_store is not None else None,
+            "vector store contents": self.__vector_store.Get_Contents_Version() if self.__vector_store is not None else None
+        })
+    # Function End
+
+    def Invalidate_Response_Cache(self) -> None:
+        """
+        Removes the cached responses of the assistant's current configuration and vector store contents.
+        Called by Attach_Files and Send_Message before they change them, Update_Tool_Set removes the responses given with the previous
+        tools once they are replaced. Changes made elsewhere already move
+        the responses to a new namespace, so calling it before them only frees the space of the outdated responses.
+
+        Parameters
+            None
+
+        Returns
+            None
+        """
+        if self.response_cache is not None:
+            self.response_cache.Invalidate(self.Get_Response_Cache_Namespace())
+    # Function End
+    
+    def Stream_Response(self, event_handler:type|None=None, thread_id:str|None=None) -> Iterator[Response_Event]:
+        """
+        Runs the assistant and returns a generator of typed Response_Event objects instead of driving an event handler.
+        Functions registered on the event handler class are called when the run requires action, and the run continues
+        in the same generator. If no functions are registered, the "tool calls" event is the last event of the stream.
+
+        Parameters
+            event_handler (type[Assistant_Event_Handler]): The event handler class whose registered tools and filename cache are used | OPTIONAL | DEFAULT: Assistant_Event_Handler
+            thread_id (str): The ID of the thread to run | OPTIONAL | DEFAULT: The assistant's thread
+
+        Returns
+            events (Iterator[Response_Event]): The response events
+        """
+        # Handle defaults
+        if event_handler is None:
+            event_handler = Assistant_Event_Handler
+        if thread_id is None:
+            thread_id = self.thread.id
+
+        # Variable initialization
+        handler = event_handler(client=self.client, sink=Buffer_Sink())
+        handler.handle_required_actions = False
+
+        # Stream the run, then every tool output submission
+        for event in self.__Iterate_Run_Events(handler, thread_id):
+            yield from Response_Event.From_Stream_Event(event)
+
+            # Citations
+            if event.event == "thread.message.completed":
+                filenames = handler.Resolve_Filenames(Response_Event.Get_Cited_File_IDs(event.data))
+                yield from Response_Event.From_Citations(event.data, filenames)
+
+            # Tool calls
+            elif event.event == "thread.run.requires_action":
+                yield Response_Event("tool calls", event.data.required_action.submit_tool_outputs.tool_calls)
+        # Loop End
+    # Function End
+
+    def Start_Run(self, thread_id:str|None=None) -> Run:
+        """
+        Creates a run of the assistant without streaming it, to be followed with Poll_Runs.
+
+        Parameters
+            thread_id (str): The ID of the thread to run | OPTIONAL | DEFAULT: The assistant's thread
+
+        Returns
+            run (Run): The new run
+        """
+        return self.client.beta.threads.runs.create(
+            thread_id=thread_id if thread_id is not None else self.thread.id,
+            assistant_id=self.intance.id,
+            **self.Get_Run_Parameters()
+        )
+    # Function End
+
+    def Poll_Runs(
+            self, runs:list[Run], event_handler:type|None=None, poll_interval:float|None=None,
+            max_poll_interval:float|None=None, timeout:float|None=None
+        ) -> list[dict]:
+        """
+        Polls many runs together from a single loop until they finish. Each run is polled at poll_interval, and the interval grows
+        by half after every poll that finds the run unchanged, up to max_poll_interval, or longer if the API asks for it.
+        Runs that require action are handled by the functions registered on the event handler class, then polled again at poll_interval.
+        Runs that require action without registered functions are returned as they are. A run whose poll or tool output submission raises
+        is returned with the "failed" status and the error as its "last error", and the other runs keep being polled.
+
+        Parameters
+            runs (list[Run]): The runs to poll, as returned by Start_Run
+            event_handler (type): The event handler class whose registered functions answer tool calls | OPTIONAL | DEFAULT: Assistant_Event_Handler
+            poll_interval (float): The first delay between two polls of a run, in seconds | OPTIONAL | DEFAULT: 0.5
+            max_poll_interval (float): The longest delay between two polls of a run, in seconds | OPTIONAL | DEFAULT: 8
+            timeout (float): The number of seconds after which unfinished runs are returned with their current status | OPTIONAL | DEFAULT: None
+
+        Returns
+            results (list[dict]): One dictionary per run, in the same order as the runs, with the "run id", "thread id", "status",
+                "messages" created by the run, "usage" and "last error" of the run
+        """
+        # Handle defaults
+        if event_handler is None:
+            event_handler = Assistant_Event_Handler
+        if poll_interval is None:
+            poll_interval = DEFAULT_POLL_INTERVAL
+        if max_poll_interval is None:
+            max_poll_interval = DEFAULT_MAX_POLL_INTERVAL
+
+        # Variable initialization
+        handler = event_handler(client=self.client)
+        started_at = time.monotonic()
+        states = [{"run": run, "interval": poll_interval, "due": started_at, "error": None} for run in runs]
+        results = [None] * len(runs)
+
+        # Answer the tool calls of a run, or poll it, keeping the error of a run that cannot be advanced
+        def Advance(state:dict) -> None:
+            try:
+                Advance_Run(state)
+            except Exception as e:
+                state["error"] = f"{type(e).__name__}: {e}"
+        # Function End
+
+        def Advance_Run(state:dict) -> None:
+            run = state["run"]
+            if (run.status == "requires_action") and (len(handler.tool_registry) > 0):
+                tool_outputs = handler.Dispatch_Tool_Calls(run.required_action.submit_tool_outputs.tool_calls)
+                state["run"] = self.client.beta.threads.runs.submit_tool_outputs(run.id, thread_id=run.thread_id, tool_outputs=tool_outputs)
+                state["interval"] = poll_interval
+                state["due"] = time.monotonic() + poll_interval
+                return None
+
+            # Poll the run, backing off while it is unchanged
+            response = self.client.beta.threads.runs.with_raw_response.retrieve(run.id, thread_id=run.thread_id)
+            state["run"] = response.parse()
+            if state["run"].status == run.status:
+                state["interval"] = min(state["interval"] * POLL_BACKOFF_FACTOR, max_poll_interval)
+            else:
+                state["interval"] = poll_interval
+            poll_after = int(response.headers.get("openai-poll-after-ms", 0)) / 1000
+            state["due"] = time.monotonic() + max(state["interval"], poll_after)
+        # Function End
+
+        # Build the result of a finished run, or of a run that failed to advance
+        def Finish(state:dict) -> dict:
+            run = state["run"]
+            self.__Record_Usage(run)
+            result = {
+                "run id": run.id,
+                "thread id": run.thread_id,
+                "status": run.status if state["error"] is None else "failed",
+                "messages": [],
+                "usage": {
+                    "prompt tokens": run.usage.prompt_tokens,
+                    "completion tokens": run.usage.completion_tokens,
+                    "total tokens": run.usage.total_tokens
+                } if run.usage is not None else None,
+                "last error": state["error"] if state["error"] is not None else (run.last_error.message if run.last_error is not None else None)
+            }
+            try:
+                result["messages"] = list(self.client.beta.threads.messages.list(thread_id=run.thread_id, run_id=run.id, order="asc", limit=LIST_PAGE_SIZE))
+            except Exception as e:
+                if result["last error"] is None:
+                    result["last error"] = f"{type(e).__name__}: {e}"
+            return result
+        # Function End
+
+        # Poll the runs together
+        with Get_Metrics_Recorder().Span("assistant.poll_runs"), ThreadPoolExecutor(max_workers=DEFAULT_POLL_WORKERS) as executor:
+            while True:
+                # Set aside the finished runs
+                pending = []
+                for index, state in enumerate(states):
+                    if results[index] is not None:
+                        continue
+                    status = state["run"].status
+                    if (state["error"] is not None) or (status in TERMINAL_RUN_STATUSES) or ((status == "requires_action") and (len(handler.tool_registry) == 0)):
+                        results[index] = executor.submit(Finish, state)
+                    else:
+                        pending.append(state)
+                # Loop End
+                if len(pending) == 0:
+                    break
+
+                # Return the unfinished runs once the time is up
+                if (timeout is not None) and (time.monotonic() - started_at >= timeout):
+                    for index, state in enumerate(states):
+                        if results[index] is None:
+                            results[index] = executor.submit(Finish, state)
+                    # Loop End
+                    break
+
+                # Wait for the next due run, then advance every due run concurrently
+                wait = min(state["due"] for state in pending) - time.monotonic()
+                if timeout is not None:
+                    wait = min(wait, started_at + timeout - time.monotonic())
+                if wait > 0:
+                    time.sleep(wait)
+                list(executor.map(Advance, [state for state in pending if state["due"] <= time.monotonic()]))
+            # Loop End
+
+            # Return the results
+            return [result.result() for result in results]
+    # Function End
+
+    def Run_To_Completion(
+            self, thread_id:str|None=None, event_handler:type|None=None, poll_interval:float|None=None,
+            max_poll_interval:float|None=None, timeout:float|None=None
+        ) -> dict:
+        """
+        Runs the assistant without streaming and polls the run until it finishes, for workers that do not need the response incrementally.
+        See Poll_Runs for the polling and tool call handling.
+
+        Parameters
+            thread_id (str): The ID of the thread to run | OPTIONAL | DEFAULT: The assistant's thread
+            event_handler (type): The event handler class whose registered functions answer tool calls | OPTIONAL | DEFAULT: Assistant_Event_Handler
+            poll_interval (float): The first delay between two polls, in seconds | OPTIONAL | DEFAULT: 0.5
+            max_poll_interval (float): The longest delay between two polls, in seconds | OPTIONAL | DEFAULT: 8
+            timeout (float): The number of seconds after which an unfinished run is returned with its current status | OPTIONAL | DEFAULT: None
+
+        Returns
+            result (dict): The "run id", "thread id", "status", "messages" created by the run, "usage" and "last error" of the run
+        """
+        return self.Poll_Runs([self.Start_Run(thread_id)], event_handler, poll_interval, max_poll_interval, timeout)[0]
+    # Function End
+
+    def Get_Run_Parameters(self) -> dict:
+        """
+        Returns the token budgets and truncation strategy applied to every run.
+
+        Parameters
+            None
+
+        Returns
+            run_parameters (dict): The max_prompt_tokens, max_completion_tokens and truncation_strategy run parameters
+        """
+        return Get_Run_Parameters(self.message_history_length, self.max_prompt_tokens, self.max_completion_tokens)
+    # Function End
+
+    def __Record_Usage(self, run:Run|None) -> None:
+        """
+        Internal method that stores the token usage of a finished run and adds it to the totals.
+
+        Parameters
+            run (Run): The run in its final state | OPTIONAL
+
+        Returns
+            None
+        """
+        # Skip runs without usage
+        if (run is None) or (run.usage is None):
+            return None
+
+        # Update the usage
+        with self.__usage_lock:
+            self.last_run_usage = {
+                "run id": run.id,
+                "status": run.status,
+                "prompt tokens": run.usage.prompt_tokens,
+                "completion tokens": run.usage.completion_tokens,
+                "total tokens": run.usage.total_tokens
+            }
+            self.token_usage["runs"] += 1
+            self.token_usage["prompt tokens"] += run.usage.prompt_tokens
+            self.token_usage["completion tokens"] += run.usage.completion_tokens
+            self.token_usage["total tokens"] += run.usage.total_tokens
+    # Function End
+
+    def Get_Attributes(self) -> dict:
+        """
+        Gets the assistant's attributes.
+
+        Parameters
+            None
+
+        Returns
+            attributes (dict): The assistant's attributes
+        """
+
+        attributes = {
+            "id": self.intance.id,
+            'creation time': self.intance.created_at,
+            "name": self.name,
+            "instructions": self.instructions,
+            "tool_set": self.tool_set,
+            "model": self.model,
+            "model_parameters": self.model_parameters,
+            "vector_store": self.__vector_store.Get_Attributes() if self.__vector_store is not None else None,
+            "thread id": self.__thread.id if self.__thread is not None else None,
+            "created resources": self.created_resources,
+            "message history length": self.message_history_length,
+            "token usage": self.token_usage
+        }
+
+        return attributes
+    # Function End
+
+    def Get_Snapshot(self) -> dict:
+        """
+        Returns a compact, JSON serializable snapshot of the assistant's resource IDs and configuration, from which
+        From_Snapshot restores the assistant without creating anything.
+
+        Parameters
+            None
+
+        Returns
+            snapshot (dict): The assistant's snapshot
+        """
+
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "assistant id": self.intance.id,
+            "created at": self.intance.created_at,
+            "thread id": self.__thread.id if self.__thread is not None else None,
+            "vector store id": self.__vector_store.intance.id if self.__vector_store is not None else None,
+            "vector store name": self.__vector_store.name if self.__vector_store is not None else None,
+            "vector store life time": self.__vector_store.days_until_expiration if self.__vector_store is not None else None,
+            "name": self.name,
+            "instructions": self.instructions,
+            "tool set": self.tool_set,
+            "model": self.model,
+            "model parameters": self.model_parameters,
+            "max prompt tokens": self.max_prompt_tokens,
+            "max completion tokens": self.max_completion_tokens,
+            "message history length": self.message_history_length
+        }
+
+        return snapshot
+    # Function End
+
+    def Save_Snapshot(self, file_path:str) -> None:
+        """
+        Writes the assistant's snapshot to a JSON file, replacing it atomically.
+
+        Parameters
+            file_path (str): The path of the snapshot file
+
+        Returns
+            None
+        """
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.Get_Snapshot(), file, separators=(",", ":"))
+        os.replace(temporary_path, file_path)
+    # Function End
+
+    @classmethod
+    def From_Snapshot(
+            cls, client:OpenAI, snapshot:dict|str, verify:bool|None=None,
+            upload_cache:Upload_Cache|None=None, resource_pool:Resource_Pool|None=None, response_cache:Response_Cache|None=None
+        ) -> "Assistant":
+        """
+        Restores an assistant from a snapshot without creating or updating anything. When verifying, the assistant, thread and
+        vector store are retrieved concurrently, one request each. A thread or vector store that no longer exists is created again
+        on first use, as in lazy mode. Only an assistant that no longer exists is created again immediately.
+
+        Parameters
+            client (OpenAI): The OpenAI client used to communicate with the OpenAI API. | REQUIRED
+            snapshot (dict|str): A snapshot returned by Get_Snapshot, or the path of a file written by Save_Snapshot | REQUIRED
+            verify (bool): Checks that every resource still exists. Otherwise no request is made at all. | OPTIONAL | DEFAULT: True
+            upload_cache (Upload_Cache): A cache used by the internal vector store to skip re-uploading identical files. | OPTIONAL | DEFAULT: None
+            resource_pool (Resource_Pool): A pool of pre-created threads and vector stores to take from instead of creating new ones. | OPTIONAL | DEFAULT: None
+            response_cache (Response_Cache): A cache of responses used by Ask to answer repeated prompts without a run. | OPTIONAL | DEFAULT: None
+
+        Returns
+            assistant (Assistant): The restored assistant
+        """
+        # Handle defaults
+        if isinstance(snapshot, str):
+            with open(snapshot, "r") as file:
+                snapshot = json.load(file)
+        if verify is None:
+            verify = True
+
+        # Set properties
+        assistant = cls.__new__(cls)
+        assistant.client = client
+        assistant.name = snapshot["name"]
+        assistant.instructions = snapshot["instructions"]
+        assistant.tool_set = snapshot["tool set"]
+        assistant.model = snapshot["model"]
+        assistant.model_parameters = snapshot["model parameters"]
+        assistant.max_prompt_tokens = snapshot["max prompt tokens"]
+        assistant.max_completion_tokens = snapshot["max completion tokens"]
+        assistant.message_history_length = snapshot["message history length"]
+        assistant.last_run_usage = None
+        assistant.token_usage = {"runs": 0, "prompt tokens": 0, "completion tokens": 0, "total tokens": 0}
+        assistant.__usage_lock = threading.Lock()
+        assistant.upload_cache = upload_cache
+        assistant.resource_pool = resource_pool
+        assistant.response_cache = response_cache
+        assistant.created_resources = {
+            "assistant": False,
+            "vector store": False,
+            "thread": False
+        }
+        assistant.__vector_store = None
+        assistant.__vector_store_lock = threading.Lock()
+        assistant.__thread = None
+        assistant.__thread_lock = threading.Lock()
+        assistant.__message_cache = OrderedDict()
+        assistant.__message_cache_lock = threading.Lock()
+
+        # Trust the snapshot
+        if not verify:
+            assistant.intance = Beta_Types.Assistant.model_construct(
+                id=snapshot["assistant id"],
+                created_at=snapshot["created at"],
+                object="assistant",
+                name=assistant.name,
+                instructions=assistant.instructions,
+                model=assistant.model,
+                tools=assistant.tool_set
+            )
+            assistant.id = assistant.intance.id
+            if snapshot["thread id"] is not None:
+                assistant.__thread = Beta_Types.Thread.model_construct(id=snapshot["thread id"], object="thread", created_at=0)
+            if snapshot["vector store id"] is not None:
+                assistant.__vector_store = Vector_Storage.Connect(
+                    openai_client=client,
+                    vector_store_id=snapshot["vector store id"],
+                    name=snapshot["vector store name"],
+                    life_time=snapshot["vector store life time"],
+                    upload_cache=upload_cache,
+                    verify=False
+                )
+            return assistant
+
+        # Retrieve a resource, or None if it no longer exists
+        def Retrieve(retrieve:Callable, resource_id:str|None):
+            if resource_id is None:
+                return None
+            try:
+                return retrieve(resource_id)
+            except NotFoundError:
+                return None
+        # Function End
+
+        # Verify the resources concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            assistant_future = executor.submit(Retrieve, client.beta.assistants.retrieve, snapshot["assistant id"])
+            thread_future = executor.submit(Retrieve, client.beta.threads.retrieve, snapshot["thread id"])
+            vector_store_future = executor.submit(
+                Retrieve,
+                lambda vector_store_id: Vector_Storage.Connect(openai_client=client, vector_store_id=vector_store_id, upload_cache=upload_cache),
+                snapshot["vector store id"]
+            )
+            assistant.__thread = thread_future.result()
+            assistant.__vector_store = vector_store_future.result()
+            assistant.intance = assistant_future.result()
+
+        # Recreate a missing assistant
+        if assistant.intance is None:
+            assistant.__Connect_Assistant(None)
+        assistant.id = assistant.intance.id
+
+        # Return the assistant
+        return assistant
+    # Function End
+
+    def Get_Vector_Store(self) -> Vector_Storage:
+        """
+        Gets the assistant's vector store.
+        
+        Parameters
+            None
+            
+        Returns
+            vector_store (Vector_Storage): The assistant's vector store
+        """
+
+        # Return the vector store
+        return self.vector_store 
+    # Function End
+# Assistant Class End
+
+"""
+Session Manager
+"""
+
+# Session Manager Constants
+DEFAULT_MAX_SESSIONS = 256
+
+# Session Class
+class Session:
+    """
+    Session Class
+
+    A single conversation held on a shared Assistant. Each session owns a thread, while the remote assistant, its configuration and its vector store are shared with every other session.
+    The shared vector store is read-only for sessions: files sent by a session are attached to its own message, so they are only searched within the session's thread.
+
+    Properties
+        key (str): The key identifying the session
+        assistant (Assistant): The shared assistant
+        thread_id (str): The ID of the session's thread
+
+    Methods
+        Send_Message(message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None) -> Message
+        Get_Response(event_handler:AssistantEventHandler, sink:Output_Sink|None=None) -> None
+        Stream_Response(event_handler:type|None=None) -> Iterator[Response_Event]
+        Get_Attributes() -> dict
+    """
+
+    # Constructor
+    def __init__(self, key:str, assistant:Assistant, thread_id:str):
+        """
+        Constructor for the Session class. Does not contact the OpenAI API.
+
+        Parameters
+            key (str): The key identifying the session | REQUIRED
+            assistant (Assistant): The shared assistant | REQUIRED
+            thread_id (str): The ID of the session's thread | REQUIRED
+        """
+
+        # Set properties
+        self.key = key
+        self.assistant = assistant
+        self.thread_id = thread_id
+    # End of Constructor
+
+    def Send_Message(self, message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None) -> Message:
+        """
+        Adds a new message to the session's thread and returns the new message object. See Assistant.Send_Message.
+        A file given by its path is uploaded and attached to the message only, never to the assistant's shared vector store,
+        so other sessions cannot search it.
+        """
+
+        # Upload the attachment without sharing it
+        if (attachment_path is not None) and (attachment_file_id is None):
+            with open(attachment_path, "rb") as file:
+                attachment_file_id = self.assistant.client.files.create(file=file, purpose=DEFAULT_FILE_PURPOSE).id
+
+        # Send message
+        return self.assistant.Send_Message(
+            message_content=message_content,
+            attachment_file_id=attachment_file_id,
+            thread_id=self.thread_id
+        )
+    # Function End
+
+    def Get_Response(self, event_handler:AssistantEventHandler|None=None, sink:Output_Sink|None=None) -> None:
+        """
+        Streams the assistant's response to the session's thread. See Assistant.Get_Response.
+        """
+        return self.assistant.Get_Response(
+            event_handler=event_handler,
+            thread_id=self.thread_id,
+            sink=sink
+        )
+    # Function End
+
+    def Stream_Response(self, event_handler:type|None=None) -> Iterator[Response_Event]:
+        """
+        Returns a generator of the response events of a run on the session's thread. See Assistant.Stream_Response.
+        """
+        return self.assistant.Stream_Response(
+            event_handler=event_handler,
+            thread_id=self.thread_id
+        )
+    # Function End
+
+    def Get_Attributes(self) -> dict:
+        """
+        Gets the session's attributes.
+
+        Parameters
+            None
+
+        Returns
+            attributes (dict): The session's attributes
+        """
+
+        attributes = {
+            "key": self.key,
+            "assistant id": self.assistant.id,
+            "thread id": self.thread_id
+        }
+
+        return attributes
+    # Function End
+# Session Class End
+
+# Session Manager Class
+class Session_Manager:
+    """
+    Session Manager Class
+
+    Serves many conversations from a single Assistant. Each session key is given its own thread, while the remote assistant and its configuration are shared.
+    At most max_sessions Session objects are kept alive, the least recently used being evicted first. An evicted session is rehydrated from its
+    thread ID the next time it is requested, without any API call.
+
+    Create the shared assistant with lazy=True so that it does not create a thread of its own.
+
+    Properties
+        assistant (Assistant): The shared assistant
+        max_sessions (int): The maximum number of live Session objects
+        thread_ids (dict): A mapping of session keys to thread IDs. Pass a persistent mapping (such as a shelve) to keep sessions across restarts.
+
+    Methods
+        Get_Session(key:str, thread_id:str|None=None) -> Session
+        Delete_Session(key:str, delete_thread:bool|None=None) -> bool
+        Get_Attributes() -> dict
+    """
+
+    # Constructor
+    def __init__(self, assistant:Assistant, max_sessions:int|None=None, thread_ids:dict|None=None):
+        """
+        Constructor for the Session_Manager class.
+
+        Parameters
+            assistant (Assistant): The shared assistant | REQUIRED
+            max_sessions (int): The maximum number of live Session objects | OPTIONAL | DEFAULT: 256
+            thread_ids (dict): A mapping of session keys to thread IDs | OPTIONAL | DEFAULT: {}
+        """
+
+        # Handle defaults
+        if max_sessions is None:
+            max_sessions = DEFAULT_MAX_SESSIONS
+        if thread_ids is None:
+            thread_ids = {}
+
+        # Set properties
+        self.assistant = assistant
+        self.max_sessions = max_sessions
+        self.thread_ids = thread_ids
+        self.__sessions = OrderedDict()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Get_Session(self, key:str, thread_id:str|None=None) -> Session:
+        """
+        Returns the session with the given key. Evicted sessions are rehydrated from their thread ID,
+        and a new thread is created (or taken from the assistant's resource pool) for unknown keys.
+
+        Parameters
+            key (str): The key identifying the session
+            thread_id (str): The ID of an existing thread to rehydrate the session from | OPTIONAL
+
+        Returns
+            session (Session): The session
+        """
+
+        with self.__lock:
+            # Return the live session
+            session = self.__sessions.get(key)
+            if (session is not None) and ((thread_id is None) or (thread_id == session.thread_id)):
+                self.__sessions.move_to_end(key)
+                return session
+
+            # Find the session's thread
+            if thread_id is None:
+                thread_id = self.thread_ids.get(key)
+
+        # Create a thread for a new session
+        if thread_id is None:
+            if self.assistant.resource_pool is not None:
+                thread_id = self.assistant.resource_pool.Acquire_Thread().id
+            else:
+                thread_id = self.assistant.client.beta.threads.create().id
+
+        with self.__lock:
+            # Rehydrate the session
+            session = Session(key=key, assistant=self.assistant, thread_id=thread_id)
+            self.thread_ids[key] = thread_id
+            self.__sessions[key] = session
+            self.__sessions.move_to_end(key)
+
+            # Evict the least recently used sessions
+            while len(self.__sessions) > self.max_sessions:
+                self.__sessions.popitem(last=False)
+
+        # Return the session
+        return session
+    # Function End
+
+    def Delete_Session(self, key:str, delete_thread:bool|None=None) -> bool:
+        """
+        Forgets the session with the given key.
+
+        Parameters
+            key (str): The key identifying the session
+            delete_thread (bool): A flag to delete the session's thread | OPTIONAL | DEFAULT: True
+
+        Returns
+            (bool): True if the session existed
+        """
+
+        # Handle defaults
+        if delete_thread is None:
+            delete_thread = True
+
+        # Forget the session
+        with self.__lock:
+            self.__sessions.pop(key, None)
+            thread_id = self.thread_ids.pop(key, None)
+
+        # Delete the thread
+        if (thread_id is not None) and delete_thread:
+            self.assistant.client.beta.threads.delete(thread_id)
+
+        # Return status
+        return thread_id is not None
+    # Function End
+
+    def Get_Attributes(self) -> dict:
+        """
+        Gets the session manager's attributes.
+
+        Parameters
+            None
+
+        Returns
+            attributes (dict): The session manager's attributes
+        """
+
+        with self.__lock:
+            attributes = {
+                "assistant id": self.assistant.id,
+                "live sessions": len(self.__sessions),
+                "known sessions": len(self.thread_ids),
+                "max sessions": self.max_sessions
+            }
+
+        return attributes
+    # Function End
+# Session Manager Class End
+
+"""
+Batch Runner
+"""
+
+# Batch Runner Constants
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+MAX_BATCH_REQUESTS = 50000 # The maximum number of requests accepted by a single batch
+DEFAULT_BATCH_POLL_INTERVAL = 30 # Seconds
+TERMINAL_BATCH_STATUSES = ["completed", "failed", "expired", "cancelled"]
+
+# Batch Runner Class
+class Batch_Runner:
+    """
+    Batch Runner Class
+
+    Runs one-shot prompts through the Batch API at a lower cost than Send_Message and Get_Response, using the model, instructions,
+    model parameters and max completion tokens of an Assistant. Prompts are streamed into JSONL request files of at most 50,000 requests,
+    each uploaded with purpose "batch" and submitted as its own batch. Results are streamed back from the output files.
+    The submitted batches are recorded in a JSON state file after every submission, so a job can be resumed after a process restart.
+    The input file is recorded before its batch is created, so a restart between the two reuses the uploaded file, and the batch if it was created.
+
+    Properties:
+        assistant (Assistant): The assistant whose settings are used for every request.
+        client (OpenAI): The assistant's OpenAI client.
+        state_path (str): The path of the JSON state file.
+        state (dict): The submitted batches {"submitted requests": int, "batches": [{"batch id": str, "input file id": str, "requests": int}],
+            "pending input file": {"input file id": str, "created at": int, "requests": int}|None}.
+        poll_interval (float): The seconds between two status checks of a batch.
+
+    Methods:
+        Build_Request(custom_id:str, prompt:str) -> dict
+        Write_Requests(prompts:Iterable, file:io.TextIOBase, max_requests:int|None=None) -> int
+        Submit(prompts:Iterable) -> list[str]
+        Wait(batch_ids:list[str]|None=None) -> list[Batch]
+        Iterate_Results(batch_ids:list[str]|None=None) -> Iterator[tuple[str, dict]]
+        Run(prompts:Iterable) -> Iterator[tuple[str, dict]]
+        Clear_State() -> None
+    """
+
+    def __init__(self, assistant:Assistant, state_path:str, poll_interval:float|None=None):
+        """
+        Constructor for the Batch_Runner class. Loads the state of a previous job if the state file exists.
+
+        Parameters:
+            assistant (Assistant): The assistant whose settings are used for every request.
+            state_path (str): The path of the JSON state file.
+            poll_interval (float): The seconds between two status checks of a batch.
+                Defaults to 30.
+        """
+
+        # Handle Defaults
+        if poll_interval is None:
+            poll_interval = DEFAULT_BATCH_POLL_INTERVAL
+
+        # Set properties
+        self.assistant = assistant
+        self.client = assistant.client
+        self.state_path = state_path
+        self.poll_interval = poll_interval
+        self.state = {"submitted requests": 0, "batches": [], "pending input file": None}
+
+        # Load a previous job
+        if os.path.exists(state_path):
+            with open(state_path, "r") as file:
+                self.state = json.load(file)
+    # End of Constructor
+
+    def __Save_State(self) -> None:
+        """
+        Internal method that atomically writes the state file.
+        """
+        temporary_path = f"{self.state_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.state, file)
+        os.replace(temporary_path, self.state_path)
+    # End of __Save_State
+
+    def __Submit_Pending_Input_File(self) -> None:
+        """
+        Internal method that creates the batch of the recorded input file, unless a batch of that file already exists,
+        then records the batch in place of the input file.
+        """
+
+        # Variable initialization
+        pending = self.state["pending input file"]
+        batch = None
+
+        # Look for a batch created before a restart, among the batches newer than the input file
+        with Request_Priority("bulk"):
+            for existing_batch in self.client.batches.list(limit=LIST_PAGE_SIZE):
+                if existing_batch.created_at < pending["created at"]:
+                    break
+                if existing_batch.input_file_id == pending["input file id"]:
+                    batch = existing_batch
+                    break
+            # Loop End
+
+            # Submit the batch
+            if batch is None:
+                batch = self.client.batches.create(
+                    input_file_id=pending["input file id"],
+                    endpoint=BATCH_ENDPOINT,
+                    completion_window=BATCH_COMPLETION_WINDOW
+                )
+
+        # Record the submission
+        self.state["batches"].append({"batch id": batch.id, "input file id": pending["input file id"], "requests": pending["requests"]})
+        self.state["submitted requests"] += pending["requests"]
+        self.state["pending input file"] = None
+        self.__Save_State()
+    # End of __Submit_Pending_Input_File
+
+    def Clear_State(self) -> None:
+        """
+        Forgets the submitted batches and deletes the state file, so the next Run starts a new job.
+        """
+        self.state = {"submitted requests": 0, "batches": [], "pending input file": None}
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+    # End of Clear_State
+
+    def Build_Request(self, custom_id:str, prompt:str) -> dict:
+        """
+        Builds the batch request line of a prompt from the assistant's settings.
+
+        Parameters:
+            custom_id (str): The custom ID of the request.
+            prompt (str): The user prompt.
+
+        Returns:
+            request (dict): The batch request.
+        """
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": self.assistant.model,
+                "messages": [
+                    {"role": "system", "content": self.assistant.instructions},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": self.assistant.model_parameters["temperature"],
+                "top_p": self.assistant.model_parameters["top_p"],
+                "max_tokens": self.assistant.max_completion_tokens
+            }
+        }
+    # End of Build_Request
+
+    def Write_Requests(self, prompts:Iterator, file:io.TextIOBase, max_requests:int|None=None) -> int:
+        """
+        Streams prompts into a JSONL request file, one line at a time.
+
+        Parameters:
+            prompts (Iterator): An iterator of (custom_id, prompt) pairs or of prompt strings, whose custom IDs are then "request-<index>".
+            file (io.TextIOBase): The open text file to write to.
+            max_requests (int): The maximum number of requests to take from the iterator.
+                Defaults to no limit.
+
+        Returns:
+            count (int): The number of requests written.
+        """
+
+        # Variable initialization
+        count = 0
+
+        # Write the requests
+        for item in itertools.islice(prompts, max_requests):
+            if isinstance(item, str):
+                custom_id, prompt = f"request-{self.state['submitted requests'] + count}", item
+            else:
+                custom_id, prompt = item
+            file.write(json.dumps(self.Build_Request(custom_id, prompt)) + "\n")
+            count += 1
+        # Loop End
+
+        # Return the count
+        return count
+    # End of Write_Requests
+
+    def Submit(self, prompts:Iterable) -> list[str]:
+        """
+        Writes, uploads and submits the prompts as batches of at most 50,000 requests. When resuming a job, the prompts that
+        were already submitted are skipped, so the same prompts must be passed again in the same order. An input file uploaded
+        before a restart is submitted first, or matched with the batch already created from it.
+
+        Parameters:
+            prompts (Iterable): (custom_id, prompt) pairs or prompt strings.
+
+        Returns:
+            batch_ids (list[str]): The IDs of every batch of the job.
+        """
+
+        # Submit the input file uploaded before a restart
+        if self.state.get("pending input file") is not None:
+            self.__Submit_Pending_Input_File()
+
+        # Skip the prompts submitted before a restart
+        prompts = itertools.islice(iter(prompts), self.state["submitted requests"], None)
+
+        while True:
+            # Write the next request file
+            with tempfile.TemporaryFile("w+b") as request_file:
+                text_file = io.TextIOWrapper(request_file, encoding="utf-8", newline="\n")
+                count = self.Write_Requests(prompts, text_file, MAX_BATCH_REQUESTS)
+                text_file.flush()
+                text_file.detach()
+                if count == 0:
+                    break
+
+                # Upload it
+                request_file.seek(0)
+                with Request_Priority("bulk"):
+                    input_file = self.client.files.create(file=("requests.jsonl", request_file), purpose="batch")
+
+            # Record the input file before submitting its batch
+            self.state["pending input file"] = {"input file id": input_file.id, "created at": input_file.created_at, "requests": count}
+            self.__Save_State()
+            self.__Submit_Pending_Input_File()
+        # Loop End
+
+        # Return the batch IDs
+        return [batch["batch id"] for batch in self.state["batches"]]
+    # End of Submit
+
+    def Wait(self, batch_ids:list[str]|None=None) -> list:
+        """
+        Polls the batches until every one of them is completed, failed, expired or cancelled.
+
+        Parameters:
+            batch_ids (list[str]): The IDs of the batches.
+                Defaults to every batch of the job.
+
+        Returns:
+            batches (list[Batch]): The batches in their final state.
+        """
+
+        # Handle Defaults
+        if batch_ids is None:
+            batch_ids = [batch["batch id"] for batch in self.state["batches"]]
+
+        # Variable initialization
+        batches = {}
+
+        # Poll the unfinished batches
+        while len(batches) < len(batch_ids):
+            for batch_id in batch_ids:
+                if batch_id in batches:
+                    continue
+                with Request_Priority("bulk"):
+                    batch = self.client.batches.retrieve(batch_id)
+                if batch.status in TERMINAL_BATCH_STATUSES:
+                    batches[batch_id] = batch
+            # Loop End
+            if len(batches) < len(batch_ids):
+                time.sleep(self.poll_interval)
+        # Loop End
+
+        # Return the batches in order
+        return [batches[batch_id] for batch_id in batch_ids]
+    # End of Wait
+
+    def Iterate_Results(self, batch_ids:list[str]|None=None) -> Iterator[tuple[str, dict]]:
+        """
+        Waits for the batches, then streams their results line by line from the output and error files.
+
+        Parameters:
+            batch_ids (list[str]): The IDs of the batches.
+                Defaults to every batch of the job.
+
+        Returns:
+            results (Iterator[tuple[str, dict]]): (custom_id, result) pairs, where result is a dictionary with the keys
+                "status code", "content", "usage" and "error".
+        """
+
+        for batch in self.Wait(batch_ids):
+            for file_id in [batch.output_file_id, batch.error_file_id]:
+                if file_id is None:
+                    continue
+                with Request_Priority("bulk"), self.client.files.with_streaming_response.content(file_id) as response:
+                    for line in response.iter_lines():
+                        if line.strip():
+                            yield self.__Parse_Result(json.loads(line))
+                    # Loop End
+            # Loop End
+        # Loop End
+    # End of Iterate_Results
+
+    @staticmethod
+    def __Parse_Result(line:dict) -> tuple[str, dict]:
+        """
+        Internal method that converts a line of an output or error file into a (custom_id, result) pair.
+        """
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+        choices = body.get("choices") or []
+        error = line.get("error") or body.get("error")
+        return line["custom_id"], {
+            "status code": response.get("status_code"),
+            "content": choices[0]["message"]["content"] if len(choices) > 0 else None,
+            "usage": body.get("usage"),
+            "error": error.get("message") if isinstance(error, dict) else error
+        }
+    # End of __Parse_Result
+
+    def Run(self, prompts:Iterable) -> Iterator[tuple[str, dict]]:
+        """
+        Submits the prompts (skipping those submitted before a restart), waits for the batches and streams their results.
+
+        Parameters:
+            prompts (Iterable): (custom_id, prompt) pairs or prompt strings.
+
+        Returns:
+            results (Iterator[tuple[str, dict]]): (custom_id, result) pairs, see Iterate_Results.
+        """
+        yield from self.Iterate_Results(self.Submit(prompts))
+    # End of Run
+# End of Batch_Runner Class
+
+"""
+Citation Cache
+"""
+
+# Citation Cache Constants
+DEFAULT_FILENAME_CACHE_SIZE = 1024
+DEFAULT_FILENAME_CACHE_TTL = 3600 # Seconds
+DEFAULT_CITATION_WORKERS = 8
+
+# Filename Cache Class
+class Filename_Cache:
+    """
+    Filename Cache Class
+
+    A thread safe cache mapping OpenAI file IDs to their file names. Entries expire after time_to_live seconds
+    and the least recently used entry is evicted once the cache holds more than max_entries entries.
+
+    Properties:
+        max_entries (int): The maximum number of entries kept in the cache.
+        time_to_live (float): The number of seconds an entry is kept before it expires.
+
+    Methods:
+        Get(file_ids:list[str]) -> dict[str, str]
+        Set(file_id:str, filename:str) -> None
+        Clear() -> None
+    """
+
+    # Constructor
+    def __init__(self, max_entries:int|None=None, time_to_live:float|None=None):
+        """
+        Constructor for the Filename_Cache class.
+
+        Parameters:
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to 1024.
+            time_to_live (float): The number of seconds an entry is kept before it expires.
+                Defaults to 3600.
+        """
+
+        # Handle Defaults
+        if max_entries is None:
+            max_entries = DEFAULT_FILENAME_CACHE_SIZE
+        if time_to_live is None:
+            time_to_live = DEFAULT_FILENAME_CACHE_TTL
+
+        # Set properties
+        self.max_entries = max_entries
+        self.time_to_live = time_to_live
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    def Get(self, file_ids:list[str]) -> dict[str, str]:
+        """
+        Returns the cached file names of the given file IDs. IDs that are not cached or have expired are left out.
+
+        Parameters:
+            file_ids (list[str]): The file IDs to look up.
+
+        Returns:
+            filenames (dict[str, str]): A dictionary mapping file IDs to file names.
+        """
+
+        # Variable initialization
+        filenames = {}
+        now = time.monotonic()
+
+        with self.__lock:
+            for file_id in file_ids:
+                entry = self.__entries.get(file_id)
+                if entry is None:
+                    continue
+
+                # Evict expired entries
+                if entry[1] <= now:
+                    del self.__entries[file_id]
+                    continue
+
+                # Mark the entry as recently used
+                self.__entries.move_to_end(file_id)
+                filenames[file_id] = entry[0]
+            # Loop End
+
+        # Return the file names
+        return filenames
+    # End of Get
+
+    def Set(self, file_id:str, filename:str) -> None:
+        """
+        Caches the file name of the given file ID.
+
+        Parameters:
+            file_id (str): The ID of the file.
+            filename (str): The name of the file.
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__entries[file_id] = (filename, time.monotonic() + self.time_to_live)
+            self.__entries.move_to_end(file_id)
+
+            # Evict the least recently used entries
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+    # End of Set
+
+    def Clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+    # End of Clear
+# End of Filename_Cache Class
+
+"""
+Tool Output Cache
+"""
+
+# Tool Output Cache Constants
+DEFAULT_TOOL_CACHE_SIZE = 1024
+
+# Tool Output Cache Class
+class Tool_Output_Cache:
+    """
+    Tool Output Cache Class
+
+    A thread safe memoization cache for function tool outputs, keyed by the tool name and its canonicalized JSON arguments.
+    Every entry expires after the time to live given when it is stored, and the least recently used entry is evicted once
+    the cache holds more than max_entries entries.
+
+    Properties:
+        max_entries (int): The maximum number of entries kept in the cache.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that were not cached or had expired.
+
+    Methods:
+        Get_Key(name:str, arguments:str) -> str [static]
+        Get(name:str, arguments:str) -> str|None
+        Set(name:str, arguments:str, output:str, time_to_live:float) -> None
+        Clear() -> None
+        Get_Statistics() -> dict
+    """
+
+    # Constructor
+    def __init__(self, max_entries:int|None=None):
+        """
+        Constructor for the Tool_Output_Cache class.
+
+        Parameters:
+            max_entries (int): The maximum number of entries kept in the cache.
+                Defaults to 1024.
+        """
+
+        # Handle Defaults
+        if max_entries is None:
+            max_entries = DEFAULT_TOOL_CACHE_SIZE
+
+        # Set properties
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+    # End of Constructor
+
+    @staticmethod
+    def Get_Key(name:str, arguments:str) -> str:
+        """
+        Returns the cache key of a tool call. Arguments are canonicalized so that key order and whitespace do not matter.
+
+        Parameters:
+            name (str): The name of the tool.
+            arguments (str): The JSON arguments of the tool call.
+
+        Returns:
+            key (str): The cache key.
+        """
+
+        # Canonicalize the arguments
+        try:
+            arguments = json.dumps(json.loads(arguments or "{}"), sort_keys=True, separators=(",", ":"))
+        except ValueError:
+            pass
+
+        # Return the key
+        return f"{name}:{arguments}"
+    # End of Get_Key
+
+    def Get(self, name:str, arguments:str) -> str|None:
+        """
+        Returns the cached output of a tool call, or None if it is not cached or has expired.
+
+        Parameters:
+            name (str): The name of the tool.
+            arguments (str): The JSON arguments of the tool call.
+
+        Returns:
+            output (str|None): The cached tool output.
+        """
+
+        # Variable initialization
+        key = self.Get_Key(name, arguments)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            # Count a miss and evict expired entries
+            if (entry is None) or (entry[1] <= time.monotonic()):
+                self.__entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            # Count a hit and mark the entry as recently used
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    # End of Get
+
+    def Set(self, name:str, arguments:str, output:str, time_to_live:float) -> None:
+        """
+        Caches the output of a tool call.
+
+        Parameters:
+            name (str): The name of the tool.
+            arguments (str): The JSON arguments of the tool call.
+            output (str): The tool output.
+            time_to_live (float): The number of seconds the output is kept before it expires.
+
+        Returns:
+            None
+        """
+
+        # Variable initialization
+        key = self.Get_Key(name, arguments)
+
+        with self.__lock:
+            self.__entries[key] = (output, time.monotonic() + time_to_live)
+            self.__entries.move_to_end(key)
+
+            # Evict the least recently used entries
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+    # End of Set
+
+    def Clear(self) -> None:
+        """
+        Removes every entry from the cache and resets the counters.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+    # End of Clear
+
+    def Get_Statistics(self) -> dict:
+        """
+        Returns a dictionary of the cache's statistics.
+
+        Parameters:
+            None
+
+        Returns:
+            statistics (dict): A dictionary of the cache's size, hits, misses and hit rate.
+        """
+
+        with self.__lock:
+            lookups = self.hits + self.misses
+            statistics = {
+                "size": len(self.__entries),
+                "max entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit rate": self.hits / lookups if lookups > 0 else 0.0,
+            }
+
+        # Return the statistics
+        return statistics
+    # End of Get_Statistics
+# End of Tool_Output_Cache Class
+
+"""
+Event Handler
+"""
+
+# Event Handler Constants
+DEFAULT_TOOL_TIMEOUT = 30 # Seconds
+DEFAULT_TOOL_WORKERS = 8
+
+# Assistant Event Handler Class
+class Assistant_Event_Handler(AssistantEventHandler):
+    """
+    A class that handles streaming actions taken by the assistant.
+
+    Properties
+        client (OpenAI)
+        sink (Output_Sink): The destination of the streamed text, shared with the handlers created for tool output submissions
+        filename_cache (Filename_Cache): The file name cache shared by every handler instance
+        tool_registry (dict): The functions registered for each tool name, shared by every instance of the handler class
+        tool_output_cache (Tool_Output_Cache): The memoization cache of tool outputs shared by every handler instance
+        stream_timer (Stream_Timer): Records the timings of the stream
+        completed_run (Run|None): The run in its final state, including after tool outputs were submitted, once the stream has ended
+        completed_messages (list[Message]): Copies of the messages completed by the run, including after tool outputs were submitted
+        handle_required_actions (bool): Whether requires_action events are passed to Handle_Required_Actions. Disabled by Assistant.Stream_Response, which submits the tool outputs itself
+
+    Overridden Methods
+        on_event(event: AssistantStreamEvent)
+        on_text_created(text: Text)
+        on_text_delta(delta: TextDelta, snapshot: Text)
+        on_text_done(text: Text)
+        on_message_done(message: Message)
+        on_end()
+
+    Methods
+        Get_Response_Text() -> str
+        Replay_Messages(messages: list[Message]) -> None
+        Register_Tool(name: str, function: Callable, timeout: float|None=None, cache_ttl: float|None=None) -> None [class]
+        Handle_Required_Actions(data: Run, run_id: str) -> None
+        Dispatch_Tool_Calls(tool_calls: list[ToolCall]) -> list[dict]
+        Submit_Tool_Outputs(tool_outputs: list[dict], run_id: str) -> None
+        Open_Tool_Outputs_Stream(tool_outputs: list[dict], run_id: str) -> tuple[AssistantStreamManager, Assistant_Event_Handler]
+        Resolve_Filenames(file_ids: list[str]) -> dict[str, str]
+        Format_Citations(text: Text, filenames: dict[str, str]) -> tuple[str, list[str]] [static]
+    """
+
+    filename_cache:Filename_Cache = Filename_Cache()
+    """The file name cache shared by every handler instance."""
+    tool_registry:dict = {}
+    """The functions registered for each tool name, shared by every instance of the handler class."""
+    tool_output_cache:Tool_Output_Cache = Tool_Output_Cache()
+    """The memoization cache of tool outputs shared by every handler instance."""
+    
+    @override
+    def __init__(self, client:OpenAI, sink:Output_Sink|None=None) -> None:
+        super().__init__()
+        self.client = client
+        self.sink = sink if sink is not None else Stdout_Sink()
+        self.stream_timer = Stream_Timer()
+        self.completed_run = None
+        self.completed_messages = []
+        self.handle_required_actions = True
+    # Function End    
+
+    # \/ \/ Event Handlers \/ \/
+    @override
+    def on_event(self, event:AssistantStreamEvent) -> None:
+        # Record the stream timings
+        self.stream_timer.Record(event)
+
+        # Keep the run in its final state
+        if event.event in TERMINAL_RUN_EVENTS:
+            self.completed_run = event.data
+
+        # Keep the completed messages before their citations are formatted
+        if event.event == "thread.message.completed":
+            self.completed_messages.append(event.data.model_copy(deep=True))
+
+        # Identify user function calls
+        if (event.event == 'thread.run.requires_action') and self.handle_required_actions:
+            run_id = event.data.id
+            self.Handle_Required_Actions(event.data, run_id)
+    # Function End
+
+    # \/ \/ Text Generation \/ \/
+    @override
+    def on_text_created(self, text: Text) -> None:
+        self.sink.Write("\n")
+    # Function End    
+
+    @override
+    def on_text_delta(self, delta: TextDelta, snapshot: Text) -> None:
+        self.sink.Write(delta.value)
+    # Function End    
+
+    @override   
+    def on_text_done(self, text: Text) -> None:
+        self.sink.Write("\n")
+        self.sink.Flush()
+    # Function End    
+
+    @override
+    def on_end(self) -> None:
+        self.sink.Flush()
+    # Function End
+
+    def Get_Response_Text(self) -> str:
+        """
+        Returns all the text written to the handler's sink, including the responses streamed after tool outputs were submitted.
+        """
+        return self.sink.Get_Text()
+    # Function End
+
+    def Replay_Messages(self, messages: list[Message]) -> None:
+        """
+        Sends completed messages through the text and message handlers as if they were being streamed, then ends the stream.
+        Used to play back cached responses.
+
+        Parameters
+            messages (list[Message]): The messages to replay
+
+        Returns
+            None
+        """
+        for message in messages:
+            for content in message.content:
+                if content.type != "text":
+                    continue
+                self.on_text_created(Text(value="", annotations=[]))
+                self.on_text_delta(TextDelta(value=content.text.value), content.text)
+                self.on_text_done(content.text)
+            # Loop End
+            self.on_message_done(message)
+        # Loop End
+        self.on_end()
+    # Function End
+
+    # \/ \/ Tool Handling \/ \/
+    @classmethod
+    def Register_Tool(cls, name: str, function: Callable, timeout: float|None=None, cache_ttl: float|None=None) -> None:
+        """
+        Registers a Python function to be called when the assistant calls the function tool with the given name.
+        The function is called with the tool call's arguments as keyword arguments and may be a regular function or a coroutine function.
+        Registrations are made on the handler class, so register tools on your own subclass to keep them separate from other handlers.
+
+        Parameters
+            name (str): The name of the function tool, as declared in the assistant's tool set
+            function (Callable): The function to call
+            timeout (float): The number of seconds to wait for the function before giving up | OPTIONAL | DEFAULT: 30
+            cache_ttl (float): Memoizes the function's outputs for this many seconds. Only use this for pure functions. | OPTIONAL | DEFAULT: None (no caching)
+
+        Returns
+            None
+        """
+
+        # Handle defaults
+        if timeout is None:
+            timeout = DEFAULT_TOOL_TIMEOUT
+
+        # Give the class its own registry
+        if "tool_registry" not in cls.__dict__:
+            cls.tool_registry = dict(cls.tool_registry)
+
+        # Register the function
+        cls.tool_registry[name] = {
+            "function": function,
+            "timeout": timeout,
+            "cache ttl": cache_ttl
+        }
+    # Function End
+
+    def Handle_Required_Actions(self, data: Run, run_id: str) -> None:
+        """
+        Runs the registered functions for every tool call of the run concurrently and submits their outputs together.
+        Does nothing if no functions are registered, override this method to handle tool calls yourself.
+        """
+
+        # Skip if no functions are registered
+        if len(self.tool_registry) == 0:
+            return None
+
+        # Call the functions and submit their outputs
+        tool_outputs = self.Dispatch_Tool_Calls(data.required_action.submit_tool_outputs.tool_calls)
+        self.Submit_Tool_Outputs(tool_outputs=tool_outputs, run_id=run_id)
+    # Function End
+
+    def Dispatch_Tool_Calls(self, tool_calls: list[ToolCall]) -> list[dict]:
+        """
+        Calls the registered function of every tool call concurrently on a thread pool.
+        Unregistered tools, errors and timeouts are reported to the assistant as an error output.
+
+        Parameters
+            tool_calls (list[ToolCall]): The tool calls of a requires_action event
+
+        Returns
+            tool_outputs (list[dict]): A list of tool output dictionaries, in the same order as the tool calls
+        """
+
+        # Variable initialization
+        tool_outputs = []
+        cached_outputs = [self.__Get_Cached_Output(tool_call) for tool_call in tool_calls]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(tool_calls), DEFAULT_TOOL_WORKERS)))
+
+        # Start every call that is not cached
+        started_at = time.monotonic()
+        futures = [
+            executor.submit(self.__Call_Tool, tool_call) if cached_output is None else None
+            for tool_call, cached_output in zip(tool_calls, cached_outputs)
+        ]
+
+        # Collect the outputs, each timeout counting from the start of the calls
+        for tool_call, cached_output, future in zip(tool_calls, cached_outputs, futures):
+            if future is None:
+                tool_outputs.append({"tool_call_id": tool_call.id, "output": cached_output})
+                continue
+            timeout = self.tool_registry.get(tool_call.function.name, {}).get("timeout", DEFAULT_TOOL_TIMEOUT)
+            try:
+                output = future.result(timeout=max(0, started_at + timeout - time.monotonic()))
+            except FutureTimeoutError:
+                output = json.dumps({"error": f"{tool_call.function.name} timed out after {timeout} seconds."})
+            tool_outputs.append({"tool_call_id": tool_call.id, "output": output})
+        # Loop End
+
+        # Do not wait on calls that timed out
+        executor.shutdown(wait=False)
+
+        # Return the outputs
+        return tool_outputs
+    # Function End
+
+    def __Call_Tool(self, tool_call: ToolCall) -> str:
+        """
+        Internal method that calls the registered function of a tool call and formats its output.
+        """
+
+        # Find the registered function
+        registration = self.tool_registry.get(tool_call.function.name)
+        if registration is None:
+            return json.dumps({"error": f"No function is registered for {tool_call.function.name}."})
+
+        try:
+            # Call the function
+            arguments = json.loads(tool_call.function.arguments or "{}")
+            with Get_Metrics_Recorder().Span("tool.call", {"tool": tool_call.function.name}):
+                result = registration["function"](**arguments)
+                if inspect.isawaitable(result):
+                    result = asyncio.run(result)
+            output = self.Format_Tool_Output(result)
+
+            # Memoize the output
+            if registration.get("cache ttl") is not None:
+                self.tool_output_cache.Set(tool_call.function.name, tool_call.function.arguments, output, registration["cache ttl"])
+
+            # Return the output
+            return output
+        except Exception as e:
+            return json.dumps({"error": f"{type(e).__name__}: {e}"})
+    # Function End
+
+    def __Get_Cached_Output(self, tool_call: ToolCall) -> str|None:
+        """
+        Internal method that returns the memoized output of a tool call, or None if the tool is not cached or the output is not available.
+        """
+
+        # Skip tools that are not cached
+        registration = self.tool_registry.get(tool_call.function.name)
+        if (registration is None) or (registration.get("cache ttl") is None):
+            return None
+
+        # Return the cached output
+        return self.tool_output_cache.Get(tool_call.function.name, tool_call.function.arguments)
+    # Function End
+
+    @staticmethod
+    def Format_Tool_Output(result: object) -> str:
+        """
+        Converts a function's return value to a tool output string. Strings are passed through and anything else is JSON encoded.
+
+        Parameters
+            result (object): The return value of a function
+
+        Returns
+            output (str): The tool output
+        """
+
+        if isinstance(result, str):
+            return result
+        return json.dumps(result, default=str)
+    # Function End
+
+    @override
+    def on_tool_call_created(self, tool_call: ToolCall) -> None:
+        super().on_tool_call_created(tool_call)
+
+    @override
+    def on_tool_call_delta(self, delta: ToolCallDelta, snapshot: ToolCall) -> None:
+        super().on_tool_call_delta(delta, snapshot)
+    
+    def Submit_Tool_Outputs(self, tool_outputs: list[dict], run_id: str) -> None:
+        """
+        [DO NOT OVERRIDE]
+
+        Submits tool outputs to the assistant.
+        Pass in a list of tool outputs to submit them to the assistant.
+
+        Parameters
+            tool_outputs (list[dict]): A list of tool output dictionaries
+            run_id (str): The ID of the run to submit the tool outputs to
+
+        Returns
+            None
+        """
+
+        # Continue the run in a new handler
+        stream_manager, event_handler = self.Open_Tool_Outputs_Stream(tool_outputs, run_id)
+        with stream_manager as stream:
+            stream.until_done()
+
+        # The run ends in the new handler
+        self.completed_run = event_handler.completed_run
+        self.completed_messages.extend(event_handler.completed_messages)
+    # Function End
+
+    def Open_Tool_Outputs_Stream(self, tool_outputs: list[dict], run_id: str) -> tuple:
+        """
+        [DO NOT OVERRIDE]
+
+        Creates the stream that submits tool outputs and continues the run in a new handler of the same class,
+        sharing this handler's sink and timed from the requires_action event. The stream is not started.
+
+        Parameters
+            tool_outputs (list[dict]): A list of tool output dictionaries
+            run_id (str): The ID of the run to submit the tool outputs to
+
+        Returns
+            (tuple[AssistantStreamManager, Assistant_Event_Handler]): The stream manager and the handler of the continued run
+        """
+
+        # Continue the run in a new handler, timed from the requires_action event
+        event_handler = self.__class__(client=self.client, sink=self.sink)
+        event_handler.stream_timer = Stream_Timer("tool outputs", self.stream_timer.required_action_at)
+        event_handler.handle_required_actions = self.handle_required_actions
+
+        # Return the stream manager and the new handler
+        return self.client.beta.threads.runs.submit_tool_outputs_stream(
+            thread_id=self.current_run.thread_id,
+            run_id=self.current_run.id,
+            tool_outputs=tool_outputs,
+            event_handler=event_handler
+        ), event_handler
+    # Function End
+
+    # \/ \/ Message Handling \/ \/
+    @override
+    def on_message_done(self, message: Message) -> None:
+        # print a citation to any files searched
+        message_content = message.content[0].text
+        filenames = self.Resolve_Filenames([
+            annotation.file_citation.file_id
+            for annotation in message_content.annotations
+            if getattr(annotation, "file_citation", None)
+        ])
+        message_content.value, citations = self.Format_Citations(message_content, filenames)
+
+        if (len(citations) > 0):
+            self.sink.Write(f"{''.join(citations)}\n")
+            self.sink.Flush()
+    # Function End    
+
+    def Resolve_Filenames(self, file_ids: list[str]) -> dict[str, str]:
+        """
+        Returns the file names of the given file IDs. Names are read from the shared filename cache,
+        and any IDs that are not cached are retrieved concurrently and added to the cache.
+
+        Parameters
+            file_ids (list[str]): The IDs of the cited files
+
+        Returns
+            filenames (dict[str, str]): A dictionary mapping file IDs to file names
+        """
+
+        # Read the cached file names
+        filenames = self.filename_cache.Get(file_ids)
+        uncached_ids = [file_id for file_id in dict.fromkeys(file_ids) if file_id not in filenames]
+
+        # Retrieve the uncached file names concurrently
+        if len(uncached_ids) > 0:
+            with ThreadPoolExecutor(max_workers=min(len(uncached_ids), DEFAULT_CITATION_WORKERS)) as executor:
+                retrieved_files = executor.map(self.client.files.retrieve, uncached_ids)
+                for file_id, retrieved_file in zip(uncached_ids, retrieved_files):
+                    self.filename_cache.Set(file_id, retrieved_file.filename)
+                    filenames[file_id] = retrieved_file.filename
+                # Loop End
+
+        # Return the file names
+        return filenames
+    # Function End
+
+    @staticmethod
+    def Format_Citations(text: Text, filenames: dict[str, str]) -> tuple[str, list[str]]:
+        """
+        Replaces every annotation in the text with its "[index]" marker in a single pass
+        and builds the matching list of file citations.
+
+        Parameters
+            text (Text): The annotated text content of a message
+            filenames (dict[str, str]): A dictionary mapping file IDs to file names
+
+        Returns
+            value (str): The text with its annotations replaced
+            citations (list[str]): A list of "[index] filename" strings
+        """
+
+        # Variable initialization
+        pieces = []
+        citations = []
+        cursor = 0
+
+        # Replace the annotations in order of appearance
+        for index, annotation in sorted(enumerate(text.annotations), key=lambda pair: pair[1].start_index):
+            if annotation.start_index < cursor:
+                continue
+            pieces.append(text.value[cursor:annotation.start_index])
+            pieces.append(f"[{index}]")
+            cursor = annotation.end_index
+        # Loop End
+        pieces.append(text.value[cursor:])
+
+        # Build the citations in index order
+        for index, annotation in enumerate(text.annotations):
+            if file_citation := getattr(annotation, "file_citation", None):
+                citations.append(f"[{index}] {filenames.get(file_citation.file_id, file_citation.file_id)}")
+        # Loop End
+
+        # Return the text and citations
+        return "".join(pieces), citations
+    # Function End
+# Event Handler Class End
+
+"""
+Async Vector Storage
 """
 
-# Vestor Storage Constants
-DEFAULT_LIFE_TIME = 1
-DEFAULT_VECTOR_STORE_NAME = "Vector_Storage"
-DEFAULT_FILE_PURPOSE = "assistants"
-FILE_PURPOSE_ENUM = ["assistants", "fine-tune", "vision", "batch"]
-
-# Vector Storage Class
-class Vector_Storage:
+# Async Vector Storage Class
+class AsyncVector_Storage:
     """
-    Vector Storage Class
+    Async Vector Storage Class
 
-    This class is used to create, modify, and delete vector stores. It also provides methods to attach files to the vector store.
+    The asyncio counterpart of the Vector_Storage class. It is built on the AsyncOpenAI client so that many vector stores can be driven from a single event loop.
+    Instances must be created with the awaitable Create class method, since the vector store is created over the network.
 
     Properties:
-        client (OpenAI): The OpenAI client used to access the OpenAI API.
+        client (AsyncOpenAI): The AsyncOpenAI client used to access the OpenAI API.
         name (str): The name of the vector store.
         days_until_expiration (int): The time in terms of 24 hour days that the vector store will be kept alive.
         intance (dict): The vector store instance.
+        deletion_report (dict|None): The report of the last Delete_Vector_Store call.
 
     Methods:
-        Retrieve_Vector_Store(vector_store_id:str) -> dict
-        Delete_Vector_Store(delete_attached:bool|None=None) -> bool
-        Modify_Vector_Store(new_name:str=None, new_life_time:int=None) -> dict
+        Create(openai_client:AsyncOpenAI, name:str|None=None, life_time:int|None=None) -> AsyncVector_Storage [awaitable]
+        Retrieve_Vector_Store(vector_store_id:str) -> dict [awaitable]
+        Delete_Vector_Store(delete_attached:bool|None=None, max_workers:int|None=None) -> bool [awaitable]
+        Modify_Vector_Store(new_name:str=None, new_life_time:int=None) -> dict [awaitable]
         Get_Attributes() -> dict
-        Attach_Existing_File(file_id:str) -> str
-        Attach_New_File(file_path:str) -> str
+        Attach_Existing_File(file_id:str) -> str [awaitable]
+        Attach_New_File(file_path:str) -> str [awaitable]
     """
 
     # Properties
     client = None
-    """The OpenAI client used to access the OpenAI API."""
+    """The AsyncOpenAI client used to access the OpenAI API."""
     name = ""
     """The name of the vector store."""
     days_until_expiration = 0
     """The time in terms of 24 hour days that the vector store will be kept alive."""
     intance = None
     """The vector store instance."""
+    deletion_report = None
+    """The report of the last Delete_Vector_Store call."""
 
     # Constructor
-    def __init__(self, openai_client:OpenAI, name:str|None=None, life_time:int|None=None):
+    def __init__(self, openai_client:AsyncOpenAI, name:str|None=None, life_time:int|None=None):
         """
-        Constructor for the Vector_Storage class.
+        Constructor for the AsyncVector_Storage class. Does not create the vector store, use the Create class method instead.
 
         Parameters:
-            openai_client (OpenAI): The OpenAI client object.
+            openai_client (AsyncOpenAI): The AsyncOpenAI client object.
             name (str): The name of the vector store. 
                 Defaults to "Vector_Storage".
             life_time (int): The time in terms of 24 hour days that the vector store will be kept alive.
@@ -74,20 +6426,44 @@ class Vector_Storage:
         self.client = openai_client
         self.name = name
         self.days_until_expiration = life_time
+    # End of Constructor
+
+    @classmethod
+    async def Create(cls, openai_client:AsyncOpenAI, name:str|None=None, life_time:int|None=None) -> "AsyncVector_Storage":
+        """
+        Creates a new vector store and returns the AsyncVector_Storage object wrapping it.
+
+        Parameters:
+            openai_client (AsyncOpenAI): The AsyncOpenAI client object.
+            name (str): The name of the vector store. 
+                Defaults to "Vector_Storage".
+            life_time (int): The time in terms of 24 hour days that the vector store will be kept alive.
+                Defaults to 1.
+
+        Returns:
+            vector_storage (AsyncVector_Storage): The new vector storage object.
+        """
+
+        # Set properties
+        vector_storage = cls(openai_client=openai_client, name=name, life_time=life_time)
 
         # Create the vector store
-        self.intance = self.client.beta.vector_stores.create(
-            name=self.name,
+        vector_storage.intance = await vector_storage.client.beta.vector_stores.create(
+            name=vector_storage.name,
             expires_after={
                 "anchor": "last_active_at",
-                "days": self.days_until_expiration
+                "days": vector_storage.days_until_expiration
             }
         )
-    # End of Constructor
 
-    def Retrieve_Vector_Store(self, vector_store_id:str) -> dict:
+        # Return the vector storage
+        return vector_storage
+    # End of Create
+
+    async def Retrieve_Vector_Store(self, vector_store_id:str) -> dict:
         """
         Retrieves the vector store with the given id and replaces the instance with the retrieved vector store. Returns None if the vector store was not found.
+        The previous vector store is not deleted, await Delete_Vector_Store first to remove it.
 
         Parameters:
             vector_store_id (str): The id of the vector store to retrieve.
@@ -99,31 +6475,32 @@ class Vector_Storage:
         # Try to retrieve the vector store
         try:
             # Retrieve the vector store
-            retrieved_vector_store = self.client.beta.vector_stores.retrieve(vector_store_id)
+            retrieved_vector_store = await self.client.beta.vector_stores.retrieve(vector_store_id)
 
             # Replace the instance with the retrieved vector store
-            if self.Delete_Vector_Store():
-                self.intance = retrieved_vector_store
-                self.name = self.intance.name
-                self.days_until_expiration = self.intance.expires_after["days"]
+            self.intance = retrieved_vector_store
+            self.name = self.intance.name
+            self.days_until_expiration = self.intance.expires_after.days
 
-                # Return the retrieved vector store
-                return self.intance
-            else:
-                # Return none if the current vector store was not deleted
-                return None
-        
-        except Exception as e:
+            # Return the retrieved vector store
+            return self.intance
+
+        except NotFoundError:
             # Return none if the vector store was not found
             return None
     # End of Retrieve_Vector_Store
 
-    def Delete_Vector_Store(self, delete_attached:bool|None=None) -> bool:
+    async def Delete_Vector_Store(self, delete_attached:bool|None=None, max_workers:int|None=None) -> bool:
         """
         Deletes the vector store and sets the instance to None.
+        A report of what was deleted, or failed to delete, is stored in the deletion_report property, with the same keys as Vector_Storage.
+        A file that fails to delete is recorded in the report without stopping the other deletions.
 
         Parameters:
-            None
+            delete_attached (bool): A flag to delete the files attached to the vector store.
+                Defaults to False.
+            max_workers (int): The maximum number of concurrent file deletions.
+                Defaults to 8.
 
         Returns:
             deletion_status.deleted (bool): A boolean value indicating if the vector store was deleted successfully.
@@ -132,18 +6509,53 @@ class Vector_Storage:
         # Handle Defaults
         if delete_attached == None:
             delete_attached = False
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_DELETE_WORKERS
+
+        # Variable initialization
+        self.deletion_report = {
+            "vector store id": self.intance.id,
+            "vector store deleted": False,
+            "files deleted": [],
+            "files kept": [],
+            "files failed": {}
+        }
 
         # Delete files attached to the vector store if specified
         if delete_attached:
-            # Get the files attached to the vector store
-            attached_files = self.client.beta.vector_stores.files.list(vector_store_id=self.intance.id, limit=100).data
-            for attached_file in attached_files:
-                # Delete the attached file
-                self.client.files.delete(attached_file.id)
+            # Get every page of files attached to the vector store
+            file_ids = [
+                attached_file.id
+                async for attached_file in self.client.beta.vector_stores.files.list(vector_store_id=self.intance.id, limit=LIST_PAGE_SIZE)
+            ]
+
+            # Delete a single file, bounded by the semaphore
+            semaphore = asyncio.Semaphore(max_workers)
+            async def Delete(file_id:str) -> str|None:
+                async with semaphore:
+                    try:
+                        await self.client.files.delete(file_id)
+                    except NotFoundError:
+                        pass
+                    except Exception as e:
+                        return str(e)
+                return None
+            # Function End
+
+            # Delete the attached files concurrently
+            errors = await asyncio.gather(*[
+                Delete(file_id) for file_id in file_ids
+            ])
+            for file_id, error in zip(file_ids, errors):
+                if error is not None:
+                    self.deletion_report["files failed"][file_id] = error
+                else:
+                    self.deletion_report["files deleted"].append(file_id)
             # Loop End
 
         # Delete the vector store
-        deletion_status = self.client.beta.vector_stores.delete(self.intance.id)
+        deletion_status = await self.client.beta.vector_stores.delete(self.intance.id)
+        self.deletion_report["vector store deleted"] = deletion_status.deleted
 
         # Set the instance to None
         self.intance = None
@@ -152,7 +6564,7 @@ class Vector_Storage:
         return deletion_status.deleted
     # End of Delete_Vector_Store
 
-    def Modify_Vector_Store(self, new_name:str=None, new_life_time:int=None) -> dict:
+    async def Modify_Vector_Store(self, new_name:str=None, new_life_time:int=None) -> dict:
         """
         Modifies the vector store with the given new name and life time. Returns the modified vector store.
 
@@ -171,7 +6583,7 @@ class Vector_Storage:
             self.days_until_expiration = new_life_time
 
         # Modify the vector store
-        modified_vector_store = self.client.beta.vector_stores.update(
+        self.intance = await self.client.beta.vector_stores.update(
             vector_store_id=self.intance.id,
             name=self.name,
             expires_after={
@@ -180,9 +6592,6 @@ class Vector_Storage:
             }
         )
 
-        # Replace the instance with the modified vector store
-        self.intance = modified_vector_store
-
         # Return the modified vector store
         return self.intance
     # End of Modify_Vector_Store
@@ -213,7 +6622,7 @@ class Vector_Storage:
         return attributes
     # End of Get_Attributes
 
-    def Attach_Existing_File(self, file_id:str) -> str:
+    async def Attach_Existing_File(self, file_id:str) -> str:
         """
         Attaches a file with the given id to the vector store. Returns the file's ID.
 
@@ -225,7 +6634,7 @@ class Vector_Storage:
         """
 
         # Attach the file
-        vector_store_file = self.client.beta.vector_stores.files.create_and_poll(
+        vector_store_file = await self.client.beta.vector_stores.files.create_and_poll(
             vector_store_id=self.intance.id,
             file_id=file_id
         )
@@ -234,7 +6643,7 @@ class Vector_Storage:
         return vector_store_file.id
     # End of Attach_Existing_File
 
-    def Attach_New_File(self, file_path:str, purpose:str|None=None) -> str:
+    async def Attach_New_File(self, file_path:str, purpose:str|None=None) -> str:
         """
         Attaches a file with the given path to the vector store. Returns the file's ID.
 
@@ -252,40 +6661,32 @@ class Vector_Storage:
             purpose = DEFAULT_FILE_PURPOSE
 
         # Upload the file
-        uploaded_file = self.client.files.create(
-            file=open(file_path, "rb"),
-            purpose=purpose
-        )
+        with open(file_path, "rb") as file:
+            uploaded_file = await self.client.files.create(
+                file=file,
+                purpose=purpose
+            )
 
         # Attach the file
-        file_ID = self.Attach_Existing_File(uploaded_file.id)
+        file_ID = await self.Attach_Existing_File(uploaded_file.id)
 
         # Return the attachment status
         return file_ID
     # End of Attach_New_File
-# End of Vector_Storage Class
+# End of AsyncVector_Storage Class
 
 """
-Assistant
+Async Assistant
 """
 
-# Assistant Constants
-DEFAULT_MODEL = "gpt-3.5-turbo-0125"
-DEFAULT_MESSAGE_HISTORY_LENGTH = 25
-DEFAULT_MAX_PROMPT_TOKENS = 10000 # OpenAI recommends at least 20,000 prompt tokens for best results
-DEFAULT_MAX_COMPLETION_TOKENS = 10000
-DEFAULT_MODEL_PARAMETERS = {
-    "temperature": 1.0,
-    "top_p": 1.0
-}
-
-# Assistant Class
-class Assistant:
+# Async Assistant Class
+class AsyncAssistant:
     """
-    This class is designed to abstract interactions with the OpenAI Assistant
+    The asyncio counterpart of the Assistant class. It is built on the AsyncOpenAI client so that a single event loop can drive many concurrent runs.
+    Instances must be created with the awaitable Create class method, since the assistant, vector store and thread are created over the network.
 
     Properties
-        client (OpenAI): The OpenAI client instance
+        client (AsyncOpenAI): The AsyncOpenAI client instance
         id (str): The ID of the assistant
         name (str): The name of the assistant
         instructions (str): The assistant's context prompt
@@ -294,23 +6695,29 @@ class Assistant:
         model_parameters (dict): The parameters for the model
         max_prompt_tokens (int): The maximum number of prompt tokens
         max_completion_tokens (int): The maximum number of completion tokens
-        vector_store (Vector_Storage): The internal vector store
+        message_history_length (int): The number of most recent thread messages sent with each run, 0 lets the API truncate automatically
+        last_run_usage (dict|None): The token usage of the last run
+        token_usage (dict): The token usage of every run of this instance
+        vector_store (AsyncVector_Storage): The internal vector store
         intance (openai.types.beta.Assistant): The OpenAI Assistant instance
         thread (openai.types.beta.Thread): The Assistant Thread instance
 
     Methods
-        Delete_Assistant() -> bool
-        Attach_Files(file_paths:list[str]) -> bool
-        Update_Tool_Set(tool_set:list) -> bool
-        Send_Message(message_content:str, message_attachments:list=[]) -> dict
-        Get_Response(event_handler:AssistantEventHandler) -> None
+        Create(client:AsyncOpenAI, assistant_id:str|None=None, ...) -> AsyncAssistant [awaitable]
+        Delete_Assistant() -> bool [awaitable]
+        Attach_Files(file_paths:list[str], max_workers:int|None=None) -> list[str] [awaitable]
+        Update_Tool_Set(tool_set:list) -> bool [awaitable]
+        Send_Message(message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None) -> Message [awaitable]
+        Get_Response(event_handler:AsyncAssistantEventHandler, sink:Output_Sink|None=None) -> None [awaitable]
+        Stream_Response(event_handler:type|None=None) -> AsyncIterator[Response_Event] [async generator]
+        Get_Run_Parameters() -> dict
         Get_Attributes() -> dict
-        Get_Vector_Store() -> Vector_Storage
+        Get_Vector_Store() -> AsyncVector_Storage
     """
 
     # Properties
-    client:OpenAI
-    """The OpenAI client used to communicate with the OpenAI API."""
+    client:AsyncOpenAI
+    """The AsyncOpenAI client used to communicate with the OpenAI API."""
     id:str|None = None
     """The ID of the assistant."""
     name:str|None = None
@@ -327,7 +6734,13 @@ class Assistant:
     """The maximum number of prompt tokens."""
     max_completion_tokens:int|None = None
     """The maximum number of completion tokens."""
-    vector_store:Vector_Storage
+    message_history_length:int|None = None
+    """The number of most recent thread messages sent with each run."""
+    last_run_usage:dict|None = None
+    """The token usage of the last run."""
+    token_usage:dict
+    """The token usage of every run of this instance."""
+    vector_store:AsyncVector_Storage
     """The internal vector store."""
     intance:Beta_Types.Assistant
     """The OpenAI Assistant instance."""
@@ -336,24 +6749,17 @@ class Assistant:
 
     # Constructor
     def __init__(
-            self, client:OpenAI, assistant_id:str|None=None, assistant_name:str|None=None, instruction_prompt:str|None=None, tool_set:list|None=None,
+            self, client:AsyncOpenAI, assistant_name:str|None=None, instruction_prompt:str|None=None, tool_set:list|None=None,
             model:str|None=None, model_parameters:dict|None=None,
-            max_prompt_tokens:int|None=None, max_completion_tokens:int|None=None
+            max_prompt_tokens:int|None=None, max_completion_tokens:int|None=None,
+            message_history_length:int|None=None
         ):
         """
-        This class is designed to abstract interactions with the OpenAI Assistant.
+        Sets the properties of the async assistant without contacting the OpenAI API. Use the Create class method to build a usable instance.
         
         Parameters
         ----------
-            client (OpenAI): The OpenAI client used to communicate with the OpenAI API. | REQUIRED
-            assistant_id (str): The id of the assistant you would like to connect to. If None or left blank, a new assistant will be created. When connecting to a preexisting assistant, all other parameters will be used to modify the assistant. | OPTIONAL | DEFAULT: None
-            assistant_name (str): The name of the assistant. | OPTIONAL | DEFAULT: "Assistant"
-            instruction_prompt (str): The assistant's context prompt | OPTIONAL | DEFAULT: "You are a simple chat bot."
-            tool_set (list): A list of tool dictionaries. | OPTIONAL | DEFAULT: [ {"type": "file_search"} ]
-            model (str): The model to use for the assistant. | OPTIONAL | DEFAULT: "gpt-3.5-turbo-0125"
-            model_parameters (dict): The parameters for the model. | OPTIONAL | DEFAULT: {temperature: 1.0, top_p: 1.0}
-            max_prompt_tokens (int): The maximum number of prompt tokens. | OPTIONAL | DEFAULT: 10000
-            max_completion_tokens (int): The maximum number of completion tokens. | OPTIONAL | DEFAULT: 10000
+            See AsyncAssistant.Create.
         """
         # Handle Defaults
         if assistant_name is None:
@@ -374,9 +6780,14 @@ class Assistant:
             max_prompt_tokens = DEFAULT_MAX_PROMPT_TOKENS
         if max_completion_tokens is None:
             max_completion_tokens = DEFAULT_MAX_COMPLETION_TOKENS
+        if message_history_length is None:
+            message_history_length = DEFAULT_MESSAGE_HISTORY_LENGTH
 
         # Verify file_search tool is present
-        tool_set = self.__Verify_File_Search_Tool(tool_set)
+        if not any(tool["type"] == "file_search" for tool in tool_set):
+            tool_set.append({
+                "type": "file_search"
+            })
         
         # Set properties
         self.client = client
@@ -386,95 +6797,115 @@ class Assistant:
         self.model = model
         self.model_parameters = model_parameters
         self.max_prompt_tokens = max_prompt_tokens
-
-        # Create internal vector store
-        self.vector_store = Vector_Storage(
-            openai_client=self.client,
-            name=f"{self.name}_Vector_Store",
-            life_time=1
-        )
-
-        # Connect to a preexisting assistant
-        try:
-            # Set instance
-            self.intance = self.client.beta.assistants.retrieve(assistant_id)
-            self.id = assistant_id # Set id if successfully retrieved
-
-            # Modify properties
-            self.intance = self.client.beta.assistants.update(
-                assistant_id=self.id,
-                model=self.model,
-                name=self.name,
-                instructions=self.instructions,
-                tools=self.tool_set,
-                tool_resources={
-                    "file_search": {
-                        "vector_store_ids": [
-                            self.vector_store.Get_Attributes()["id"]
-                        ]
-                    }
-                },
-                temperature=self.model_parameters["temperature"],
-                top_p=self.model_parameters["top_p"],
-            )
-        except Exception as e:
-            # Create assistant
-            self.intance = self.client.beta.assistants.create(
-                model=self.model,
-                name=self.name,
-                instructions=self.instructions,
-                tools=self.tool_set,
-                tool_resources={
-                    "file_search": {
-                        "vector_store_ids": [
-                            self.vector_store.Get_Attributes()["id"]
-                        ]
-                    }
-                },
-                temperature=self.model_parameters["temperature"],
-                top_p=self.model_parameters["top_p"],
-            )
-
-            # Set id
-            self.id = self.intance.id
-        finally:
-            # Initialize thread
-            self.thread = client.beta.threads.create()
+        self.max_completion_tokens = max_completion_tokens
+        self.message_history_length = message_history_length
+        self.last_run_usage = None
+        self.token_usage = {"runs": 0, "prompt tokens": 0, "completion tokens": 0, "total tokens": 0}
     # End of Constructor
 
-    def __Verify_File_Search_Tool(self, tool_set:list) -> list:
-        """
-        Verifies that the file_search tool is present in the tool set. If not, adds it.
-
-        Parameters
-            tool_set (list): A list of tool dictionaries
+    @classmethod
+    async def Create(
+            cls, client:AsyncOpenAI, assistant_id:str|None=None, assistant_name:str|None=None, instruction_prompt:str|None=None, tool_set:list|None=None,
+            model:str|None=None, model_parameters:dict|None=None,
+            max_prompt_tokens:int|None=None, max_completion_tokens:int|None=None,
+            message_history_length:int|None=None
+        ) -> "AsyncAssistant":
+        """
+        Creates (or connects to) an assistant and returns the AsyncAssistant object wrapping it.
+        If creating the vector store, the thread or the assistant fails, the resources already created are deleted before the error is raised.
         
+        Parameters
+        ----------
+            client (AsyncOpenAI): The AsyncOpenAI client used to communicate with the OpenAI API. | REQUIRED
+            assistant_id (str): The id of the assistant you would like to connect to. If None or left blank, a new assistant will be created. When connecting to a preexisting assistant, all other parameters will be used to modify the assistant. | OPTIONAL | DEFAULT: None
+            assistant_name (str): The name of the assistant. | OPTIONAL | DEFAULT: "Assistant"
+            instruction_prompt (str): The assistant's context prompt | OPTIONAL | DEFAULT: "You are a simple chat bot."
+            tool_set (list): A list of tool dictionaries. | OPTIONAL | DEFAULT: [ {"type": "file_search"} ]
+            model (str): The model to use for the assistant. | OPTIONAL | DEFAULT: "gpt-3.5-turbo-0125"
+            model_parameters (dict): The parameters for the model. | OPTIONAL | DEFAULT: {temperature: 1.0, top_p: 1.0}
+            max_prompt_tokens (int): The maximum number of prompt tokens. | OPTIONAL | DEFAULT: 10000
+            max_completion_tokens (int): The maximum number of completion tokens. | OPTIONAL | DEFAULT: 10000
+            message_history_length (int): The number of most recent thread messages sent with each run. 0 lets the API truncate the thread automatically. | OPTIONAL | DEFAULT: 25
+
         Returns
-            tool_set (list): The updated tool set
+            assistant (AsyncAssistant): The new async assistant
         """
-        
-        # Variable initialization
-        tools_present = {
-            'function': 0,
-            'file_search': 0,
-            'code_interpreter': 0
-        }
+        # Set properties
+        assistant = cls(
+            client=client, assistant_name=assistant_name, instruction_prompt=instruction_prompt, tool_set=tool_set,
+            model=model, model_parameters=model_parameters,
+            max_prompt_tokens=max_prompt_tokens, max_completion_tokens=max_completion_tokens,
+            message_history_length=message_history_length
+        )
 
-        # Check for file_search tool
-        for tool in tool_set:
-            tools_present[tool["type"]] += 1
+        # Create internal vector store and thread concurrently
+        vector_store, thread = await asyncio.gather(
+            AsyncVector_Storage.Create(
+                openai_client=client,
+                name=f"{assistant.name}_Vector_Store",
+                life_time=1
+            ),
+            client.beta.threads.create(),
+            return_exceptions=True
+        )
 
-        # Add file_search tool if not present
-        if tools_present["file_search"] == 0:
-            tool_set.append({
-                "type": "file_search"
-            })
+        try:
+            # Raise the error of a failed creation
+            for result in [vector_store, thread]:
+                if isinstance(result, Exception):
+                    raise result
+            # Loop End
+            assistant.vector_store, assistant.thread = vector_store, thread
+
+            # Shared assistant payload
+            assistant_payload = {
+                "model": assistant.model,
+                "name": assistant.name,
+                "instructions": assistant.instructions,
+                "tools": assistant.tool_set,
+                "tool_resources": {
+                    "file_search": {
+                        "vector_store_ids": [
+                            assistant.vector_store.intance.id
+                        ]
+                    }
+                },
+                "temperature": assistant.model_parameters["temperature"],
+                "top_p": assistant.model_parameters["top_p"],
+            }
 
-        # Return tool set
-        return tool_set
-    # Function End
+            # Connect to a preexisting assistant
+            if assistant_id is not None:
+                try:
+                    # Modify properties
+                    assistant.intance = await client.beta.assistants.update(
+                        assistant_id=assistant_id,
+                        **assistant_payload
+                    )
+                    assistant.id = assistant_id # Set id if successfully updated
+                except (BadRequestError, NotFoundError):
+                    # A malformed or unknown ID creates a new assistant
+                    pass
 
-    def Delete_Assistant(self, clear_vector_store:bool|None=None) -> bool:
+            # Create assistant
+            if assistant.id is None:
+                assistant.intance = await client.beta.assistants.create(**assistant_payload)
+                assistant.id = assistant.intance.id
+        except Exception:
+            # Delete the vector store and thread created before the failure, keeping the original error
+            cleanups = []
+            if isinstance(vector_store, AsyncVector_Storage):
+                cleanups.append(vector_store.Delete_Vector_Store())
+            if not isinstance(thread, Exception):
+                cleanups.append(client.beta.threads.delete(thread.id))
+            await asyncio.gather(*cleanups, return_exceptions=True)
+            raise
+
+        # Return the assistant
+        return assistant
+    # End of Create
+
+    async def Delete_Assistant(self, clear_vector_store:bool|None=None) -> bool:
         """
         Deletes the assistant. Call this method once you are done using the assistant.
 
@@ -489,17 +6920,14 @@ class Assistant:
         if clear_vector_store is None:
             clear_vector_store = False
 
-        # get assistant id
-        assistant_id = self.intance.id
-
-        # Delete vector store object
-        self.vector_store.Delete_Vector_Store(
-            delete_attached=clear_vector_store
-        )
-
-        # Delete assistant
-        deletion_object = self.client.beta.assistants.delete(
-            assistant_id=assistant_id
+        # Delete vector store object and assistant
+        __, deletion_object = await asyncio.gather(
+            self.vector_store.Delete_Vector_Store(
+                delete_attached=clear_vector_store
+            ),
+            self.client.beta.assistants.delete(
+                assistant_id=self.intance.id
+            )
         )
 
         # update instance
@@ -509,46 +6937,50 @@ class Assistant:
         return deletion_object.deleted
     # Function End
 
-    def Attach_Files(self, file_paths:list[str]|None) -> list[str]:
+    async def Attach_Files(self, file_paths:list[str]|None, max_workers:int|None=None) -> list[str]:
         """
-        Takes in a list of file path strings and adds the repective files to the assistant's internal vector store.
-        Returns a list of file IDs.
+        Takes in a list of file path strings and concurrently adds the repective files to the assistant's internal vector store.
+        Returns a list of file IDs in the same order as the file paths. Files that do not exist or failed to attach are returned as None,
+        like Assistant.Attach_Files, and the other files are still attached.
 
         Parameters
             file_paths (list): A list of file paths strings
+            max_workers (int): The maximum number of concurrent uploads | OPTIONAL | DEFAULT: 8
 
         Returns
-            returnBool (bool): A boolean indicating if all files were added successfully
+            id_list (list): A list of file IDs
         """
-        # Variable initialization
-        id_list = []
 
         # Check if file paths are provided
-        if (file_paths is not None) and (len(file_paths) > 0):
-            # Iterate through file paths
-            for file_Path in file_paths:
-                # Check if file path exists
-                if os.path.exists(file_Path) == True:
-                    # Send to vector store
-                    file_ID = self.vector_store.Attach_New_File(file_path=file_Path)
-
-                    # Add file ID to list
-                    id_list.append(file_ID)
-
-                # File path does not exist
-                else:
-                    id_list.append(None)
-            # Loop End
-                
-            # return status
-            return id_list
-        
-        # No file paths provided
-        else:
-            return id_list
+        if (file_paths is None) or (len(file_paths) == 0):
+            return []
+
+        # Handle Defaults
+        if (max_workers is None) or (max_workers < 1):
+            max_workers = DEFAULT_UPLOAD_WORKERS
+
+        # Attach an existing path, skip a missing one, bounded by the semaphore
+        semaphore = asyncio.Semaphore(max_workers)
+        async def Attach_Path(file_path:str) -> str|None:
+            if os.path.exists(file_path) == True:
+                async with semaphore:
+                    return await self.vector_store.Attach_New_File(file_path=file_path)
+            return None
+        # Function End
+
+        # Send to vector store, waiting for every file even if some fail
+        id_list = await asyncio.gather(*[
+            Attach_Path(file_path) for file_path in file_paths
+        ], return_exceptions=True)
+
+        # return IDs
+        return [
+            file_id if not isinstance(file_id, Exception) else None
+            for file_id in id_list
+        ]
     # Function End
 
-    def Update_Tool_Set(self, tool_set:list[dict]) -> bool:
+    async def Update_Tool_Set(self, tool_set:list[dict]) -> bool:
         """
         Updates the assistant's tools.
 
@@ -561,7 +6993,7 @@ class Assistant:
 
         try:
             # Update tool set
-            updated_assistant = self.client.beta.assistants.update(
+            updated_assistant = await self.client.beta.assistants.update(
                 assistant_id=self.intance.id,
                 tools=tool_set,
             )
@@ -572,12 +7004,12 @@ class Assistant:
 
             # return status
             return True
-        except:
+        except (BadRequestError, NotFoundError):
             # return status
             return False
     # Function End
-    
-    def __Create_Message(self, role:str, content:str, attachment_id:str|None=None) -> Message:
+
+    async def __Create_Message(self, role:str, content:str, attachment_id:str|None=None) -> Message:
         """
         Internal Method to create a new message in the assistant's thread.
 
@@ -589,7 +7021,7 @@ class Assistant:
         Returns
             message (Message): The new message object
         """
-        return self.client.beta.threads.messages.create(
+        return await self.client.beta.threads.messages.create(
             thread_id=self.thread.id,
             role=role,
             content=content,
@@ -599,7 +7031,7 @@ class Assistant:
             }] if attachment_id is not None else None
         )
 
-    def Send_Message(self, message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None) -> Message:
+    async def Send_Message(self, message_content:str, attachment_path:str|None=None, attachment_file_id:str|None=None) -> Message:
         """
         Adds a new message to the assistant's thread
         and returns the new message object.
@@ -610,95 +7042,150 @@ class Assistant:
             attachment_file_id (str): The file ID of the attachment | OPTIONAL
         Returns
             message (Message): The new message object
-        """        
-        # Variable initialization
-        message = None
-
-        # Attachment ID
-        if attachment_file_id is not None:
-            # Send message
-            message = self.__Create_Message(
-                role="user",
-                content=message_content,
-                attachment_id=attachment_file_id
-            )
-
+        """
         # Attachment Path
-        elif attachment_path is not None:
+        if (attachment_file_id is None) and (attachment_path is not None):
             # Attach file to vector store
-            file_ID = self.vector_store.Attach_New_File(file_path=attachment_path)
-
-            # Send message
-            message = self.__Create_Message(
-                role="user",
-                content=message_content,
-                attachment_id=file_ID
-            )
+            attachment_file_id = await self.vector_store.Attach_New_File(file_path=attachment_path)
 
-        # No attachment
-        else:
-            # Send message
-            message = self.__Create_Message(
-                role="user",
-                content=message_content
-            )
-        
-        # Return message
-        return message
+        # Send message
+        return await self.__Create_Message(
+            role="user",
+            content=message_content,
+            attachment_id=attachment_file_id
+        )
     # Function End
 
-    def __Print_Loading_Message(self) -> None:
-        """
-        Prints a loading message to the console.
+    async def Get_Response(self, event_handler:type[AsyncAssistantEventHandler]|None=None, sink:Output_Sink|None=None) -> None:
+        """ 
+        Streams the assistant's response to the console (or to wherever the event_handler class defines).
 
         Parameters
-            None
+            event_handler (AsyncAssistantEventHandler): The async event handler class to use. | OPTIONAL
+            sink (Output_Sink): The destination of the streamed text, passed to the event handler | OPTIONAL | DEFAULT: Stdout_Sink()
 
         Returns
             None
         """
+        # Handle defaults
+        if event_handler is None:
+            event_handler = AsyncAssistant_Event_Handler
 
-        # Variable initialization
-        outString = f"{self.name} Generating Response"
-    
-        # Print loading message
-        print(outString, end="")
-        for __ in range(3):
-            for _ in range(3):
-                print(".", end="")
-                time.sleep(0.1)
-            # Loop End
-
-            print("\b"*3 + " "*3 + "\b"*3, end="")
+        # Run stream
+        handler = event_handler(client=self.client, sink=sink) if sink is not None else event_handler(client=self.client)
+        async for _ in self.__Iterate_Run_Events(handler):
+            pass
         # Loop End
+    # Function End
 
-        # Clear line
-        print("\b"*len(outString) + " "*len(outString) + "\b"*len(outString), end="")
+    async def __Iterate_Run_Events(self, handler:AsyncAssistantEventHandler) -> AsyncIterator[AssistantStreamEvent]:
+        """
+        Internal async generator that streams a run through an event handler and yields the events of the run. See Assistant.__Iterate_Run_Events.
+
+        Parameters
+            handler (AsyncAssistantEventHandler): The event handler of the run
+
+        Returns
+            events (AsyncIterator[AssistantStreamEvent]): The events of the run, including after tool outputs were submitted
+        """
+        # Variable initialization
+        stream_handler = handler
+        stream_manager = self.client.beta.threads.runs.stream(
+            thread_id=self.thread.id,
+            assistant_id=self.intance.id,
+            event_handler=handler,
+            **self.Get_Run_Parameters()
+        )
+
+        # Stream the run, then every tool output submission
+        try:
+            with Get_Metrics_Recorder().Span("assistant.get_response"):
+                while stream_manager is not None:
+                    async with stream_manager as stream:
+                        stream_manager = None
+                        async for event in stream:
+                            yield event
+                            if (event.event == "thread.run.requires_action") and (not getattr(handler, "handle_required_actions", True)) and (len(handler.tool_registry) > 0):
+                                tool_outputs = await stream_handler.Dispatch_Tool_Calls(event.data.required_action.submit_tool_outputs.tool_calls)
+                                stream_manager, next_handler = stream_handler.Open_Tool_Outputs_Stream(tool_outputs, event.data.id)
+                        # Loop End
+
+                    # The run ends in the handler of the last tool output submission
+                    if stream_handler is not handler:
+                        handler.completed_run = stream_handler.completed_run
+                    if stream_manager is not None:
+                        stream_handler = next_handler
+                # Loop End
+        finally:
+            # Report the run's usage
+            self.__Record_Usage(getattr(handler, "completed_run", None))
     # Function End
 
-    def Get_Response(self, event_handler:AssistantEventHandler|None=None) -> None:
-        """ 
-        Streams the assistant's response to the console (or to wherever the event_handler class defines).
+    async def Stream_Response(self, event_handler:type|None=None) -> AsyncIterator[Response_Event]:
+        """
+        Runs the assistant and returns an async generator of typed Response_Event objects instead of driving an event handler.
+        See Assistant.Stream_Response.
 
         Parameters
-            event_handler (AssistantEventHandler): The event handler class to use. | OPTIONAL
+            event_handler (type[AsyncAssistant_Event_Handler]): The async event handler class whose registered tools and filename cache are used | OPTIONAL | DEFAULT: AsyncAssistant_Event_Handler
 
         Returns
-            None
+            events (AsyncIterator[Response_Event]): The response events
         """
         # Handle defaults
         if event_handler is None:
-            event_handler = Assistant_Event_Handler
+            event_handler = AsyncAssistant_Event_Handler
 
-        # Run stream
-        with self.client.beta.threads.runs.stream(
-            thread_id=self.thread.id,
-            assistant_id=self.intance.id,
-            event_handler=event_handler(client=self.client)
-        ) as stream:
-            stream.until_done()
+        # Variable initialization
+        handler = event_handler(client=self.client, sink=Buffer_Sink())
+        handler.handle_required_actions = False
+
+        # Stream the run, then every tool output submission
+        async for event in self.__Iterate_Run_Events(handler):
+            for response_event in Response_Event.From_Stream_Event(event):
+                yield response_event
+
+            # Citations
+            if event.event == "thread.message.completed":
+                filenames = await handler.Resolve_Filenames(Response_Event.Get_Cited_File_IDs(event.data))
+                for response_event in Response_Event.From_Citations(event.data, filenames):
+                    yield response_event
+
+            # Tool calls
+            elif event.event == "thread.run.requires_action":
+                yield Response_Event("tool calls", event.data.required_action.submit_tool_outputs.tool_calls)
+        # Loop End
     # Function End
-    
+
+    def Get_Run_Parameters(self) -> dict:
+        """
+        Returns the token budgets and truncation strategy applied to every run. See Assistant.Get_Run_Parameters.
+        """
+        return Get_Run_Parameters(self.message_history_length, self.max_prompt_tokens, self.max_completion_tokens)
+    # Function End
+
+    def __Record_Usage(self, run:Run|None) -> None:
+        """
+        Internal method that stores the token usage of a finished run and adds it to the totals.
+        """
+        # Skip runs without usage
+        if (run is None) or (run.usage is None):
+            return None
+
+        # Update the usage
+        self.last_run_usage = {
+            "run id": run.id,
+            "status": run.status,
+            "prompt tokens": run.usage.prompt_tokens,
+            "completion tokens": run.usage.completion_tokens,
+            "total tokens": run.usage.total_tokens
+        }
+        self.token_usage["runs"] += 1
+        self.token_usage["prompt tokens"] += run.usage.prompt_tokens
+        self.token_usage["completion tokens"] += run.usage.completion_tokens
+        self.token_usage["total tokens"] += run.usage.total_tokens
+    # Function End
+
     def Get_Attributes(self) -> dict:
         """
         Gets the assistant's attributes.
@@ -716,17 +7203,18 @@ class Assistant:
             "name": self.name,
             "instructions": self.instructions,
             "tool_set": self.tool_set,
-            "user_defined_functions": self.user_defined_functions,
             "model": self.model,
             "model_parameters": self.model_parameters,
             "vector_store": self.vector_store.Get_Attributes(),
-            "thread id": self.thread.id
+            "thread id": self.thread.id,
+            "message history length": self.message_history_length,
+            "token usage": self.token_usage
         }
 
         return attributes
     # Function End
 
-    def Get_Vector_Store(self) -> Vector_Storage:
+    def Get_Vector_Store(self) -> AsyncVector_Storage:
         """
         Gets the assistant's vector store.
         
@@ -734,25 +7222,32 @@ class Assistant:
             None
             
         Returns
-            vector_store (Vector_Storage): The assistant's vector store
+            vector_store (AsyncVector_Storage): The assistant's vector store
         """
 
         # Return the vector store
         return self.vector_store 
     # Function End
-# Assistant Class End
+# Async Assistant Class End
 
 """
-Event Handler
+Async Event Handler
 """
 
-# Assistant Event Handler Class
-class Assistant_Event_Handler(AssistantEventHandler):
+# Async Assistant Event Handler Class
+class AsyncAssistant_Event_Handler(AsyncAssistantEventHandler):
     """
-    A class that handles streaming actions taken by the assistant.
+    The asyncio counterpart of the Assistant_Event_Handler class. Every callback is a coroutine.
 
     Properties
-        client (OpenAI)
+        client (AsyncOpenAI)
+        sink (Output_Sink): The destination of the streamed text, shared with the handlers created for tool output submissions
+        filename_cache (Filename_Cache): The file name cache shared by every handler instance
+        tool_registry (dict): The functions registered for each tool name, shared by every instance of the handler class
+        tool_output_cache (Tool_Output_Cache): The memoization cache of tool outputs shared by every handler instance
+        stream_timer (Stream_Timer): Records the timings of the stream
+        completed_run (Run|None): The run in its final state, including after tool outputs were submitted, once the stream has ended
+        handle_required_actions (bool): Whether requires_action events are passed to Handle_Required_Actions. Disabled by AsyncAssistant.Stream_Response, which submits the tool outputs itself
 
     Overridden Methods
         on_event(event: AssistantStreamEvent)
@@ -760,60 +7255,183 @@ class Assistant_Event_Handler(AssistantEventHandler):
         on_text_delta(delta: TextDelta, snapshot: Text)
         on_text_done(text: Text)
         on_message_done(message: Message)
+        on_end()
 
     Methods
-        Handle_Required_Actions(data: Run, run_id: str) -> None
-        Submit_Tool_Outputs(tool_outputs: list[dict], run_id: str) -> None
+        Get_Response_Text() -> str
+        Register_Tool(name: str, function: Callable, timeout: float|None=None, cache_ttl: float|None=None) -> None [class]
+        Handle_Required_Actions(data: Run, run_id: str) -> None [awaitable]
+        Dispatch_Tool_Calls(tool_calls: list[ToolCall]) -> list[dict] [awaitable]
+        Submit_Tool_Outputs(tool_outputs: list[dict], run_id: str) -> None [awaitable]
+        Open_Tool_Outputs_Stream(tool_outputs: list[dict], run_id: str) -> tuple[AsyncAssistantStreamManager, AsyncAssistant_Event_Handler]
+        Resolve_Filenames(file_ids: list[str]) -> dict[str, str] [awaitable]
     """
+
+    filename_cache:Filename_Cache = Assistant_Event_Handler.filename_cache
+    """The file name cache shared by every handler instance, including the synchronous handlers."""
+    tool_registry:dict = {}
+    """The functions registered for each tool name, shared by every instance of the handler class."""
+    tool_output_cache:Tool_Output_Cache = Assistant_Event_Handler.tool_output_cache
+    """The memoization cache of tool outputs shared by every handler instance, including the synchronous handlers."""
     
     @override
-    def __init__(self, client:OpenAI) -> None:
+    def __init__(self, client:AsyncOpenAI, sink:Output_Sink|None=None) -> None:
         super().__init__()
         self.client = client
+        self.sink = sink if sink is not None else Stdout_Sink()
+        self.stream_timer = Stream_Timer()
+        self.completed_run = None
+        self.handle_required_actions = True
     # Function End    
 
     # \/ \/ Event Handlers \/ \/
     @override
-    def on_event(self, event:AssistantStreamEvent) -> None:
+    async def on_event(self, event:AssistantStreamEvent) -> None:
+        # Record the stream timings
+        self.stream_timer.Record(event)
+
+        # Keep the run in its final state
+        if event.event in TERMINAL_RUN_EVENTS:
+            self.completed_run = event.data
+
         # Identify user function calls
-        if event.event == 'thread.run.requires_action':
+        if (event.event == 'thread.run.requires_action') and self.handle_required_actions:
             run_id = event.data.id
-            self.Handle_Required_Actions(event.data, run_id)
+            await self.Handle_Required_Actions(event.data, run_id)
     # Function End
 
     # \/ \/ Text Generation \/ \/
     @override
-    def on_text_created(self, text: Text) -> None:
-        print(f"\n", end="", flush=True)
+    async def on_text_created(self, text: Text) -> None:
+        self.sink.Write("\n")
     # Function End    
 
     @override
-    def on_text_delta(self, delta: TextDelta, snapshot: Text) -> None:
-        print(delta.value, end="", flush=True)
+    async def on_text_delta(self, delta: TextDelta, snapshot: Text) -> None:
+        self.sink.Write(delta.value)
     # Function End    
 
     @override   
-    def on_text_done(self, text: Text) -> None:
-        print("", end="\n", flush=True)
+    async def on_text_done(self, text: Text) -> None:
+        self.sink.Write("\n")
+        self.sink.Flush()
     # Function End    
 
+    @override
+    async def on_end(self) -> None:
+        self.sink.Flush()
+    # Function End
+
+    def Get_Response_Text(self) -> str:
+        """
+        Returns all the text written to the handler's sink, including the responses streamed after tool outputs were submitted.
+        """
+        return self.sink.Get_Text()
+    # Function End
+
     # \/ \/ Tool Handling \/ \/
-    def Handle_Required_Actions(self, data: Run, run_id: str) -> None:
+    @classmethod
+    def Register_Tool(cls, name: str, function: Callable, timeout: float|None=None, cache_ttl: float|None=None) -> None:
         """
-        Left Empty for users to override with their custom actions.
+        Registers a Python function to be called when the assistant calls the function tool with the given name.
+        See Assistant_Event_Handler.Register_Tool.
         """
-        return None
+
+        # Handle defaults
+        if timeout is None:
+            timeout = DEFAULT_TOOL_TIMEOUT
+
+        # Give the class its own registry
+        if "tool_registry" not in cls.__dict__:
+            cls.tool_registry = dict(cls.tool_registry)
+
+        # Register the function
+        cls.tool_registry[name] = {
+            "function": function,
+            "timeout": timeout,
+            "cache ttl": cache_ttl
+        }
     # Function End
 
-    @override
-    def on_tool_call_created(self, tool_call: ToolCall) -> None:
-        super().on_tool_call_created(tool_call)
+    async def Handle_Required_Actions(self, data: Run, run_id: str) -> None:
+        """
+        Runs the registered functions for every tool call of the run concurrently and submits their outputs together.
+        Does nothing if no functions are registered, override this method to handle tool calls yourself.
+        """
 
-    @override
-    def on_tool_call_delta(self, delta: ToolCallDelta, snapshot: ToolCall) -> None:
-        super().on_tool_call_delta(delta, snapshot)
-    
-    def Submit_Tool_Outputs(self, tool_outputs: list[dict], run_id: str) -> None:
+        # Skip if no functions are registered
+        if len(self.tool_registry) == 0:
+            return None
+
+        # Call the functions and submit their outputs
+        tool_outputs = await self.Dispatch_Tool_Calls(data.required_action.submit_tool_outputs.tool_calls)
+        await self.Submit_Tool_Outputs(tool_outputs=tool_outputs, run_id=run_id)
+    # Function End
+
+    async def Dispatch_Tool_Calls(self, tool_calls: list[ToolCall]) -> list[dict]:
+        """
+        Calls the registered function of every tool call concurrently on the event loop. Regular functions are run in worker threads.
+        Unregistered tools, errors and timeouts are reported to the assistant as an error output.
+
+        Parameters
+            tool_calls (list[ToolCall]): The tool calls of a requires_action event
+
+        Returns
+            tool_outputs (list[dict]): A list of tool output dictionaries, in the same order as the tool calls
+        """
+
+        # Call the functions concurrently
+        outputs = await asyncio.gather(*[
+            self.__Call_Tool(tool_call) for tool_call in tool_calls
+        ])
+
+        # Return the outputs
+        return [
+            {"tool_call_id": tool_call.id, "output": output}
+            for tool_call, output in zip(tool_calls, outputs)
+        ]
+    # Function End
+
+    async def __Call_Tool(self, tool_call: ToolCall) -> str:
+        """
+        Internal method that calls the registered function of a tool call and formats its output.
+        """
+
+        # Find the registered function
+        registration = self.tool_registry.get(tool_call.function.name)
+        if registration is None:
+            return json.dumps({"error": f"No function is registered for {tool_call.function.name}."})
+
+        # Answer from the memoization cache
+        if registration.get("cache ttl") is not None:
+            cached_output = self.tool_output_cache.Get(tool_call.function.name, tool_call.function.arguments)
+            if cached_output is not None:
+                return cached_output
+
+        try:
+            # Call the function
+            arguments = json.loads(tool_call.function.arguments or "{}")
+            if inspect.iscoroutinefunction(registration["function"]):
+                call = registration["function"](**arguments)
+            else:
+                call = asyncio.to_thread(registration["function"], **arguments)
+            with Get_Metrics_Recorder().Span("tool.call", {"tool": tool_call.function.name}):
+                result = await asyncio.wait_for(call, timeout=registration["timeout"])
+            output = Assistant_Event_Handler.Format_Tool_Output(result)
+
+            # Memoize the output
+            if registration.get("cache ttl") is not None:
+                self.tool_output_cache.Set(tool_call.function.name, tool_call.function.arguments, output, registration["cache ttl"])
+
+            # Return the output
+            return output
+        except asyncio.TimeoutError:
+            return json.dumps({"error": f"{tool_call.function.name} timed out after {registration['timeout']} seconds."})
+        except Exception as e:
+            return json.dumps({"error": f"{type(e).__name__}: {e}"})
+    # Function End
+
+    async def Submit_Tool_Outputs(self, tool_outputs: list[dict], run_id: str) -> None:
         """
         [DO NOT OVERRIDE]
 
@@ -828,31 +7446,93 @@ class Assistant_Event_Handler(AssistantEventHandler):
             None
         """
 
-        with self.client.beta.threads.runs.submit_tool_outputs_stream(
+        # Continue the run in a new handler
+        stream_manager, event_handler = self.Open_Tool_Outputs_Stream(tool_outputs, run_id)
+        async with stream_manager as stream:
+            await stream.until_done()
+
+        # The run ends in the new handler
+        self.completed_run = event_handler.completed_run
+    # Function End
+
+    def Open_Tool_Outputs_Stream(self, tool_outputs: list[dict], run_id: str) -> tuple:
+        """
+        [DO NOT OVERRIDE]
+
+        Creates the stream that submits tool outputs and continues the run in a new handler of the same class. See Assistant_Event_Handler.Open_Tool_Outputs_Stream.
+
+        Parameters
+            tool_outputs (list[dict]): A list of tool output dictionaries
+            run_id (str): The ID of the run to submit the tool outputs to
+
+        Returns
+            (tuple[AsyncAssistantStreamManager, AsyncAssistant_Event_Handler]): The stream manager and the handler of the continued run
+        """
+
+        # Continue the run in a new handler, timed from the requires_action event
+        event_handler = self.__class__(client=self.client, sink=self.sink)
+        event_handler.stream_timer = Stream_Timer("tool outputs", self.stream_timer.required_action_at)
+        event_handler.handle_required_actions = self.handle_required_actions
+
+        # Return the stream manager and the new handler
+        return self.client.beta.threads.runs.submit_tool_outputs_stream(
             thread_id=self.current_run.thread_id,
             run_id=self.current_run.id,
             tool_outputs=tool_outputs,
-            event_handler=self.__class__(client=self.client)
-        ) as stream:
-            stream.until_done()
+            event_handler=event_handler
+        ), event_handler
     # Function End
 
     # \/ \/ Message Handling \/ \/
     @override
-    def on_message_done(self, message: Message) -> None:
+    async def on_message_done(self, message: Message) -> None:
         # print a citation to any files searched
         message_content = message.content[0].text
-        annotations = message_content.annotations
-        citations = []
-        for index, annotation in enumerate(annotations):
-            message_content.value = message_content.value.replace(
-                annotation.text, f"[{index}]"
-            )
-            if file_citation := getattr(annotation, "file_citation", None):
-                cited_file = self.client.files.retrieve(file_citation.file_id)
-                citations.append(f"[{index}] {cited_file.filename}")
+        filenames = await self.Resolve_Filenames([
+            annotation.file_citation.file_id
+            for annotation in message_content.annotations
+            if getattr(annotation, "file_citation", None)
+        ])
+        message_content.value, citations = Assistant_Event_Handler.Format_Citations(message_content, filenames)
 
         if (len(citations) > 0):
-            print(f"{''.join(citations)}", end="\n", flush=True)
+            self.sink.Write(f"{''.join(citations)}\n")
+            self.sink.Flush()
     # Function End    
-# Event Handler Class End
\ No newline at end of file
+
+    async def Resolve_Filenames(self, file_ids: list[str]) -> dict[str, str]:
+        """
+        Returns the file names of the given file IDs. Names are read from the shared filename cache,
+        and any IDs that are not cached are retrieved concurrently and added to the cache.
+
+        Parameters
+            file_ids (list[str]): The IDs of the cited files
+
+        Returns
+            filenames (dict[str, str]): A dictionary mapping file IDs to file names
+        """
+
+        # Read the cached file names
+        filenames = self.filename_cache.Get(file_ids)
+        uncached_ids = [file_id for file_id in dict.fromkeys(file_ids) if file_id not in filenames]
+
+        # Retrieve a single file, bounded by the semaphore
+        semaphore = asyncio.Semaphore(DEFAULT_CITATION_WORKERS)
+        async def Retrieve(file_id:str) -> FileObject:
+            async with semaphore:
+                return await self.client.files.retrieve(file_id)
+        # Function End
+
+        # Retrieve the uncached file names concurrently
+        retrieved_files = await asyncio.gather(*[
+            Retrieve(file_id) for file_id in uncached_ids
+        ])
+        for file_id, retrieved_file in zip(uncached_ids, retrieved_files):
+            self.filename_cache.Set(file_id, retrieved_file.filename)
+            filenames[file_id] = retrieved_file.filename
+        # Loop End
+
+        # Return the file names
+        return filenames
+    # Function End
+# Async Event Handler Class End
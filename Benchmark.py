@@ -0,0 +1,583 @@
+# Imports
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+import openai
+from openai import OpenAI
+from openai.types.beta.threads import Message
+
+import Assistant
+
+"""
+Fake Assistants API
+"""
+
+# Fake Assistants API Constants
+DEFAULT_LATENCY = 0.0 # Seconds added to every request
+DEFAULT_TOKEN_RATE = 0.0 # Tokens per second emitted by streamed runs, 0 streams as fast as possible
+DEFAULT_RESPONSE_TOKENS = 100
+
+# Fake Assistants API Class
+class Fake_Assistants_API:
+    """
+    Fake Assistants API Class
+
+    A local stand-in for the Assistants, Files and Vector Store endpoints, used as an httpx transport handler.
+    Every request is delayed by the configured latency and streamed runs emit their tokens at the configured rate.
+    Only the fields this library reads are returned.
+
+    Properties:
+        latency (float): The seconds added to every request.
+        token_rate (float): The tokens per second emitted by streamed runs, 0 streams as fast as possible.
+        response_tokens (int): The number of text deltas emitted by every streamed run.
+        request_count (int): The number of requests handled.
+
+    Methods:
+        Create_Client() -> OpenAI
+    """
+
+    def __init__(self, latency:float|None=None, token_rate:float|None=None, response_tokens:int|None=None):
+        """
+        Constructor for the Fake_Assistants_API class.
+
+        Parameters:
+            latency (float): The seconds added to every request.
+                Defaults to 0.
+            token_rate (float): The tokens per second emitted by streamed runs, 0 streams as fast as possible.
+                Defaults to 0.
+            response_tokens (int): The number of text deltas emitted by every streamed run.
+                Defaults to 100.
+        """
+
+        # Handle Defaults
+        if latency is None:
+            latency = DEFAULT_LATENCY
+        if token_rate is None:
+            token_rate = DEFAULT_TOKEN_RATE
+        if response_tokens is None:
+            response_tokens = DEFAULT_RESPONSE_TOKENS
+
+        # Set properties
+        self.latency = latency
+        self.token_rate = token_rate
+        self.response_tokens = response_tokens
+        self.request_count = 0
+        self.__ids = itertools.count()
+        self.__lock = threading.Lock()
+        self.__vector_store_files = {}
+        self.__file_batches = {}
+    # End of Constructor
+
+    def Create_Client(self) -> OpenAI:
+        """
+        Returns an OpenAI client whose requests are handled by this fake API.
+        """
+        return OpenAI(
+            api_key="benchmark",
+            max_retries=0,
+            http_client=httpx.Client(transport=httpx.MockTransport(self))
+        )
+    # End of Create_Client
+
+    def __New_ID(self, prefix:str) -> str:
+        """
+        Internal method that returns a new object ID with the given prefix.
+        """
+        with self.__lock:
+            return f"{prefix}_{next(self.__ids)}"
+    # End of __New_ID
+
+    def __call__(self, request:httpx.Request) -> httpx.Response:
+        """
+        Handles a request.
+        """
+
+        # Simulate the network latency
+        with self.__lock:
+            self.request_count += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        # Variable initialization
+        method = request.method
+        path = request.url.path.removeprefix("/v1/").strip("/").split("/")
+        body = {}
+        if request.headers.get("content-type", "").startswith("application/json") and request.content:
+            body = json.loads(request.content)
+
+        # Route the request
+        if path[0] == "files":
+            return self.__Files(method, path, body)
+        if path[0] == "vector_stores":
+            return self.__Vector_Stores(method, path, body, request.url.params)
+        if path[0] == "assistants":
+            return self.__Assistants(method, path, body)
+        if path[0] == "threads":
+            return self.__Threads(method, path, body)
+        return httpx.Response(404, json={"error": {"message": f"Unknown endpoint {method} {request.url.path}"}})
+    # End of __call__
+
+    def __Files(self, method:str, path:list[str], body:dict) -> httpx.Response:
+        """
+        Internal method that handles the Files endpoints.
+        """
+        file_id = path[1] if len(path) > 1 else f"file-{next(self.__ids)}"
+        if method == "DELETE":
+            return httpx.Response(200, json={"id": file_id, "object": "file", "deleted": True})
+        return httpx.Response(200, json={
+            "id": file_id, "object": "file", "bytes": 0, "created_at": 0,
+            "filename": f"{file_id}.txt", "purpose": "assistants", "status": "processed"
+        })
+    # End of __Files
+
+    def __Vector_Stores(self, method:str, path:list[str], body:dict, query:httpx.QueryParams) -> httpx.Response:
+        """
+        Internal method that handles the Vector Store endpoints.
+        """
+
+        # Vector stores
+        if len(path) <= 2:
+            vector_store_id = path[1] if len(path) == 2 else self.__New_ID("vs")
+            if method == "DELETE":
+                return httpx.Response(200, json={"id": vector_store_id, "object": "vector_store.deleted", "deleted": True})
+            file_count = len(self.__vector_store_files.setdefault(vector_store_id, []))
+            return httpx.Response(200, json={
+                "id": vector_store_id, "object": "vector_store", "name": body.get("name"), "status": "completed",
+                "created_at": 0, "usage_bytes": 0, "last_active_at": 0, "metadata": None,
+                "expires_after": {"anchor": "last_active_at", "days": 1},
+                "file_counts": {"in_progress": 0, "completed": file_count, "failed": 0, "cancelled": 0, "total": file_count}
+            })
+
+        # Variable initialization
+        vector_store_id = path[1]
+        files = self.__vector_store_files.setdefault(vector_store_id, [])
+        if path[2] == "file_batches" and len(path) > 3:
+            files = self.__file_batches.get(path[3], [])
+
+        # File listings, paginated by the "after" cursor
+        if path[-1] == "files" and method == "GET":
+            after = query.get("after")
+            limit = int(query.get("limit", 20))
+            start = files.index(after) + 1 if after in files else 0
+            page = files[start:start + limit]
+            return httpx.Response(200, json={
+                "object": "list", "first_id": page[0] if page else None, "last_id": page[-1] if page else None,
+                "has_more": start + limit < len(files),
+                "data": [self.__Vector_Store_File(vector_store_id, file_id) for file_id in page]
+            })
+
+        # Single files
+        if path[2] == "files":
+            file_id = path[3] if len(path) > 3 else body["file_id"]
+            if method == "DELETE":
+                return httpx.Response(200, json={"id": file_id, "object": "vector_store.file.deleted", "deleted": True})
+            if method == "POST":
+                files.append(file_id)
+            return httpx.Response(200, json=self.__Vector_Store_File(vector_store_id, file_id))
+
+        # File batches
+        file_batch_id = path[3] if len(path) > 3 else self.__New_ID("vsfb")
+        if method == "POST" and len(path) == 3:
+            self.__file_batches[file_batch_id] = body.get("file_ids", [])
+            files.extend(self.__file_batches[file_batch_id])
+        file_ids = self.__file_batches.get(file_batch_id, [])
+        return httpx.Response(200, json={
+            "id": file_batch_id, "object": "vector_store.files_batch",
+            "created_at": 0, "vector_store_id": vector_store_id, "status": "completed",
+            "file_counts": {"in_progress": 0, "completed": len(file_ids), "failed": 0, "cancelled": 0, "total": len(file_ids)}
+        })
+    # End of __Vector_Stores
+
+    def __Vector_Store_File(self, vector_store_id:str, file_id:str) -> dict:
+        """
+        Internal method that returns a completed vector store file object.
+        """
+        return {
+            "id": file_id, "object": "vector_store.file", "created_at": 0, "vector_store_id": vector_store_id,
+            "status": "completed", "usage_bytes": 0, "last_error": None
+        }
+    # End of __Vector_Store_File
+
+    def __Assistants(self, method:str, path:list[str], body:dict) -> httpx.Response:
+        """
+        Internal method that handles the Assistants endpoints.
+        """
+        assistant_id = path[1] if len(path) > 1 else self.__New_ID("asst")
+        if method == "DELETE":
+            return httpx.Response(200, json={"id": assistant_id, "object": "assistant.deleted", "deleted": True})
+        return httpx.Response(200, json={
+            "id": assistant_id, "object": "assistant", "created_at": 0, "model": body.get("model", "gpt-3.5-turbo-0125"),
+            "name": body.get("name"), "description": None, "instructions": body.get("instructions"),
+            "tools": body.get("tools", []), "metadata": None
+        })
+    # End of __Assistants
+
+    def __Threads(self, method:str, path:list[str], body:dict) -> httpx.Response:
+        """
+        Internal method that handles the Threads, Messages and Runs endpoints.
+        """
+
+        # Threads
+        thread_id = path[1] if len(path) > 1 else self.__New_ID("thread")
+        if len(path) <= 2:
+            if method == "DELETE":
+                return httpx.Response(200, json={"id": thread_id, "object": "thread.deleted", "deleted": True})
+            return httpx.Response(200, json={"id": thread_id, "object": "thread", "created_at": 0, "metadata": None, "tool_resources": None})
+
+        # Messages
+        if path[2] == "messages":
+            return httpx.Response(200, json=self.__Message(self.__New_ID("msg"), thread_id, "user", body.get("content", "")))
+
+        # Streamed runs
+        if body.get("stream"):
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=self.__Stream_Run(thread_id))
+
+        # Runs
+        return httpx.Response(200, json=self.__Run(path[3] if len(path) > 3 else self.__New_ID("run"), thread_id, "completed"))
+    # End of __Threads
+
+    def __Message(self, message_id:str, thread_id:str, role:str, value:str) -> dict:
+        """
+        Internal method that returns a completed message object.
+        """
+        return {
+            "id": message_id, "object": "thread.message", "created_at": 0, "thread_id": thread_id, "role": role,
+            "content": [{"type": "text", "text": {"value": value, "annotations": []}}],
+            "attachments": None, "metadata": None, "status": "completed", "assistant_id": None, "run_id": None,
+            "completed_at": None, "incomplete_at": None, "incomplete_details": None
+        }
+    # End of __Message
+
+    def __Run(self, run_id:str, thread_id:str, status:str) -> dict:
+        """
+        Internal method that returns a run object.
+        """
+        return {
+            "id": run_id, "object": "thread.run", "created_at": 0, "thread_id": thread_id, "assistant_id": "asst_0",
+            "status": status, "required_action": None, "last_error": None, "expires_at": None, "started_at": None,
+            "cancelled_at": None, "failed_at": None, "completed_at": None, "incomplete_details": None,
+            "model": "gpt-3.5-turbo-0125", "instructions": "", "tools": [], "metadata": None,
+            "usage": {"prompt_tokens": 10, "completion_tokens": self.response_tokens, "total_tokens": 10 + self.response_tokens},
+            "truncation_strategy": {"type": "auto", "last_messages": None}, "max_prompt_tokens": None, "max_completion_tokens": None,
+            "tool_choice": "auto", "parallel_tool_calls": True, "response_format": "auto", "temperature": 1.0, "top_p": 1.0
+        }
+    # End of __Run
+
+    def __Stream_Run(self, thread_id:str):
+        """
+        Internal generator that emits the server sent events of a streamed run, one text delta per token.
+        """
+
+        # Variable initialization
+        run_id = self.__New_ID("run")
+        message_id = self.__New_ID("msg")
+        message = self.__Message(message_id, thread_id, "assistant", "")
+        message["content"] = []
+        message["status"] = "in_progress"
+        delay = 1 / self.token_rate if self.token_rate > 0 else 0
+
+        # Event formatting
+        def Event(name:str, data:dict) -> bytes:
+            return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+        # Function End
+
+        # Emit the run
+        yield Event("thread.run.created", self.__Run(run_id, thread_id, "queued"))
+        yield Event("thread.message.created", message)
+        for index in range(self.response_tokens):
+            if delay > 0:
+                time.sleep(delay)
+            yield Event("thread.message.delta", {
+                "id": message_id, "object": "thread.message.delta",
+                "delta": {"content": [{"index": 0, "type": "text", "text": {"value": f"token{index} ", "annotations": []}}]}
+            })
+        # Loop End
+        yield Event("thread.message.completed", self.__Message(message_id, thread_id, "assistant", "token " * self.response_tokens))
+        yield Event("thread.run.completed", self.__Run(run_id, thread_id, "completed"))
+        yield b"event: done\ndata: [DONE]\n\n"
+    # End of __Stream_Run
+# End of Fake_Assistants_API Class
+
+"""
+Benchmarks
+"""
+
+# Benchmark Constants
+DEFAULT_RUNS = 20
+DEFAULT_FILE_COUNTS = [1, 10, 50]
+DEFAULT_FILE_SIZES = [1024, 1024 * 1024] # Bytes
+DEFAULT_TOKEN_COUNTS = [100, 1000]
+DEFAULT_CITATION_COUNTS = [1, 10, 100]
+
+def Summarize(samples:list[float]) -> dict:
+    """
+    Summarizes a list of durations in seconds.
+
+    Parameters:
+        samples (list[float]): The durations, in seconds.
+
+    Returns:
+        summary (dict): The run count and the mean, median, 95th percentile, minimum and maximum in milliseconds.
+    """
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "mean ms": statistics.fmean(ordered) * 1000,
+        "median ms": statistics.median(ordered) * 1000,
+        "p95 ms": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))] * 1000,
+        "min ms": ordered[0] * 1000,
+        "max ms": ordered[-1] * 1000
+    }
+# Function End
+
+def Time_Call(function, runs:int) -> list[float]:
+    """
+    Calls a function the given number of times and returns the duration of every call in seconds.
+    """
+    samples = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started_at)
+    # Loop End
+    return samples
+# Function End
+
+def Benchmark_Constructor(api:Fake_Assistants_API, runs:int) -> dict:
+    """
+    Measures the latency of the Assistant constructor, in the default and the lazy construction modes.
+    """
+
+    # Variable initialization
+    client = api.Create_Client()
+    results = {}
+
+    # Time both construction modes
+    for lazy in [False, True]:
+        request_count = api.request_count
+        samples = Time_Call(lambda: Assistant.Assistant(client=client, lazy=lazy), runs)
+        results["lazy" if lazy else "default"] = Summarize(samples) | {"requests per run": (api.request_count - request_count) / runs}
+    # Loop End
+
+    # Return the results
+    return results
+# Function End
+
+def Benchmark_Attach_Files(api:Fake_Assistants_API, runs:int, file_counts:list[int], file_sizes:list[int]) -> dict:
+    """
+    Measures the throughput of Attach_Files by file count and file size. The upload cache is disabled so every file is uploaded.
+    """
+
+    # Variable initialization
+    assistant = Assistant.Assistant(client=api.Create_Client())
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for file_size, file_count in itertools.product(file_sizes, file_counts):
+            # Write the files
+            file_paths = []
+            for index in range(file_count):
+                file_path = os.path.join(directory, f"{file_size}_{index}.txt")
+                with open(file_path, "wb") as file:
+                    file.write(os.urandom(file_size // 2).hex().encode())
+                file_paths.append(file_path)
+            # Loop End
+
+            # Time the attachments
+            samples = Time_Call(lambda: assistant.Attach_Files(file_paths), runs)
+            median = statistics.median(samples)
+            results[f"{file_count} files of {file_size} bytes"] = Summarize(samples) | {
+                "files per second": file_count / median if median > 0 else None,
+                "megabytes per second": file_count * file_size / median / 1e6 if median > 0 else None
+            }
+        # Loop End
+
+    # Return the results
+    return results
+# Function End
+
+def Benchmark_Streaming(api:Fake_Assistants_API, runs:int, token_counts:list[int]) -> dict:
+    """
+    Measures the time Get_Response spends per streamed token, with the response written to a Buffer_Sink.
+    Tokens are emitted as fast as possible while measuring, so the result is the library's own overhead.
+    """
+
+    # Variable initialization
+    assistant = Assistant.Assistant(client=api.Create_Client())
+    response_tokens, token_rate = api.response_tokens, api.token_rate
+    results = {}
+
+    try:
+        api.token_rate = 0
+        for token_count in token_counts:
+            # Time the responses
+            api.response_tokens = token_count
+            sink = Assistant.Buffer_Sink()
+            samples = Time_Call(lambda: assistant.Get_Response(sink=sink), runs)
+            results[f"{token_count} tokens"] = Summarize(samples) | {
+                "microseconds per token": statistics.median(samples) / token_count * 1e6
+            }
+        # Loop End
+    finally:
+        api.response_tokens, api.token_rate = response_tokens, token_rate
+
+    # Return the results
+    return results
+# Function End
+
+def Benchmark_Citations(api:Fake_Assistants_API, runs:int, citation_counts:list[int]) -> dict:
+    """
+    Measures the cost of resolving and formatting the file citations of a completed message,
+    with a cold filename cache (one file retrieval per cited file) and a warm one.
+    """
+
+    # Variable initialization
+    handler = Assistant.Assistant_Event_Handler(client=api.Create_Client(), sink=Assistant.Buffer_Sink())
+    results = {}
+
+    for citation_count in citation_counts:
+        # Build a message citing a different file in every sentence
+        value = ""
+        annotations = []
+        for index in range(citation_count):
+            value += f"Sentence {index}."
+            marker = f"【{index}:0†source】"
+            annotations.append({
+                "type": "file_citation", "text": marker, "start_index": len(value), "end_index": len(value) + len(marker),
+                "file_citation": {"file_id": f"file-{index}", "quote": ""}
+            })
+            value += marker + " "
+        # Loop End
+        message = {
+            "id": "msg_0", "object": "thread.message", "created_at": 0, "thread_id": "thread_0", "role": "assistant",
+            "content": [{"type": "text", "text": {"value": value, "annotations": annotations}}],
+            "attachments": None, "metadata": None, "status": "completed", "assistant_id": None, "run_id": None,
+            "completed_at": None, "incomplete_at": None, "incomplete_details": None
+        }
+
+        # Time the citation handling, the message is rebuilt since it is formatted in place
+        cold_samples = []
+        warm_samples = []
+        for _ in range(runs):
+            Assistant.Assistant_Event_Handler.filename_cache.Clear()
+            for samples in [cold_samples, warm_samples]:
+                completed_message = Message.model_validate(message)
+                started_at = time.perf_counter()
+                handler.on_message_done(completed_message)
+                samples.append(time.perf_counter() - started_at)
+            # Loop End
+        # Loop End
+        results[f"{citation_count} citations"] = {"cold cache": Summarize(cold_samples), "warm cache": Summarize(warm_samples)}
+    # Loop End
+
+    # Return the results
+    return results
+# Function End
+
+def Run_Benchmarks(
+        latency:float|None=None, token_rate:float|None=None, runs:int|None=None,
+        file_counts:list[int]|None=None, file_sizes:list[int]|None=None,
+        token_counts:list[int]|None=None, citation_counts:list[int]|None=None
+    ) -> dict:
+    """
+    Runs every benchmark against a fresh fake API.
+
+    Parameters:
+        latency (float): The seconds added to every request. Defaults to 0.
+        token_rate (float): The tokens per second emitted by streamed runs outside of the streaming benchmark. Defaults to 0.
+        runs (int): The number of runs of every measurement. Defaults to 20.
+        file_counts (list[int]): The file counts of the Attach_Files benchmark. Defaults to [1, 10, 50].
+        file_sizes (list[int]): The file sizes of the Attach_Files benchmark, in bytes. Defaults to [1024, 1048576].
+        token_counts (list[int]): The response lengths of the streaming benchmark, in tokens. Defaults to [100, 1000].
+        citation_counts (list[int]): The citation counts of the citation benchmark. Defaults to [1, 10, 100].
+
+    Returns:
+        report (dict): The environment, the parameters and the results of every benchmark.
+    """
+
+    # Handle Defaults
+    if runs is None:
+        runs = DEFAULT_RUNS
+    if file_counts is None:
+        file_counts = DEFAULT_FILE_COUNTS
+    if file_sizes is None:
+        file_sizes = DEFAULT_FILE_SIZES
+    if token_counts is None:
+        token_counts = DEFAULT_TOKEN_COUNTS
+    if citation_counts is None:
+        citation_counts = DEFAULT_CITATION_COUNTS
+
+    # Variable initialization
+    api = Fake_Assistants_API(latency=latency, token_rate=token_rate)
+
+    # Run the benchmarks
+    return {
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "openai": openai.__version__
+        },
+        "parameters": {
+            "latency": api.latency,
+            "token rate": api.token_rate,
+            "runs": runs,
+            "file counts": file_counts,
+            "file sizes": file_sizes,
+            "token counts": token_counts,
+            "citation counts": citation_counts
+        },
+        "results": {
+            "constructor": Benchmark_Constructor(api, runs),
+            "attach files": Benchmark_Attach_Files(api, runs, file_counts, file_sizes),
+            "streaming": Benchmark_Streaming(api, runs, token_counts),
+            "citations": Benchmark_Citations(api, runs, citation_counts)
+        }
+    }
+# Function End
+
+# Create the main function
+def Main():
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Benchmarks the Assistant module against a local fake of the Assistants API.")
+    parser.add_argument("--latency", type=float, default=None, help="Seconds added to every request (default: 0)")
+    parser.add_argument("--token-rate", type=float, default=None, help="Tokens per second emitted by streamed runs (default: unlimited)")
+    parser.add_argument("--runs", type=int, default=None, help=f"Runs of every measurement (default: {DEFAULT_RUNS})")
+    parser.add_argument("--file-counts", type=int, nargs="+", default=None, help="File counts of the Attach_Files benchmark")
+    parser.add_argument("--file-sizes", type=int, nargs="+", default=None, help="File sizes of the Attach_Files benchmark, in bytes")
+    parser.add_argument("--token-counts", type=int, nargs="+", default=None, help="Response lengths of the streaming benchmark, in tokens")
+    parser.add_argument("--citation-counts", type=int, nargs="+", default=None, help="Citation counts of the citation benchmark")
+    parser.add_argument("--output", default=None, help="Path of the JSON report (default: standard output)")
+    arguments = parser.parse_args()
+
+    # Run the benchmarks
+    report = Run_Benchmarks(
+        latency=arguments.latency,
+        token_rate=arguments.token_rate,
+        runs=arguments.runs,
+        file_counts=arguments.file_counts,
+        file_sizes=arguments.file_sizes,
+        token_counts=arguments.token_counts,
+        citation_counts=arguments.citation_counts
+    )
+
+    # Write the report
+    if arguments.output is None:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+    else:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+# Function End
+
+if __name__ == "__main__":
+    Main()
@@ -1,6 +1,5 @@
 # Import the Assistant Class and relevant libraries
 import Assistant # or you can use: from Assistant import Assistant
-import json
 
 from openai import OpenAI
 from typing_extensions import override
@@ -74,32 +73,22 @@ def Main():
     class Custom_Event_Handler(Assistant.Assistant_Event_Handler):
         @override
         def on_text_created(self, text: Assistant.Text) -> None:
-            print(f"\n{asssistant.name}: ", end="", flush=True)
+            self.sink.Write(f"\n{asssistant.name}: ")
 
-        @override
-        def Handle_Required_Actions(self, data: Assistant.Run, run_id: str) -> None:
-            """
-            Use the following function to add your own custom actions.
-            Review the "user defined functions" section of the README for more information.
-            """
-
-            toolOutputs = []
-
-            for tool in data.required_action.submit_tool_outputs.tool_calls:
-                if tool.function.name == "Get_Current_Temperature":
-                    argumentDictionary = json.loads(tool.function.arguments)
-
-                    toolOutputs.append({
-                        "tool_call_id": tool.id, "output": Get_Current_Temperature(
-                            notation=argumentDictionary["notation"]
-                        )
-                    })
-            # Loop End
-
-            self.Submit_Tool_Outputs(tool_outputs=toolOutputs, run_id=run_id)
-        # Function End
     # Class End
 
+    # Register your user defined functions with the event handler. Review the "user defined functions" section of the README for more information.
+    Custom_Event_Handler.Register_Tool(
+        # Pass in the function's name as declared in the tool set || REQUIRED
+        name="Get_Current_Temperature",
+
+        # Pass in the function to call with the tool call's arguments || REQUIRED
+        function=Get_Current_Temperature,
+
+        # Pass in the number of seconds to wait for the function. If left empty, 30 seconds will be used || OPTIONAL
+        timeout=None
+    )
+
     # Conversate with the assistant
     while True:
         # Take in user input